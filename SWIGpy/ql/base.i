@@ -26,6 +26,7 @@
 using QuantLib::Observable;
 using QuantLib::Observer;
 using QuantLib::LazyObject;
+using QuantLib::ObservableSettings;
 %}
 %{
 using QuantLib::Extrapolator;
@@ -81,6 +82,41 @@ class Observer {
     void deepUpdate();
 };
 
+class ObservableSettings {
+  private:
+    ObservableSettings();
+  public:
+    static ObservableSettings& instance();
+    void disableUpdates(bool deferred = false);
+    void enableUpdates();
+    bool updatesEnabled();
+    bool updatesDeferred();
+};
+
+%pythoncode %{
+class DeferredNotifications(object):
+    """Defers observer notifications for the duration of a with block.
+
+    Notifications sent inside the block are collected and each observer
+    of the changed objects is notified once on exit; observers further
+    down the graph get a notification from each of those.  To have the
+    curves built on many quotes notify once, use setQuoteValues with the
+    curves as held objects.  Nested blocks leave the outer one in charge.
+    """
+
+    def __enter__(self):
+        settings = ObservableSettings.instance()
+        self._deferring = settings.updatesEnabled()
+        if self._deferring:
+            settings.disableUpdates(True)
+        return self
+
+    def __exit__(self, *exc):
+        if self._deferring:
+            ObservableSettings.instance().enableUpdates()
+        return False
+%}
+
 %shared_ptr(LazyObject)
 class LazyObject : public Observer, public Observable {
   private:
@@ -661,6 +697,32 @@ struct LocalBootstrap {
           forcePositive(forcePositive),
           accuracy(accuracy) {}
 };
+
+struct IncrementalBootstrap {
+    Real accuracy;
+    Real minValue, maxValue;
+    Size maxAttempts;
+    Real maxFactor, minFactor;
+    bool dontThrow;
+    Size dontThrowSteps;
+    IncrementalBootstrap(
+        Real accuracy = Null<Real>(),
+        Real minValue = Null<Real>(),
+        Real maxValue = Null<Real>(),
+        Size maxAttempts = 1,
+        Real maxFactor = 2.0,
+        Real minFactor = 2.0,
+        bool dontThrow = false,
+        Size dontThrowSteps = 10)
+        : accuracy(accuracy),
+          minValue(minValue),
+          maxValue(maxValue),
+          maxAttempts(maxAttempts),
+          maxFactor(maxFactor),
+          minFactor(minFactor),
+          dontThrow(dontThrow),
+          dontThrowSteps(dontThrowSteps) {}
+};
 %}
 
 struct IterativeBootstrap {
@@ -694,4 +756,17 @@ struct LocalBootstrap {
       Real accuracy = Null<Real>());
 };
 
+struct IncrementalBootstrap {
+    %feature("kwargs") IncrementalBootstrap;
+    IncrementalBootstrap(
+        Real accuracy = Null<Real>(),
+        Real minValue = Null<Real>(),
+        Real maxValue = Null<Real>(),
+        Size maxAttempts = 1,
+        Real maxFactor = 2.0,
+        Real minFactor = 2.0,
+        bool dontThrow = false,
+        Size dontThrowSteps = 10);
+};
+
 #endif
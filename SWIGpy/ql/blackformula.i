@@ -4,6 +4,8 @@
 %include ../ql/types.i
 %include ../ql/common.i
 %include ../ql/alltypes.i
+%include ../ql/linearalgebra.i
+%include ../ql/qlex/patterns/threads.i
 
 %{
 using QuantLib::blackFormula;
@@ -265,4 +267,110 @@ Real bachelierBlackFormulaAssetItmProbability(
     Real forward,
     Real stdDev);
 
+%inline %{
+    Array _blackFormulas(
+        const Array& optionTypes, const Array& strikes,
+        const Array& forwards, const Array& stdDevs,
+        const Array& discounts, const Array& displacements,
+        Size threads) {
+        return callWithoutGIL([&]() {
+            return QuantLib::blackFormulas(
+                optionTypes, strikes, forwards, stdDevs,
+                discounts, displacements, threads);
+        });
+    }
+    Array _bachelierBlackFormulas(
+        const Array& optionTypes, const Array& strikes,
+        const Array& forwards, const Array& stdDevs,
+        const Array& discounts, Size threads) {
+        return callWithoutGIL([&]() {
+            return QuantLib::bachelierBlackFormulas(
+                optionTypes, strikes, forwards, stdDevs, discounts, threads);
+        });
+    }
+    Array _blackFormulaImpliedStdDevs(
+        const Array& optionTypes, const Array& strikes,
+        const Array& forwards, const Array& blackPrices,
+        const Array& discounts, const Array& displacements,
+        Real accuracy, Natural maxIterations, Size threads) {
+        return callWithoutGIL([&]() {
+            return QuantLib::blackFormulaImpliedStdDevs(
+                optionTypes, strikes, forwards, blackPrices,
+                discounts, displacements, accuracy, maxIterations, threads);
+        });
+    }
+    Array _bachelierBlackFormulaImpliedVols(
+        const Array& optionTypes, const Array& strikes,
+        const Array& forwards, const Array& tte,
+        const Array& bachelierPrices, const Array& discounts,
+        Size threads) {
+        return callWithoutGIL([&]() {
+            return QuantLib::bachelierBlackFormulaImpliedVols(
+                optionTypes, strikes, forwards, tte,
+                bachelierPrices, discounts, threads);
+        });
+    }
+%}
+
+%pythoncode %{
+def _batchArgument(x):
+    if isinstance(x, (int, float)):
+        return [float(x)]
+    return x
+
+
+def blackFormulas(optionTypes, strikes, forwards, stdDevs,
+                  discounts=1.0, displacements=0.0, threads=1):
+    """blackFormula over arrays.
+
+    Each argument is a scalar or a sequence (list, Array, NumPy array)
+    holding one value per option; scalars and one-element sequences are
+    broadcast. Option types are Option.Call or Option.Put. The options
+    are priced in C++, over the given number of threads (0 for all
+    cores). Returns an Array.
+    """
+    return _blackFormulas(
+        *[_batchArgument(x) for x in (optionTypes, strikes, forwards,
+                                      stdDevs, discounts, displacements)],
+        threads)
+
+
+def bachelierBlackFormulas(optionTypes, strikes, forwards, stdDevs,
+                           discounts=1.0, threads=1):
+    """bachelierBlackFormula over arrays, see blackFormulas."""
+    return _bachelierBlackFormulas(
+        *[_batchArgument(x) for x in (optionTypes, strikes, forwards,
+                                      stdDevs, discounts)],
+        threads)
+
+
+def blackFormulaImpliedStdDevs(optionTypes, strikes, forwards, blackPrices,
+                               discounts=1.0, displacements=0.0,
+                               accuracy=1.0e-6, maxIterations=100,
+                               threads=1):
+    """blackFormulaImpliedStdDev over arrays, see blackFormulas.
+
+    Each solve starts from Li's rational approximation
+    (blackFormulaImpliedStdDevApproximationRS). Options for which no
+    solution is found get NaN instead of raising.
+    """
+    return _blackFormulaImpliedStdDevs(
+        *[_batchArgument(x) for x in (optionTypes, strikes, forwards,
+                                      blackPrices, discounts, displacements)],
+        accuracy, maxIterations, threads)
+
+
+def bachelierBlackFormulaImpliedVols(optionTypes, strikes, forwards, tte,
+                                     bachelierPrices, discounts=1.0,
+                                     threads=1):
+    """bachelierBlackFormulaImpliedVol over arrays, see blackFormulas.
+
+    Options for which no solution is found get NaN instead of raising.
+    """
+    return _bachelierBlackFormulaImpliedVols(
+        *[_batchArgument(x) for x in (optionTypes, strikes, forwards,
+                                      tte, bachelierPrices, discounts)],
+        threads)
+%}
+
 #endif
@@ -411,25 +411,34 @@ struct Protection {
 };
 
 %{
+// Python callables, or compiled Expression objects which are then
+// evaluated without calling back into the interpreter
 class UnaryFunction {
   public:
     UnaryFunction(
         PyObject* function) : function_(function) {
         Py_XINCREF(function_);
+        QuantLib::Expression* e;
+        if (SWIG_IsOK(SWIG_ConvertPtr(
+                function_, (void**)&e, SWIGTYPE_p_Expression, 0)))
+            expression_ = ext::make_shared<QuantLib::Expression>(*e);
     }
     UnaryFunction(
-        const UnaryFunction& f) : function_(f.function_) {
+        const UnaryFunction& f)
+        : function_(f.function_), expression_(f.expression_) {
         Py_XINCREF(function_);
     }
     UnaryFunction(
-        UnaryFunction&& f) {
+        UnaryFunction&& f) : function_(NULL) {
         std::swap(function_, f.function_);
+        std::swap(expression_, f.expression_);
     }
     UnaryFunction& operator=(const UnaryFunction& f) {
         if ((this != &f) && (function_ != f.function_)) {
             Py_XDECREF(function_);
             function_ = f.function_;
             Py_XINCREF(function_);
+            expression_ = f.expression_;
         }
         return *this;
     }
@@ -437,6 +446,8 @@ class UnaryFunction {
         Py_XDECREF(function_);
     }
     Real operator()() const {
+        if (expression_)
+            return (*expression_)();
         PyObject* pyResult = PyObject_CallFunction(
             function_, NULL);
         QL_ENSURE(pyResult != NULL, "failed to call Python function");
@@ -445,6 +456,8 @@ class UnaryFunction {
         return result;
     }
     Real operator()(Real x) const {
+        if (expression_)
+            return (*expression_)(x);
         PyObject* pyResult = PyObject_CallFunction(
             function_, "d", x);
         QL_ENSURE(pyResult != NULL, "failed to call Python function");
@@ -453,6 +466,7 @@ class UnaryFunction {
         return result;
     }
     Real operator()(const Date& x) const {
+        QL_REQUIRE(!expression_, "expressions cannot be called on dates");
         PyObject* pyResult = PyObject_CallFunction(
             function_, "(3)", x.dayOfMonth(), x.month(), x.year());
         QL_ENSURE(pyResult != NULL, "failed to call Python function");
@@ -461,6 +475,8 @@ class UnaryFunction {
         return result;
     }
     Real derivative(Real x) const {
+        if (expression_)
+            return expression_->derivative(x);
         PyObject* pyResult = PyObject_CallMethod(
             function_, "derivative", "d", x);
         QL_ENSURE(
@@ -473,6 +489,7 @@ class UnaryFunction {
 
   private:
     PyObject* function_;
+    ext::shared_ptr<QuantLib::Expression> expression_;
 };
 
 class BinaryFunction {
@@ -480,21 +497,27 @@ class BinaryFunction {
     BinaryFunction(
         PyObject* function) : function_(function) {
         Py_XINCREF(function_);
+        QuantLib::Expression* e;
+        if (SWIG_IsOK(SWIG_ConvertPtr(
+                function_, (void**)&e, SWIGTYPE_p_Expression, 0)))
+            expression_ = ext::make_shared<QuantLib::Expression>(*e);
     }
     BinaryFunction(
         const BinaryFunction& f)
-        : function_(f.function_) {
+        : function_(f.function_), expression_(f.expression_) {
         Py_XINCREF(function_);
     }
     BinaryFunction(
-        BinaryFunction&& f) {
+        BinaryFunction&& f) : function_(NULL) {
         std::swap(function_, f.function_);
+        std::swap(expression_, f.expression_);
     }
     BinaryFunction& operator=(const BinaryFunction& f) {
         if ((this != &f) && (function_ != f.function_)) {
             Py_XDECREF(function_);
             function_ = f.function_;
             Py_XINCREF(function_);
+            expression_ = f.expression_;
         }
         return *this;
     }
@@ -502,6 +525,8 @@ class BinaryFunction {
         Py_XDECREF(function_);
     }
     Real operator()(Real x, Real y) const {
+        if (expression_)
+            return (*expression_)(x, y);
         PyObject* pyResult = PyObject_CallFunction(
             function_, "dd", x, y);
         QL_ENSURE(
@@ -513,6 +538,7 @@ class BinaryFunction {
 
   private:
     PyObject* function_;
+    ext::shared_ptr<QuantLib::Expression> expression_;
 };
 %}
 
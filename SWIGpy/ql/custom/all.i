@@ -8,6 +8,7 @@
 %include ../ql/termstructures/volatilitytermstructures/blackvol/all.i
 %include ../ql/payoffs.i
 %include ../ql/optimizers.i
+%include ../ql/linearalgebra.i
 
 %{
 class CustomLocalVolatility : public LocalVolTermStructure {
@@ -69,6 +70,176 @@ class CustomLocalVolatility : public LocalVolTermStructure {
         const DayCounter& dc = DayCounter());
 };
 
+%{
+// calls back once per time for the whole strike grid and interpolates
+// linearly between the grid strikes, flat beyond them
+class CustomLocalVolatilitySlices : public LocalVolTermStructure {
+  public:
+    CustomLocalVolatilitySlices(
+        PyObject* localVolSlice,
+        const Array& strikes,
+        BusinessDayConvention bdc = Following,
+        const DayCounter& dc = DayCounter(),
+        Size cachedSlices = 4) :
+        LocalVolTermStructure(bdc, dc),
+        localVolSlice_(localVolSlice), cachedSlices_(cachedSlices) {
+        initialize(strikes);
+    }
+    CustomLocalVolatilitySlices(
+        PyObject* localVolSlice,
+        const Array& strikes,
+        const Date& referenceDate,
+        const Calendar& cal = Calendar(),
+        BusinessDayConvention bdc = Following,
+        const DayCounter& dc = DayCounter(),
+        Size cachedSlices = 4) :
+        LocalVolTermStructure(referenceDate, cal, bdc, dc),
+        localVolSlice_(localVolSlice), cachedSlices_(cachedSlices) {
+        initialize(strikes);
+    }
+    CustomLocalVolatilitySlices(
+        PyObject* localVolSlice,
+        const Array& strikes,
+        Natural settlementDays,
+        const Calendar& cal,
+        BusinessDayConvention bdc = Following,
+        const DayCounter& dc = DayCounter(),
+        Size cachedSlices = 4) :
+        LocalVolTermStructure(settlementDays, cal, bdc, dc),
+        localVolSlice_(localVolSlice), cachedSlices_(cachedSlices) {
+        initialize(strikes);
+    }
+    CustomLocalVolatilitySlices(const CustomLocalVolatilitySlices&) = delete;
+    CustomLocalVolatilitySlices& operator=(const CustomLocalVolatilitySlices&) = delete;
+    ~CustomLocalVolatilitySlices() override {
+        Py_XDECREF(localVolSlice_);
+        Py_XDECREF(strikeView_);
+    }
+
+    Date maxDate() const override { return Date::maxDate(); }
+    Real minStrike() const override { return 0.0; }
+    Real maxStrike() const override { return QL_MAX_REAL; }
+
+    const Array& strikes() const { return strikes_; }
+    Size callbacks() const { return callbacks_; }
+
+    void update() override {
+        slices_.clear();
+        LocalVolTermStructure::update();
+    }
+
+  protected:
+    Volatility localVolImpl(Time t, Real strike) const override {
+        const Array& vols = slice(t);
+        Size n = strikes_.size();
+        if (strike <= strikes_[0])
+            return vols[0];
+        if (strike >= strikes_[n - 1])
+            return vols[n - 1];
+        Size i = std::upper_bound(strikes_.begin(), strikes_.end(), strike)
+            - strikes_.begin();
+        // nodes of the grid are returned as given
+        if (strike == strikes_[i - 1])
+            return vols[i - 1];
+        Real w = (strike - strikes_[i - 1]) / (strikes_[i] - strikes_[i - 1]);
+        return vols[i - 1] + w * (vols[i] - vols[i - 1]);
+    }
+
+  private:
+    void initialize(const Array& strikes) {
+        QL_REQUIRE(strikes.size() >= 2, "at least two strikes required");
+        for (Size i = 1; i < strikes.size(); ++i)
+            QL_REQUIRE(strikes[i] > strikes[i - 1],
+                       "strikes must be sorted and unique");
+        QL_REQUIRE(cachedSlices_ > 0, "at least one cached slice required");
+        strikes_ = strikes;
+        Py_XINCREF(localVolSlice_);
+
+        // read-only view on a copy owned by Python
+        Array* exported = new Array(strikes);
+        PyObject* owner = SWIG_NewPointerObj(
+            SWIG_as_voidptr(exported), SWIGTYPE_p_Array, SWIG_POINTER_OWN);
+        PyObject* view = newRealMemoryView(
+            owner, exported->begin(), exported->size(), 1, 1);
+        Py_XDECREF(owner);
+        QL_ENSURE(view != NULL, "failed to export the strikes");
+        strikeView_ = PyObject_CallMethod(view, "toreadonly", NULL);
+        Py_XDECREF(view);
+        QL_ENSURE(strikeView_ != NULL, "failed to export the strikes");
+    }
+
+    const Array& slice(Time t) const {
+        for (const auto& s : slices_)
+            if (s.first == t)
+                return s.second;
+
+        PyObject* pyResult = PyObject_CallFunction(
+            localVolSlice_, "dO", t, strikeView_);
+        QL_ENSURE(pyResult != NULL, "failed to call Python function");
+        ++callbacks_;
+
+        Array vols;
+        Array* ptr;
+        bool valid = extractArray(pyResult, &vols);
+        if (!valid && SWIG_ConvertPtr(pyResult, (void**)&ptr,
+                                      SWIGTYPE_p_Array, 0) != -1) {
+            vols = *ptr;
+            valid = true;
+        }
+        Py_XDECREF(pyResult);
+        QL_REQUIRE(
+            valid,
+            "the local volatility slice must be an Array, a sequence of "
+            "floats or a float64 buffer");
+        QL_REQUIRE(
+            vols.size() == strikes_.size(),
+            "local volatility slice of " << vols.size()
+            << " values returned for " << strikes_.size() << " strikes");
+
+        if (slices_.size() == cachedSlices_)
+            slices_.erase(slices_.begin());
+        slices_.emplace_back(t, std::move(vols));
+        return slices_.back().second;
+    }
+
+    PyObject* localVolSlice_;
+    PyObject* strikeView_ = NULL;
+    Array strikes_;
+    Size cachedSlices_;
+    mutable std::vector<std::pair<Time, Array> > slices_;
+    mutable Size callbacks_ = 0;
+};
+%}
+
+%shared_ptr(CustomLocalVolatilitySlices)
+class CustomLocalVolatilitySlices : public LocalVolTermStructure {
+  public:
+    CustomLocalVolatilitySlices(
+        PyObject* localVolSlice,
+        const Array& strikes,
+        BusinessDayConvention bdc = Following,
+        const DayCounter& dc = DayCounter(),
+        Size cachedSlices = 4);
+    CustomLocalVolatilitySlices(
+        PyObject* localVolSlice,
+        const Array& strikes,
+        const Date& referenceDate,
+        const Calendar& cal = Calendar(),
+        BusinessDayConvention bdc = Following,
+        const DayCounter& dc = DayCounter(),
+        Size cachedSlices = 4);
+    CustomLocalVolatilitySlices(
+        PyObject* localVolSlice,
+        const Array& strikes,
+        Natural settlementDays,
+        const Calendar& cal,
+        BusinessDayConvention bdc = Following,
+        const DayCounter& dc = DayCounter(),
+        Size cachedSlices = 4);
+    const Array& strikes() const;
+    Size callbacks() const;
+};
+
 %{
 class CustomBlackVolatility : public BlackVolatilityTermStructure {
   public:
@@ -161,18 +332,54 @@ class CustomCLVModelPayoff : public PlainVanillaPayoff {
 };
 
 %{
+// Parameters are passed as float64 memoryviews on a copy, which
+// numpy.asarray wraps without copying; results may be QuantLib
+// Arrays and Matrices, sequences or float64 buffers.  The optional
+// gradient and jacobian methods replace finite differences.
 class CustomCostFunction : public CostFunction {
   private:
     PyObject* costFuncObj_;
+    bool hasGradient_, hasJacobian_;
+
+    static PyObject* exportArray(const Array& x) {
+        Array* exported = new Array(x);
+        PyObject* owner = SWIG_NewPointerObj(
+            SWIG_as_voidptr(exported), SWIGTYPE_p_Array, SWIG_POINTER_OWN);
+        PyObject* view = newRealMemoryView(
+            owner, exported->begin(), exported->size(), 1, 1);
+        Py_XDECREF(owner);
+        QL_ENSURE(view != NULL, "failed to export the parameters");
+        return view;
+    }
+
+    PyObject* call(const char* methodName, PyObject* parameters) const {
+        PyObject* pyResult = PyObject_CallMethod(
+            costFuncObj_, methodName, "O", parameters);
+        Py_XDECREF(parameters);
+        QL_ENSURE(
+            pyResult != NULL,
+            "failed to call method `" << methodName << "`");
+        return pyResult;
+    }
+
+    void inspect() {
+        hasGradient_ = PyObject_HasAttrString(costFuncObj_, "gradient") != 0;
+        hasJacobian_ = PyObject_HasAttrString(costFuncObj_, "jacobian") != 0;
+    }
+
   public:
     CustomCostFunction(PyObject* costFuncObj) : costFuncObj_(costFuncObj) {
         Py_XINCREF(costFuncObj_);
+        inspect();
     }
     CustomCostFunction(const CustomCostFunction& f)
-        : costFuncObj_(f.costFuncObj_) {
+        : costFuncObj_(f.costFuncObj_), hasGradient_(f.hasGradient_),
+          hasJacobian_(f.hasJacobian_) {
         Py_XINCREF(costFuncObj_);
     }
-    CustomCostFunction(CustomCostFunction&& f) {
+    CustomCostFunction(CustomCostFunction&& f)
+        : costFuncObj_(NULL), hasGradient_(f.hasGradient_),
+          hasJacobian_(f.hasJacobian_) {
         std::swap(costFuncObj_, f.costFuncObj_);
     }
     CustomCostFunction& operator=(const CustomCostFunction& f) {
@@ -180,6 +387,7 @@ class CustomCostFunction : public CostFunction {
             Py_XDECREF(costFuncObj_);
             costFuncObj_ = f.costFuncObj_;
             Py_XINCREF(costFuncObj_);
+            inspect();
         }
         return *this;
     }
@@ -188,48 +396,50 @@ class CustomCostFunction : public CostFunction {
     }
 
     Real value(const Array& x) const override {
-        PyObject* array = PyList_New(x.size());
-        PyObject* method = PyString_FromString("value");
-        for (Size i = 0; i < x.size(); i++)
-            PyList_SetItem(
-                array, i, PyFloat_FromDouble(x[i]));
-        PyObject* pyResult = PyObject_CallMethodObjArgs(
-            costFuncObj_, method, array, NULL);
-        Py_XDECREF(array);
-        Py_XDECREF(method);
-        QL_ENSURE(
-            pyResult != NULL,
-            "failed to call method `value`");
+        PyObject* pyResult = call("value", exportArray(x));
         Real result = PyFloat_AsDouble(pyResult);
         Py_XDECREF(pyResult);
         return result;
     }
 
     Array values(const Array& x) const override {
-        PyObject* array = PyList_New(x.size());
-        PyObject* method = PyString_FromString("values");
-        for (Size i = 0; i < x.size(); i++)
-            PyList_SetItem(
-                array, i, PyFloat_FromDouble(x[i]));
-        PyObject* pyResult = PyObject_CallMethodObjArgs(
-            costFuncObj_, method, array, NULL);
-        Py_XDECREF(array);
-        Py_XDECREF(method);
-        QL_ENSURE(
-            pyResult != NULL,
-            "failed to call method `values`");
-
-        Array result(PyObject_Length(pyResult));
-        for (Size i = 0; i < result.size(); i++) {
-            PyObject* key = PyInt_FromLong(i);
-            PyObject* item = PyObject_GetItem(pyResult, key);
-            result[i] = PyFloat_AsDouble(item);
-            Py_XDECREF(key);
-            Py_XDECREF(item);
+        return extractArray(call("values", exportArray(x)), "values");
+    }
+
+    void gradient(Array& grad, const Array& x) const override {
+        if (!hasGradient_) {
+            CostFunction::gradient(grad, x);
+            return;
         }
+        Array result = extractArray(call("gradient", exportArray(x)), "gradient");
+        QL_REQUIRE(
+            result.size() == x.size(),
+            "method `gradient` returned " << result.size()
+            << " values for " << x.size() << " parameters");
+        grad.swap(result);
+    }
 
-        Py_XDECREF(pyResult);
-        return result;
+    Real valueAndGradient(Array& grad, const Array& x) const override {
+        gradient(grad, x);
+        return value(x);
+    }
+
+    void jacobian(Matrix& jac, const Array& x) const override {
+        if (!hasJacobian_) {
+            CostFunction::jacobian(jac, x);
+            return;
+        }
+        Matrix result = extractMatrix(call("jacobian", exportArray(x)), "jacobian");
+        QL_REQUIRE(
+            result.columns() == x.size(),
+            "method `jacobian` returned " << result.columns()
+            << " columns for " << x.size() << " parameters");
+        jac.swap(result);
+    }
+
+    Array valuesAndJacobian(Matrix& jac, const Array& x) const override {
+        jacobian(jac, x);
+        return values(x);
     }
 };
 %}
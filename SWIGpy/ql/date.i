@@ -103,6 +103,9 @@ class Period {
     %pythoncode %{
     def __hash__(self):
         return hash(str(self))
+
+    def __reduce__(self):
+        return (Period, (self.length(), self.units()))
     %}
 };
 
@@ -300,6 +303,15 @@ class Date {
     @staticmethod
     def from_date(date):
         return Date(date.day, date.month, date.year)
+
+    def __reduce__(self):
+        if not self:
+            return (Date, ())
+        if hasattr(self, 'hours'):
+            return (Date, (self.dayOfMonth(), self.month(), self.year(),
+                           self.hours(), self.minutes(), self.seconds(),
+                           self.milliseconds(), self.microseconds()))
+        return (Date, (self.serialNumber(),))
     %}
 };
 
@@ -4,6 +4,7 @@
 %include ../ql/types.i
 %include ../ql/common.i
 %include ../ql/alltypes.i
+%include ../ql/linearalgebra.i
 
 %{
 using QuantLib::DayCounter;
@@ -28,6 +29,16 @@ class DayCounter {
         bool __ne__(const DayCounter& other) {
             return (*self) != other;
         }
+        Array yearFractions(
+            const std::vector<Date>& startDates,
+            const std::vector<Date>& endDates) const {
+            return QuantLib::yearFractions(*self, startDates, endDates);
+        }
+        Array yearFractions(
+            const Array& startSerials,
+            const Array& endSerials) const {
+            return QuantLib::yearFractions(*self, startSerials, endSerials);
+        }
     }
     %pythoncode %{
     def __hash__(self):
@@ -5,6 +5,7 @@
 %include ../ql/common.i
 %include ../ql/alltypes.i
 %include ../ql/fdms/FdmInnerValueCalculator.i
+%include ../ql/linearalgebra.i
 
 %{
 using QuantLib::FdmCellAveragingInnerValue;
@@ -188,6 +189,124 @@ class FdmInnerValueCalculatorProxy : public FdmInnerValueCalculator {
         PyObject* callback);
 };
 
+%{
+// calls back once per time for the whole grid
+class FdmInnerValueCalculatorArrayProxy : public FdmInnerValueCalculator {
+  public:
+    FdmInnerValueCalculatorArrayProxy(
+        PyObject* callback,
+        const ext::shared_ptr<FdmMesher>& mesher)
+        : callback_(callback), locations_(NULL) {
+        QL_REQUIRE(mesher, "null mesher given");
+        const Size dims = mesher->layout()->dim().size();
+        size_ = mesher->layout()->size();
+        Matrix* locations = new Matrix(dims, size_);
+        for (Size d = 0; d < dims; ++d) {
+            const Array x = mesher->locations(d);
+            std::copy(x.begin(), x.end(), locations->row_begin(d));
+        }
+        PyObject* owner = SWIG_NewPointerObj(
+            SWIG_as_voidptr(locations), SWIGTYPE_p_Matrix, SWIG_POINTER_OWN);
+        locations_ = newRealMemoryView(
+            owner, locations->begin(), dims, size_, 2);
+        Py_XDECREF(owner);
+        QL_ENSURE(locations_ != NULL, "failed to export the mesher locations");
+        Py_XINCREF(callback_);
+    }
+
+    FdmInnerValueCalculatorArrayProxy(
+        const FdmInnerValueCalculatorArrayProxy& p)
+        : callback_(p.callback_), locations_(p.locations_), size_(p.size_) {
+        Py_XINCREF(callback_);
+        Py_XINCREF(locations_);
+    }
+
+    FdmInnerValueCalculatorArrayProxy& operator=(
+        const FdmInnerValueCalculatorArrayProxy& f) {
+        if (this != &f) {
+            Py_XINCREF(f.callback_);
+            Py_XINCREF(f.locations_);
+            Py_XDECREF(callback_);
+            Py_XDECREF(locations_);
+            callback_ = f.callback_;
+            locations_ = f.locations_;
+            size_ = f.size_;
+            values_ = Array();
+            avgValues_ = Array();
+        }
+        return *this;
+    }
+
+    ~FdmInnerValueCalculatorArrayProxy() {
+        Py_XDECREF(callback_);
+        Py_XDECREF(locations_);
+    }
+
+    Real innerValue(
+        const FdmLinearOpIterator& iter, Time t) {
+        return getValues(t, "innerValues", values_, time_)[iter.index()];
+    }
+
+    Real avgInnerValue(
+        const FdmLinearOpIterator& iter, Time t) {
+        if (PyObject_HasAttrString(callback_, "avgInnerValues"))
+            return getValues(t, "avgInnerValues", avgValues_, avgTime_)[iter.index()];
+        return innerValue(iter, t);
+    }
+
+  private:
+    const Array& getValues(
+        Time t,
+        const std::string& methodName,
+        Array& values,
+        Time& time) {
+        if (!values.empty() && t == time)
+            return values;
+
+        PyObject* pyResult = PyObject_CallMethod(
+            callback_, methodName.c_str(), "Od", locations_, t);
+        QL_ENSURE(
+            pyResult != NULL,
+            "failed to call " + methodName + " on Python object");
+
+        Array result;
+        Array* ptr;
+        bool valid = extractArray(pyResult, &result);
+        if (!valid && SWIG_ConvertPtr(pyResult, (void**)&ptr,
+                                      SWIGTYPE_p_Array, 0) != -1) {
+            result = *ptr;
+            valid = true;
+        }
+        Py_XDECREF(pyResult);
+        QL_REQUIRE(
+            valid,
+            methodName << " must return an Array, a sequence of floats "
+            "or a float64 buffer");
+        QL_REQUIRE(
+            result.size() == size_,
+            methodName << " returned " << result.size()
+                       << " values for " << size_ << " grid points");
+        values.swap(result);
+        time = t;
+        return values;
+    }
+
+    PyObject* callback_;
+    PyObject* locations_;
+    Size size_;
+    Array values_, avgValues_;
+    Time time_ = 0.0, avgTime_ = 0.0;
+};
+%}
+
+%shared_ptr(FdmInnerValueCalculatorArrayProxy)
+class FdmInnerValueCalculatorArrayProxy : public FdmInnerValueCalculator {
+  public:
+    FdmInnerValueCalculatorArrayProxy(
+        PyObject* callback,
+        const ext::shared_ptr<FdmMesher>& mesher);
+};
+
 %shared_ptr(FdmCellAveragingInnerValue)
 class FdmCellAveragingInnerValue : public FdmInnerValueCalculator {
   public:
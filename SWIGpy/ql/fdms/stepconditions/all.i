@@ -5,6 +5,7 @@
 %include ../ql/common.i
 %include ../ql/alltypes.i
 %include ../ql/fdms/StepCondition.i
+%include ../ql/linearalgebra.i
 
 %{
 using QuantLib::FdmAmericanStepCondition;
@@ -90,6 +91,16 @@ public:
     FdmStepConditionComposite(
         const std::list<std::vector<Time>>& stoppingTimes,
         Conditions conditions);
+    %extend {
+        FdmStepConditionComposite(
+            const std::vector<Time>& stoppingTimes,
+            const std::vector<ext::shared_ptr<FdmStepCondition>>& conditions) {
+                return new FdmStepConditionComposite(
+                    std::list<std::vector<Time>>(1, stoppingTimes),
+                    FdmStepConditionComposite::Conditions(
+                        conditions.begin(), conditions.end()));
+            }
+    }
 
     const std::vector<Time>& stoppingTimes() const;
     const Conditions& conditions() const;
@@ -240,4 +251,79 @@ class FdmStepConditionProxy : public FdmStepCondition {
         PyObject* callback);
 };
 
+%{
+// passes the solution as a writable buffer; the buffer holds a copy,
+// owned by Python, which is copied back into the solution afterwards
+class FdmStepConditionArrayProxy : public FdmStepCondition {
+  public:
+    FdmStepConditionArrayProxy(
+        PyObject* callback) : callback_(callback) {
+        Py_XINCREF(callback_);
+    }
+
+    FdmStepConditionArrayProxy(
+        const FdmStepConditionArrayProxy& p)
+        : callback_(p.callback_) {
+        Py_XINCREF(callback_);
+    }
+
+    FdmStepConditionArrayProxy& operator=(
+        const FdmStepConditionArrayProxy& f) {
+        if ((this != &f) && (callback_ != f.callback_)) {
+            Py_XDECREF(callback_);
+            callback_ = f.callback_;
+            Py_XINCREF(callback_);
+        }
+        return *this;
+    }
+
+    ~FdmStepConditionArrayProxy() {
+        Py_XDECREF(callback_);
+    }
+
+    void applyTo(Array& a, Time t) const {
+        // exports kept by the callback keep the copy alive, not the solver
+        Array* values = new Array(a);
+        PyObject* owner = SWIG_NewPointerObj(
+            SWIG_as_voidptr(values), SWIGTYPE_p_Array, SWIG_POINTER_OWN);
+        if (owner == NULL) {
+            delete values;
+            QL_FAIL("failed to export the solution array");
+        }
+        PyObject* pyBuffer = newRealMemoryView(
+            owner, values->begin(), values->size(), 1, 1);
+        Py_XDECREF(owner);
+        QL_ENSURE(
+            pyBuffer != NULL,
+            "failed to export the solution array");
+
+        PyObject* pyResult = PyObject_CallMethod(
+            callback_, "applyTo", "Od", pyBuffer, t);
+        if (pyResult != NULL)
+            std::copy(values->begin(), values->end(), a.begin());
+
+        // the error raised by the callback is kept while the buffer goes
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        Py_XDECREF(pyBuffer);
+        PyErr_Restore(type, value, traceback);
+
+        QL_ENSURE(
+            pyResult != NULL,
+            "failed to call applyTo on Python object");
+        Py_XDECREF(pyResult);
+    }
+
+  private:
+    PyObject* callback_;
+};
+%}
+
+%shared_ptr(FdmStepConditionArrayProxy)
+class FdmStepConditionArrayProxy : public FdmStepCondition {
+  public:
+    FdmStepConditionArrayProxy(
+        PyObject* callback);
+};
+
 #endif
@@ -5,6 +5,8 @@
 %include ../ql/common.i
 %include ../ql/alltypes.i
 %include ../ql/base.i
+%include ../ql/linearalgebra.i
+%include ../ql/timeseries.i
 
 %{
 using QuantLib::IndexManager;
@@ -22,8 +24,117 @@ class IndexManager {
     void clearHistory(const std::string& name);
     void clearHistories();
     bool hasHistoricalFixing(const std::string& name, const Date& fixingDate) const;
+    %extend {
+        void setHistories(
+            const std::vector<std::string>& names,
+            const std::vector<ColumnarTimeSeries>& histories) {
+            QuantLib::setHistories(names, histories);
+        }
+        void setHistories(
+            const std::vector<std::string>& names,
+            const std::vector<Natural>& sizes,
+            const Array& serials,
+            const Array& values) {
+            QuantLib::setHistories(names, sizes, serials, values);
+        }
+    }
 };
 
+%pythoncode %{
+import struct as _struct
+import sys as _sys
+from array import array as _array
+
+_historiesMagic = b'QLFIXES1'
+_historiesHeader = _struct.Struct('<8sQQQ')
+
+
+def saveHistories(path, histories):
+    """Write fixing histories to a binary file.
+
+    histories maps index names to ColumnarTimeSeries or RealTimeSeries
+    objects. The file holds a fixed header, the history sizes, the
+    names and the serial numbers and values of all histories, one
+    after the other, as little-endian float64 arrays.
+    """
+    names, sizes = [], _array('Q')
+    serials, values = _array('d'), _array('d')
+    for name, history in histories.items():
+        if not isinstance(history, ColumnarTimeSeries):
+            history = ColumnarTimeSeries(history)
+        names.append(name)
+        sizes.append(len(history))
+        serials.frombytes(history.serials().view())
+        values.frombytes(history.values().view())
+    encoded = '\0'.join(names).encode('utf-8')
+    if _sys.byteorder == 'big':
+        sizes.byteswap()
+        serials.byteswap()
+        values.byteswap()
+    with open(path, 'wb') as f:
+        f.write(_historiesHeader.pack(
+            _historiesMagic, len(names), len(serials), len(encoded)))
+        f.write(sizes.tobytes())
+        f.write(encoded)
+        f.write(b'\0' * (-len(encoded) % 8))
+        f.write(serials.tobytes())
+        f.write(values.tobytes())
+
+
+def _readHistories(path, use):
+    import mmap
+    with open(path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        magic, count, n, namesSize = _historiesHeader.unpack_from(buffer)
+        if magic != _historiesMagic:
+            raise ValueError("%s is not a fixing history file" % path)
+        offset = _historiesHeader.size
+        sizes = _array('Q', buffer[offset:offset + 8 * count])
+        offset += 8 * count
+        names = buffer[offset:offset + namesSize].decode('utf-8')
+        names = names.split('\0') if count > 0 else []
+        offset += namesSize + (-namesSize % 8)
+        if _sys.byteorder == 'big':
+            sizes.byteswap()
+            serials = _array('d', buffer[offset:offset + 8 * n])
+            values = _array('d', buffer[offset + 8 * n:offset + 16 * n])
+            serials.byteswap()
+            values.byteswap()
+            return use(names, list(sizes), serials, values)
+        with memoryview(buffer) as view:
+            with view[offset:offset + 8 * n].cast('d') as serials, \
+                    view[offset + 8 * n:offset + 16 * n].cast('d') as values:
+                return use(names, list(sizes), serials, values)
+
+
+def readHistories(path):
+    """Read the histories saved by saveHistories.
+
+    Returns a dict mapping index names to ColumnarTimeSeries objects;
+    the arrays are copied straight from the memory-mapped file.
+    """
+    def use(names, sizes, serials, values):
+        histories, offset = {}, 0
+        for name, size in zip(names, sizes):
+            histories[name] = ColumnarTimeSeries(
+                serials[offset:offset + size], values[offset:offset + size])
+            offset += size
+        return histories
+    return _readHistories(path, use)
+
+
+def loadHistories(path):
+    """Install the histories saved by saveHistories in the IndexManager.
+
+    The memory-mapped arrays are passed to IndexManager.setHistories in
+    a single call. Returns the names of the installed histories.
+    """
+    def use(names, sizes, serials, values):
+        IndexManager.instance().setHistories(names, sizes, serials, values)
+        return names
+    return _readHistories(path, use)
+%}
+
 %{
 using QuantLib::InterestRateIndex;
 using QuantLib::BMAIndex;
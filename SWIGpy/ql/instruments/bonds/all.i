@@ -226,6 +226,10 @@ class CallableBond : public Bond {
 };
 
 %shared_ptr(FixedRateBond)
+// the constructor arguments are kept for pickling, see pickle.i
+%pythonappend FixedRateBond::FixedRateBond %{
+    self._constructorArgs = args
+%}
 class FixedRateBond : public Bond {
   public:
     FixedRateBond(
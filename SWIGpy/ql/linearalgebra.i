@@ -31,6 +31,134 @@ using QuantLib::Pow;
 %define QL_TYPECHECK_MATRIX      4220    %enddef
 
 %{
+// Python buffer protocol support: Array and Matrix export their
+// storage as C-contiguous float64 views, and any C-contiguous float64
+// buffer (e.g. numpy.ndarray) is accepted where they are expected.
+struct RealBufferExporter {
+    PyObject_HEAD
+    PyObject* owner;
+    Real* data;
+    int ndim;
+    Py_ssize_t shape[2];
+    Py_ssize_t strides[2];
+};
+
+static void RealBufferExporter_dealloc(PyObject* self) {
+    RealBufferExporter* exporter = (RealBufferExporter*)self;
+    Py_XDECREF(exporter->owner);
+    PyObject_Del(self);
+}
+
+static int RealBufferExporter_getbuffer(
+    PyObject* self, Py_buffer* view, int flags) {
+    RealBufferExporter* exporter = (RealBufferExporter*)self;
+    Py_ssize_t size = 1;
+    for (int i = 0; i < exporter->ndim; i++)
+        size *= exporter->shape[i];
+    view->obj = self;
+    Py_INCREF(self);
+    view->buf = exporter->data;
+    view->len = size * Py_ssize_t(sizeof(Real));
+    view->readonly = 0;
+    view->itemsize = sizeof(Real);
+    view->format = (flags & PyBUF_FORMAT) ? (char*)"d" : NULL;
+    view->ndim = exporter->ndim;
+    view->shape = (flags & PyBUF_ND) ? exporter->shape : NULL;
+    view->strides =
+        ((flags & PyBUF_STRIDES) == PyBUF_STRIDES) ? exporter->strides : NULL;
+    view->suboffsets = NULL;
+    view->internal = NULL;
+    return 0;
+}
+
+static PyBufferProcs RealBufferExporter_as_buffer = {
+    RealBufferExporter_getbuffer, NULL };
+
+static PyTypeObject RealBufferExporterType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "QuantLib.RealBufferExporter" };
+
+// returns a writable memoryview on data, keeping owner alive
+PyObject* newRealMemoryView(
+    PyObject* owner, Real* data, Size rows, Size columns, int ndim) {
+    static_assert(sizeof(Real) == sizeof(double),
+                  "buffer protocol requires Real to be double");
+    if (!(RealBufferExporterType.tp_flags & Py_TPFLAGS_READY)) {
+        RealBufferExporterType.tp_basicsize = sizeof(RealBufferExporter);
+        RealBufferExporterType.tp_flags = Py_TPFLAGS_DEFAULT;
+        RealBufferExporterType.tp_dealloc = RealBufferExporter_dealloc;
+        RealBufferExporterType.tp_as_buffer = &RealBufferExporter_as_buffer;
+        RealBufferExporterType.tp_doc =
+            "exports the storage of a QuantLib Array or Matrix";
+        if (PyType_Ready(&RealBufferExporterType) < 0)
+            return NULL;
+    }
+    RealBufferExporter* exporter =
+        PyObject_New(RealBufferExporter, &RealBufferExporterType);
+    if (exporter == NULL)
+        return NULL;
+    Py_XINCREF(owner);
+    exporter->owner = owner;
+    exporter->data = data;
+    exporter->ndim = ndim;
+    exporter->shape[0] = Py_ssize_t(rows);
+    exporter->shape[1] = Py_ssize_t(columns);
+    exporter->strides[0] = Py_ssize_t(ndim == 2 ? columns : 1) * sizeof(Real);
+    exporter->strides[1] = sizeof(Real);
+    PyObject* view = PyMemoryView_FromObject((PyObject*)exporter);
+    Py_DECREF(exporter);
+    return view;
+}
+
+bool isRealFormat(const char* format) {
+    if (format == NULL)
+        return true;
+    std::string f(format);
+#if PY_LITTLE_ENDIAN
+    return f == "d" || f == "@d" || f == "=d" || f == "<d";
+#else
+    return f == "d" || f == "@d" || f == "=d" || f == ">d";
+#endif
+}
+
+// SWIG proxies are left to SWIG_ConvertPtr so that they are not copied
+bool getRealBuffer(PyObject* source, Py_buffer* view, int ndim) {
+    if (SWIG_Python_GetSwigThis(source) != 0 || !PyObject_CheckBuffer(source))
+        return false;
+    if (PyObject_GetBuffer(source, view,
+                           PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) != 0) {
+        PyErr_Clear();
+        return false;
+    }
+    if (view->ndim != ndim ||
+        view->itemsize != Py_ssize_t(sizeof(Real)) ||
+        !isRealFormat(view->format)) {
+        PyBuffer_Release(view);
+        return false;
+    }
+    return true;
+}
+
+bool isRealBuffer(PyObject* source, int ndim) {
+    Py_buffer view;
+    if (!getRealBuffer(source, &view, ndim))
+        return false;
+    PyBuffer_Release(&view);
+    return true;
+}
+
+bool extractMatrix(PyObject* source, Matrix* target) {
+    Py_buffer view;
+    if (!getRealBuffer(source, &view, 2))
+        return false;
+    const Real* data = static_cast<const Real*>(view.buf);
+    *target = Matrix(Size(view.shape[0]), Size(view.shape[1]));
+    std::copy(data, data + target->rows() * target->columns(),
+              target->begin());
+    PyBuffer_Release(&view);
+    return true;
+}
+
 bool extractArray(PyObject* source, Array* target) {
     if (PyTuple_Check(source) || PyList_Check(source)) {
         Size size = (PyTuple_Check(source) ? PyTuple_Size(source) : PyList_Size(source));
@@ -50,7 +178,14 @@ bool extractArray(PyObject* source, Array* target) {
         }
         return true;
     } else {
-        return false;
+        Py_buffer view;
+        if (!getRealBuffer(source, &view, 1))
+            return false;
+        const Real* data = static_cast<const Real*>(view.buf);
+        *target = Array(Size(view.shape[0]));
+        std::copy(data, data + target->size(), target->begin());
+        PyBuffer_Release(&view);
+        return true;
     }
 }
 %}
@@ -92,6 +227,8 @@ bool extractArray(PyObject* source, Array* target) {
                 $1 = 0;
             Py_DECREF(o);
         }
+    } else if (isRealBuffer($input, 1)) {
+        $1 = 1;
     } else {
         Array* v;
         if (SWIG_ConvertPtr($input,(void **) &v,
@@ -115,6 +252,8 @@ bool extractArray(PyObject* source, Array* target) {
                 $1 = 0;
             Py_DECREF(o);
         }
+    } else if (isRealBuffer($input, 1)) {
+        $1 = 1;
     } else {
         Array* v;
         if (SWIG_ConvertPtr($input,(void **) &v,
@@ -181,6 +320,8 @@ bool extractArray(PyObject* source, Array* target) {
                 return NULL;
             }
         }
+    } else if (extractMatrix($input, &$1)) {
+        ;
     } else {
         SWIG_ConvertPtr($input,(void **) &m,$&1_descriptor,1);
         $1 = *m;
@@ -245,6 +386,8 @@ bool extractArray(PyObject* source, Array* target) {
             }
         }
         $1 = &temp;
+    } else if (extractMatrix($input, &temp)) {
+        $1 = &temp;
     } else {
         SWIG_ConvertPtr($input,(void **) &$1,$1_descriptor,1);
     }
@@ -253,6 +396,8 @@ bool extractArray(PyObject* source, Array* target) {
 %typecheck(QL_TYPECHECK_MATRIX) Matrix {
     if (PyTuple_Check($input) || PyList_Check($input)) {
         $1 = 1;
+    } else if (isRealBuffer($input, 2)) {
+        $1 = 1;
     } else {
         Matrix* m;
         if (SWIG_ConvertPtr($input,(void **) &m,
@@ -266,6 +411,8 @@ bool extractArray(PyObject* source, Array* target) {
 %typecheck(QL_TYPECHECK_MATRIX) const Matrix& {
     if (PyTuple_Check($input) || PyList_Check($input)) {
         $1 = 1;
+    } else if (isRealBuffer($input, 2)) {
+        $1 = 1;
     } else {
         Matrix* m;
         if (SWIG_ConvertPtr($input,(void **) &m,
@@ -389,7 +536,28 @@ class Array {
                 throw std::out_of_range("array index out of range");
             }
         }
+        PyObject* _memoryView(PyObject* owner) {
+            return newRealMemoryView(
+                owner, self->begin(), self->size(), 1, 1);
+        }
     }
+    %pythoncode %{
+    def __reduce__(self):
+        return (Array, (self.view().tolist(),))
+
+    def view(self):
+        """writable memoryview on the storage, invalidated by resize/swap"""
+        return self._memoryView(self)
+
+    def __buffer__(self, flags):
+        return self.view()
+
+    def __array__(self, dtype=None, copy=None):
+        import numpy
+        if copy:
+            return numpy.array(self.view(), dtype=dtype)
+        return numpy.asarray(self.view(), dtype=dtype)
+    %}
 };
 
 Real DotProduct(const Array&, const Array&);
@@ -471,7 +639,28 @@ class Matrix {
         Matrix __rmul__(const Matrix& x) {
             return x*(*self);
         }
+        PyObject* _memoryView(PyObject* owner) {
+            return newRealMemoryView(
+                owner, self->begin(), self->rows(), self->columns(), 2);
+        }
     }
+    %pythoncode %{
+    def __reduce__(self):
+        return (Matrix, (self.view().tolist(),))
+
+    def view(self):
+        """writable 2-D memoryview on the row-major storage"""
+        return self._memoryView(self)
+
+    def __buffer__(self, flags):
+        return self.view()
+
+    def __array__(self, dtype=None, copy=None):
+        import numpy
+        if copy:
+            return numpy.array(self.view(), dtype=dtype)
+        return numpy.asarray(self.view(), dtype=dtype)
+    %}
 };
 
 %template(MatrixVector) std::vector<Matrix>;
@@ -498,6 +687,7 @@ class SVD {
 };
 
 %{
+// steals the reference to the result of a Python call
 Array extractArray(
     PyObject* source, const std::string& methodName) {
 
@@ -505,28 +695,88 @@ Array extractArray(
         source != NULL,
         "failed to call " + methodName + " on Python object");
 
-    QL_ENSURE(
-        source != Py_None,
-        methodName + " returned None");
+    if (source == Py_None) {
+        Py_XDECREF(source);
+        QL_FAIL(methodName + " returned None");
+    }
+
+    Array tmp;
+    if (extractArray(source, &tmp)) {
+        Py_XDECREF(source);
+        return tmp;
+    }
 
     Array* ptr;
     const int err = SWIG_ConvertPtr(
         source, (void**)&ptr,
-        SWIGTYPE_p_Array, SWIG_POINTER_EXCEPTION);
-
-    if (err != 0) {
+        SWIGTYPE_p_Array, 0);
+
+    if (err == 0) {
+        tmp = *ptr;
+    } else if (PySequence_Check(source)) {
+        // e.g., other numeric types or strided numpy arrays
+        tmp = Array(Size(PySequence_Size(source)));
+        for (Size i = 0; i < tmp.size(); i++) {
+            PyObject* item = PySequence_GetItem(source, i);
+            tmp[i] = item != NULL ? PyFloat_AsDouble(item) : -1.0;
+            Py_XDECREF(item);
+            if (PyErr_Occurred()) {
+                PyErr_Clear();
+                Py_XDECREF(source);
+                QL_FAIL("non-numeric value returned by " + methodName);
+            }
+        }
+    } else {
         Py_XDECREF(source);
         QL_FAIL(
-            "return type must be of type QuantLib Array in "
-            + methodName);
+            "return type must be a QuantLib Array, a sequence of "
+            "floats or a float64 buffer in " + methodName);
     }
-
-    Array tmp(*ptr);
     Py_XDECREF(source);
 
     return tmp;
 }
 
+// steals the reference to the result of a Python call
+Matrix extractMatrix(
+    PyObject* source, const std::string& methodName) {
+
+    QL_ENSURE(
+        source != NULL,
+        "failed to call " + methodName + " on Python object");
+
+    Matrix tmp;
+    Matrix* ptr;
+    bool valid = extractMatrix(source, &tmp);
+    if (!valid && SWIG_ConvertPtr(source, (void**)&ptr,
+                                  SWIGTYPE_p_Matrix, 0) == 0) {
+        tmp = *ptr;
+        valid = true;
+    }
+    if (!valid && (PyTuple_Check(source) || PyList_Check(source))) {
+        // rows of floats
+        Size rows = Size(PySequence_Size(source));
+        valid = true;
+        for (Size i = 0; i < rows && valid; ++i) {
+            PyObject* row = PySequence_GetItem(source, i);
+            Array values;
+            valid = extractArray(row, &values);
+            Py_XDECREF(row);
+            if (valid && i == 0)
+                tmp = Matrix(rows, values.size());
+            valid = valid && values.size() == tmp.columns();
+            if (valid)
+                std::copy(values.begin(), values.end(), tmp.row_begin(i));
+        }
+    }
+    Py_XDECREF(source);
+    QL_REQUIRE(
+        valid,
+        "return type must be a QuantLib Matrix, a sequence of rows "
+        "or a 2-dimensional float64 buffer in " + methodName);
+    return tmp;
+}
+
 class MatrixMultiplicationProxy {
   public:
     MatrixMultiplicationProxy(PyObject* matrixMult)
@@ -4,6 +4,7 @@
 %include ../ql/types.i
 %include ../ql/common.i
 %include ../ql/alltypes.i
+%include ../ql/linearalgebra.i
 
 %{
 using QuantLib::Path;
@@ -13,6 +14,57 @@ using QuantLib::MultiPathGenerator;
 using QuantLib::BrownianBridge;
 %}
 
+%{
+// used in the generate() methods of PathGenerator and MultiPathGenerator;
+// a Path fills one row, a MultiPath fills timeGrid.size() rows of
+// assetNumber() columns
+Size pathRows(const Path&) {
+    return 1;
+}
+
+Size pathRows(const MultiPath& p) {
+    return p.pathSize();
+}
+
+Size pathColumns(const Path& p) {
+    return p.length();
+}
+
+Size pathColumns(const MultiPath& p) {
+    return p.assetNumber();
+}
+
+void copyPath(const Path& p, Real* out) {
+    std::copy(p.begin(), p.end(), out);
+}
+
+void copyPath(const MultiPath& p, Real* out) {
+    Size nAssets = p.assetNumber();
+    for (Size j = 0; j < nAssets; ++j) {
+        const Path& path = p[j];
+        for (Size i = 0; i < path.length(); ++i)
+            out[i * nAssets + j] = path[i];
+    }
+}
+
+template <class Generator>
+Matrix generatePaths(const Generator& generator, Size nPaths, bool antithetic) {
+    QL_REQUIRE(nPaths > 0, "number of paths must be positive");
+    Matrix result;
+    Size rows = 0;
+    for (Size k = 0; k < nPaths; ++k) {
+        const typename Generator::sample_type& sample =
+            (antithetic && k % 2 == 1) ? generator.antithetic() : generator.next();
+        if (k == 0) {
+            rows = pathRows(sample.value);
+            result = Matrix(nPaths * rows, pathColumns(sample.value));
+        }
+        copyPath(sample.value, result.row_begin(k * rows));
+    }
+    return result;
+}
+%}
+
 class Path {
     %rename(__len__) length;
   public:
@@ -58,6 +110,17 @@ class PathGenerator {
     const sample_type& antithetic() const;
     Size size() const;
     const TimeGrid& timeGrid() const;
+    %extend {
+        Matrix _generate(Size nPaths, bool antithetic) const {
+            return generatePaths(*self, nPaths, antithetic);
+        }
+    }
+    %pythoncode %{
+    def generate(self, nPaths, antithetic=True):
+        """nPaths x timeGrid().size() float64 memoryview of path values;
+        with antithetic, odd rows are the antithetic of the previous row"""
+        return self._generate(nPaths, antithetic).view()
+    %}
 };
 
 %template(GaussianPathGenerator) PathGenerator<GaussianRandomSequenceGenerator>;
@@ -97,6 +160,19 @@ class MultiPathGenerator {
         bool brownianBridge = false);
     const sample_type& next() const;
     const sample_type& antithetic() const;
+    %extend {
+        Matrix _generate(Size nPaths, bool antithetic) const {
+            return generatePaths(*self, nPaths, antithetic);
+        }
+    }
+    %pythoncode %{
+    def generate(self, nPaths, antithetic=True):
+        """nPaths x timeSteps+1 x nAssets float64 memoryview of path values;
+        with antithetic, odd paths are the antithetic of the previous one"""
+        values = self._generate(nPaths, antithetic)
+        return values.view().cast('B').cast(
+            'd', [nPaths, values.rows() // nPaths, values.columns()])
+    %}
 };
 
 %template(GaussianMultiPathGenerator) MultiPathGenerator<GaussianRandomSequenceGenerator>;
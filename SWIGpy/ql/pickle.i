@@ -0,0 +1,334 @@
+#ifndef ql_pickle_i
+#define ql_pickle_i
+
+// Pickle support for wrapped objects.
+//
+// Value-like classes are pickled from their full current state: Date,
+// Period, Array, Matrix and StreamingStatistics define __reduce__ next
+// to their declarations, while SimpleQuote and the vectors of value
+// types are handled below.
+//
+// Market conventions and data are pickled as follows, so that a built
+// curve or instrument can be sent to worker processes:
+//
+// - calendars, day counters and currencies by name; a calendar brings
+//   its added and removed holidays along.  Joint and bespoke calendars
+//   cannot be pickled, and day counters built with a schedule or a
+//   termination date are rebuilt without;
+// - schedules from their dates and rule data;
+// - FlatForward at its current rate, and curves interpolating nodes
+//   (e.g. piecewise curves, which are bootstrapped first) as the
+//   interpolated curve on their current nodes, e.g. DiscountCurve for
+//   PiecewiseLogLinearDiscount.  The result has a fixed reference date,
+//   a default-constructed interpolator and no link to the quotes; curves
+//   with jumps, or whose interpolated curve class is not wrapped, cannot
+//   be pickled;
+// - yield term structure handles with their current link, and Ibor and
+//   overnight indexes from their parameters and forwarding handle.  Libor
+//   indexes, whose dates depend on more than those, cannot be pickled;
+// - fixed-rate bonds from their constructor arguments, and vanilla swaps
+//   from their inspectors.  Bonds returned from C++ cannot be pickled.
+//   Pricing engines are not pickled.
+//
+// Every other wrapped class raises TypeError.  Models, engines, and the
+// other curves and instruments hold state that cannot be recovered from
+// Python (calibrated parameters, accumulated samples, flags and quote
+// values changed from C++), so rebuilding them from their constructor
+// arguments would silently lose it.
+
+%{
+namespace {
+
+    struct NodeCurveData {
+        std::string name;
+        std::vector<Date> dates;
+        std::vector<Real> data;
+    };
+
+    template <class Curve>
+    bool nodeCurveData(const ext::shared_ptr<YieldTermStructure>& curve,
+                       const std::string& name,
+                       NodeCurveData& result) {
+        ext::shared_ptr<Curve> c = ext::dynamic_pointer_cast<Curve>(curve);
+        if (!c)
+            return false;
+        result.name = name;
+        result.dates = c->dates();
+        result.data = c->data();
+        return true;
+    }
+
+    // nodes of the wrapped interpolated curve class underlying the given
+    // curve; piecewise curves derive from it, but their node accessors
+    // are not virtual, so they are bootstrapped by maxDate() first
+    NodeCurveData nodeCurveData(const ext::shared_ptr<YieldTermStructure>& curve) {
+        NodeCurveData result;
+        if (!curve)
+            return result;
+        curve->maxDate();
+        nodeCurveData<InterpolatedDiscountCurve<LogLinear> >(curve, "DiscountCurve", result) ||
+        nodeCurveData<InterpolatedDiscountCurve<MonotonicLogCubic> >(
+            curve, "MonotonicLogCubicDiscountCurve", result) ||
+        nodeCurveData<InterpolatedDiscountCurve<SplineCubic> >(
+            curve, "NaturalCubicDiscountCurve", result) ||
+        nodeCurveData<InterpolatedZeroCurve<Linear> >(curve, "ZeroCurve", result) ||
+        nodeCurveData<InterpolatedZeroCurve<LogLinear> >(curve, "LogLinearZeroCurve", result) ||
+        nodeCurveData<InterpolatedZeroCurve<Cubic> >(curve, "CubicZeroCurve", result) ||
+        nodeCurveData<InterpolatedZeroCurve<SplineCubic> >(curve, "NaturalCubicZeroCurve", result) ||
+        nodeCurveData<InterpolatedZeroCurve<DefaultLogCubic> >(curve, "LogCubicZeroCurve", result) ||
+        nodeCurveData<InterpolatedZeroCurve<MonotonicCubic> >(
+            curve, "MonotonicCubicZeroCurve", result) ||
+        nodeCurveData<InterpolatedForwardCurve<BackwardFlat> >(curve, "ForwardCurve", result);
+        return result;
+    }
+
+}
+%}
+
+%inline %{
+    std::string _nodeCurveClass(const ext::shared_ptr<YieldTermStructure>& curve) {
+        return nodeCurveData(curve).name;
+    }
+
+    std::vector<Date> _nodeCurveDates(const ext::shared_ptr<YieldTermStructure>& curve) {
+        return nodeCurveData(curve).dates;
+    }
+
+    std::vector<Real> _nodeCurveData(const ext::shared_ptr<YieldTermStructure>& curve) {
+        return nodeCurveData(curve).data;
+    }
+
+    ext::shared_ptr<FlatForward> _asFlatForward(
+        const ext::shared_ptr<YieldTermStructure>& curve) {
+        return ext::dynamic_pointer_cast<FlatForward>(curve);
+    }
+
+    // "overnight" or "ibor" if the index is described by the arguments
+    // of the OvernightIndex or IborIndex constructor, empty otherwise
+    std::string _iborIndexKind(const ext::shared_ptr<IborIndex>& index) {
+        if (ext::dynamic_pointer_cast<Libor>(index) ||
+            ext::dynamic_pointer_cast<DailyTenorLibor>(index))
+            return "";
+        if (ext::dynamic_pointer_cast<OvernightIndex>(index))
+            return "overnight";
+        return "ibor";
+    }
+%}
+
+%pythoncode %{
+def _reduceSimpleQuote(self):
+    if not self.isValid():
+        return (SimpleQuote, ())
+    return (SimpleQuote, (self.value(),))
+
+
+def _reduceVector(self):
+    return (type(self), (list(self),))
+
+
+def _refusePickling(self):
+    raise TypeError(
+        "%s objects cannot be pickled; see the notes in pickle.i for "
+        "the classes that can" % type(self).__name__)
+
+
+_picklableVectors = (
+    IntVector, NaturalVector, BigNaturalVector, DoubleVector, StrVector,
+    BoolVector, DoubleVectorVector, DoubleVectorVectorVector,
+    DateVector, PeriodVector, MatrixVector, MatrixVectorVector)
+
+
+_namedInstances = {}
+
+
+def _namedInstance(base, name, extraArguments=()):
+    # the wrapped subclasses of base are built without arguments, from
+    # each of their enumeration values and from the extra arguments,
+    # and the constructor arguments are stored by the name of the result
+    # (the code for currencies)
+    key = Currency.code if base is Currency else base.name
+    if base not in _namedInstances:
+        instances = {}
+        for cls in list(globals().values()):
+            if not isinstance(cls, type) or not issubclass(cls, base) or \
+                    cls is base or cls is BespokeCalendar:
+                continue
+            candidates = [()] + [
+                (v,) for v in vars(cls).values() if type(v) is int]
+            for args in candidates + list(extraArguments):
+                try:
+                    instanceName = key(cls(*args))
+                except Exception:
+                    continue
+                instances.setdefault(instanceName, (cls, args))
+        _namedInstances[base] = instances
+    if name not in _namedInstances[base]:
+        return None
+    cls, args = _namedInstances[base][name]
+    return cls(*args)
+
+
+def _calendar(name, addedHolidays=(), removedHolidays=()):
+    calendar = _namedInstance(Calendar, name)
+    for d in addedHolidays:
+        calendar.addHoliday(d)
+    for d in removedHolidays:
+        calendar.removeHoliday(d)
+    return calendar
+
+
+def _reduceCalendar(self):
+    if self.empty():
+        return (Calendar, ())
+    if _namedInstance(Calendar, self.name()) is None:
+        raise TypeError(
+            "the %s calendar cannot be pickled; only the calendars of "
+            "the wrapped markets can" % self.name())
+    return (_calendar, (self.name(),
+                        list(self.addedHolidays()),
+                        list(self.removedHolidays())))
+
+
+def _dayCounter(name):
+    return _namedInstance(DayCounter, name, [(True,)])
+
+
+def _reduceDayCounter(self):
+    if self.empty():
+        return (DayCounter, ())
+    name = self.name()
+    if _dayCounter(name) is not None:
+        return (_dayCounter, (name,))
+    if name.startswith('Business/252(') and name.endswith(')'):
+        calendar = _namedInstance(Calendar, name[len('Business/252('):-1])
+        if calendar is not None:
+            return (Business252, (calendar,))
+    raise TypeError("the %s day counter cannot be pickled" % name)
+
+
+def _currency(code):
+    return _namedInstance(Currency, code)
+
+
+def _reduceCurrency(self):
+    if self.empty():
+        return (Currency, ())
+    if _namedInstance(Currency, self.code()) is None:
+        raise TypeError("the %s currency cannot be pickled" % self.code())
+    return (_currency, (self.code(),))
+
+
+def _reduceSchedule(self):
+    if self.empty():
+        return (Schedule, ())
+    return (Schedule, (
+        list(self.dates()),
+        self.calendar(),
+        self.businessDayConvention(),
+        self.terminationDateBusinessDayConvention()
+        if self.hasTerminationDateBusinessDayConvention() else None,
+        self.tenor() if self.hasTenor() else None,
+        self.rule() if self.hasRule() else None,
+        self.endOfMonth() if self.hasEndOfMonth() else None,
+        list(self.isRegular()) if self.hasIsRegular() else []))
+
+
+def _yieldCurve(cls, args, allowsExtrapolation):
+    curve = cls(*args)
+    if allowsExtrapolation:
+        curve.enableExtrapolation()
+    return curve
+
+
+def _reduceYieldTermStructure(self):
+    flatForward = _asFlatForward(self)
+    if flatForward is not None:
+        compounding = flatForward.compounding()
+        frequency = flatForward.compoundingFrequency()
+        rate = flatForward.zeroRate(1.0, compounding, frequency, True).rate()
+        try:
+            anchor = (flatForward.settlementDays(), flatForward.calendar())
+        except RuntimeError:
+            anchor = (flatForward.referenceDate(),)
+        return (_yieldCurve, (
+            FlatForward,
+            anchor + (rate, flatForward.dayCounter(), compounding, frequency),
+            flatForward.allowsExtrapolation()))
+
+    if len(self.jumpDates()) > 0:
+        raise TypeError("curves with jumps cannot be pickled")
+    name = _nodeCurveClass(self)
+    if not name:
+        raise TypeError(
+            "%s objects cannot be pickled; only FlatForward and curves "
+            "on the nodes of a wrapped interpolated curve can" %
+            type(self).__name__)
+    return (_yieldCurve, (
+        globals()[name],
+        (list(_nodeCurveDates(self)), list(_nodeCurveData(self)),
+         self.dayCounter(), self.calendar()),
+        self.allowsExtrapolation()))
+
+
+def _reduceHandle(self):
+    if self.empty():
+        return (type(self), ())
+    return (type(self), (self.currentLink(),))
+
+
+def _reduceIborIndex(self):
+    kind = _iborIndexKind(self)
+    if kind == 'overnight':
+        return (OvernightIndex, (
+            self.familyName(), self.fixingDays(), self.currency(),
+            self.fixingCalendar(), self.dayCounter(),
+            self.forwardingTermStructure()))
+    if kind == 'ibor':
+        return (IborIndex, (
+            self.familyName(), self.tenor(), self.fixingDays(),
+            self.currency(), self.fixingCalendar(),
+            self.businessDayConvention(), self.endOfMonth(),
+            self.dayCounter(), self.forwardingTermStructure()))
+    raise TypeError("the %s index cannot be pickled" % self.name())
+
+
+def _reduceFixedRateBond(self):
+    if '_constructorArgs' not in self.__dict__:
+        raise TypeError(
+            "only fixed-rate bonds built from Python can be pickled")
+    return (FixedRateBond, self._constructorArgs)
+
+
+def _reduceVanillaSwap(self):
+    return (VanillaSwap, (
+        self.type(), self.nominal(), self.fixedSchedule(),
+        self.fixedRate(), self.fixedDayCount(), self.floatingSchedule(),
+        self.iborIndex(), self.spread(), self.floatingDayCount(),
+        self.paymentConvention()))
+
+
+def _enablePickling(namespace):
+    SimpleQuote.__reduce__ = _reduceSimpleQuote
+    for cls in _picklableVectors:
+        cls.__reduce__ = _reduceVector
+    Calendar.__reduce__ = _reduceCalendar
+    DayCounter.__reduce__ = _reduceDayCounter
+    Currency.__reduce__ = _reduceCurrency
+    Schedule.__reduce__ = _reduceSchedule
+    YieldTermStructure.__reduce__ = _reduceYieldTermStructure
+    YieldTermStructureHandle.__reduce__ = _reduceHandle
+    RelinkableYieldTermStructureHandle.__reduce__ = _reduceHandle
+    IborIndex.__reduce__ = _reduceIborIndex
+    FixedRateBond.__reduce__ = _reduceFixedRateBond
+    VanillaSwap.__reduce__ = _reduceVanillaSwap
+    # subclasses of the classes above use their reduction
+    for cls in namespace.values():
+        if isinstance(cls, type) and hasattr(cls, 'thisown') and \
+                not any('__reduce__' in vars(base) for base in cls.__mro__[:-1]):
+            cls.__reduce__ = _refusePickling
+
+
+_enablePickling(globals())
+%}
+
+#endif
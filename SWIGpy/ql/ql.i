@@ -181,5 +181,8 @@
 %include ../ql/qlex/indexes/all.i
 %include ../ql/qlex/instruments/all.i
 %include ../ql/qlex/math/all.i
+%include ../ql/qlex/models/all.i
+%include ../ql/qlex/patterns/all.i
 %include ../ql/qlex/termstructures/yield/all.i
 %include ../ql/qlex/time/daycounters/all.i
+%include ../ql/pickle.i
@@ -10,6 +10,7 @@
 %{
 using QuantLib::ChinaFixingRepoCoupon;
 using QuantLib::ChinaFixingRepoCouponPricer;
+using QuantLib::ChinaFixingRepoScheduleCache;
 %}
 
 %shared_ptr(ChinaFixingRepoCoupon)
@@ -35,6 +36,27 @@ class ChinaFixingRepoCoupon : public FloatingRateCoupon {
 
 %shared_ptr(ChinaFixingRepoCouponPricer)
 class ChinaFixingRepoCouponPricer : public FloatingRateCouponPricer {
+  public:
+    Size fixedPartCalculations() const;
+};
+
+%inline %{
+    ext::shared_ptr<ChinaFixingRepoCouponPricer> as_china_fixing_repo_coupon_pricer(
+        const ext::shared_ptr<FloatingRateCouponPricer>& p) {
+        return ext::dynamic_pointer_cast<ChinaFixingRepoCouponPricer>(p);
+    }
+%}
+
+class ChinaFixingRepoScheduleCache {
+  private:
+    ChinaFixingRepoScheduleCache();
+  public:
+    static ChinaFixingRepoScheduleCache& instance();
+    Size size() const;
+    Size hits() const;
+    Size capacity() const;
+    void setCapacity(Size capacity);
+    void clear();
 };
 
 #endif
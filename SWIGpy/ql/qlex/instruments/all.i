@@ -6,10 +6,13 @@
 %include ../ql/alltypes.i
 %include ../ql/base.i
 %include ../ql/instruments/Swap.i
+%include ../ql/linearalgebra.i
+%include ../ql/qlex/patterns/threads.i
 
 %{
 using QuantLib::ChinaFixingRepoSwap;
 using QuantLib::MakeChinaFixingRepoSwap;
+using QuantLib::PortfolioPricer;
 %}
 
 %shared_ptr(ChinaFixingRepoSwap)
@@ -85,4 +88,28 @@ class MakeChinaFixingRepoSwap {
         const ext::shared_ptr<PricingEngine>& engine);
 };
 
+class PortfolioPricer {
+  public:
+    PortfolioPricer(Size threads = 0);
+    Size threads() const;
+    static bool concurrent();
+    const Array& NPVs() const;
+    const std::vector<std::string>& errors() const;
+    Size failures() const;
+    Size groups() const;
+    %extend {
+        void calculate(
+            const std::vector<ext::shared_ptr<Instrument>>& instruments) {
+            // a serial run keeps the GIL, so that engines and term
+            // structures may call back into Python
+            if (self->threads() <= 1) {
+                self->calculate(instruments);
+                return;
+            }
+            // the GIL is released while the instruments are priced
+            runWithoutGIL([&]() { self->calculate(instruments); });
+        }
+    }
+};
+
 #endif
@@ -5,22 +5,176 @@
 %include ../ql/common.i
 %include ../ql/alltypes.i
 %include ../ql/base.i
+%include ../ql/linearalgebra.i
+%include ../ql/randomnumbers.i
+%include ../ql/interpolation/SafeInterpolation.i
+%include ../ql/qlex/patterns/threads.i
 
 %{
 using QuantLib::CubicSpline;
+using QuantLib::Expression;
 using QuantLib::QuadraticSpline;
+using QuantLib::StreamingStatistics;
+%}
+
+%inline %{
+    // the GIL is released while the threads fill the block
+    Matrix sobolSequences(
+        Size dimensionality,
+        Size start,
+        Size n,
+        unsigned long seed = 0,
+        SobolRsg::DirectionIntegers directionIntegers = SobolRsg::Jaeckel,
+        Size threads = 0) {
+        return callWithoutGIL([&]() {
+            return QuantLib::sobolSequences(
+                dimensionality, start, n, seed, directionIntegers, threads);
+        });
+    }
 %}
 
 class CubicSpline {
   public:
     CubicSpline(const std::vector<Real>& knots);
     Real operator()(Natural i, Real x) const;
+    Size size() const;
+    %extend {
+        // values of all basis functions at x
+        Array values(Real x) const {
+            Array result(self->size());
+            self->values(x, result.begin());
+            return result;
+        }
+    }
+};
+
+%template(InterpolationVector) std::vector<ext::shared_ptr<Interpolation>>;
+
+class Expression {
+  public:
+    Expression(
+        const std::string& formula,
+        const std::vector<std::string>& variables);
+    %extend {
+        // the interpolations can be used as functions of the given names
+        Expression(
+            const std::string& formula,
+            const std::vector<std::string>& variables,
+            const std::vector<std::string>& functionNames,
+            const std::vector<ext::shared_ptr<Interpolation>>& functions) {
+            QL_REQUIRE(functionNames.size() == functions.size(),
+                       "function names/functions size mismatch");
+            std::vector<Expression::Function> f(functions.size());
+            for (Size i = 0; i < functions.size(); ++i) {
+                QL_REQUIRE(functions[i], "null interpolation given");
+                f[i].name = functionNames[i];
+                // SafeInterpolation hides the non-virtual operator()
+                ext::shared_ptr<SafeInterpolation> safe =
+                    ext::dynamic_pointer_cast<SafeInterpolation>(functions[i]);
+                if (safe) {
+                    f[i].value = [safe](Real x) { return (*safe)(x); };
+                    f[i].derivative = [safe](Real x) { return safe->derivative(x); };
+                } else {
+                    ext::shared_ptr<Interpolation> interpolation = functions[i];
+                    f[i].value = [interpolation](Real x) { return (*interpolation)(x); };
+                    f[i].derivative = [interpolation](Real x) {
+                        return interpolation->derivative(x);
+                    };
+                }
+            }
+            return new Expression(formula, variables, f);
+        }
+    }
+    const std::string& formula() const;
+    const std::vector<std::string>& variables() const;
+    Size arity() const;
+    Size size() const;
+    Real operator()(Real x) const;
+    Real operator()(Real x, Real y) const;
+    Real operator()(const std::vector<Real>& x) const;
+    Real derivative(Real x) const;
+    Real derivative(const std::vector<Real>& x, Size i) const;
+    %extend {
+        Real __call__() const {
+            return (*self)();
+        }
+        // values at the columns of x, one row per variable
+        Array values(const Matrix& x) const {
+            QL_REQUIRE(x.rows() == self->arity(),
+                       self->arity() << " rows required, "
+                       << x.rows() << " given");
+            Array result(x.columns());
+            std::vector<Real> point(x.rows());
+            for (Size j = 0; j < x.columns(); ++j) {
+                for (Size i = 0; i < x.rows(); ++i)
+                    point[i] = x[i][j];
+                result[j] = (*self)(point.data());
+            }
+            return result;
+        }
+    }
 };
 
 class QuadraticSpline {
   public:
     QuadraticSpline(const std::vector<Real>& knots);
     Real operator()(Natural i, Real x) const;
+    Size size() const;
+    %extend {
+        // values of all basis functions at x
+        Array values(Real x) const {
+            Array result(self->size());
+            self->values(x, result.begin());
+            return result;
+        }
+    }
+};
+
+class StreamingStatistics {
+  public:
+    StreamingStatistics(Real compression = 200.0);
+    Size samples() const;
+    Real weightSum() const;
+    Real mean() const;
+    Real variance() const;
+    Real standardDeviation() const;
+    Real errorEstimate() const;
+    Real skewness() const;
+    Real kurtosis() const;
+    Real min() const;
+    Real max() const;
+    Real compression() const;
+    Size centroids() const;
+    Real percentile(Real y) const;
+    Real topPercentile(Real y) const;
+    Real valueAtRisk(Real p) const;
+    Real expectedShortfall(Real p) const;
+    void add(Real value, Real weight = 1.0);
+    %extend {
+        void addSequence(const Array& values) {
+            self->addSequence(values.begin(), values.end());
+        }
+        void addSequence(const Array& values,
+                         const Array& weights) {
+            QL_REQUIRE(values.size() == weights.size(),
+                       "values/weights size mismatch");
+            self->addSequence(
+                values.begin(), values.end(), weights.begin());
+        }
+    }
+    void merge(const StreamingStatistics& other);
+    void reset();
+    Array state() const;
+    void restore(const Array& state);
+
+    %pythoncode %{
+    def __reduce__(self):
+        return (StreamingStatistics, (self.compression(),),
+                self.state().view().tolist())
+
+    def __setstate__(self, state):
+        self.restore(Array(state))
+    %}
 };
 
 #endif
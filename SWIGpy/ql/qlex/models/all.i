@@ -0,0 +1,43 @@
+#ifndef qlex_models_all
+#define qlex_models_all
+
+%include ../ql/types.i
+%include ../ql/common.i
+%include ../ql/alltypes.i
+%include ../ql/base.i
+%include ../ql/linearalgebra.i
+%include ../ql/optimizers.i
+
+%{
+using QuantLib::ParallelCalibration;
+%}
+
+// The GIL stays held during the calibration, since constraints and
+// optimization methods may be implemented in Python; the helpers are
+// evaluated by native threads, which do not need it.  Unless QuantLib
+// was built with thread-safe observers, concurrent() returns False and
+// the helpers are evaluated serially whatever the number of threads;
+// threads() reports the number actually used.
+class ParallelCalibration {
+  public:
+    ParallelCalibration(Size threads = 0);
+    void calibrate(
+        const ext::shared_ptr<CalibratedModel>& model,
+        const std::vector<ext::shared_ptr<CalibrationHelper>>& helpers,
+        OptimizationMethod& method,
+        const EndCriteria& endCriteria,
+        const Constraint& constraint = Constraint(),
+        const std::vector<Real>& weights = std::vector<Real>(),
+        const std::vector<bool>& fixParameters = std::vector<bool>());
+    Size threads() const;
+    static bool concurrent();
+    EndCriteria::Type endCriteria() const;
+    const Array& problemValues() const;
+    Integer functionEvaluation() const;
+    Size groups() const;
+    const std::vector<Real>& evaluationTimes() const;
+    const std::vector<Real>& helperTimes() const;
+    Real totalTime() const;
+};
+
+#endif
@@ -0,0 +1,92 @@
+#ifndef qlex_patterns_all
+#define qlex_patterns_all
+
+%include ../ql/types.i
+%include ../ql/common.i
+%include ../ql/alltypes.i
+%include ../ql/base.i
+%include ../ql/linearalgebra.i
+%include ../ql/vectors.i
+%include ../ql/settings.i
+%include ../ql/indexes/all.i
+
+%{
+using QuantLib::ThreadKey;
+using QuantLib::currentSession;
+using QuantLib::setCurrentSession;
+using QuantLib::sessionsEnabled;
+using QuantLib::acquireSession;
+using QuantLib::releaseSession;
+using QuantLib::setQuoteValues;
+using QuantLib::NotificationCounter;
+%}
+
+typedef Size ThreadKey;
+
+ThreadKey currentSession();
+void setCurrentSession(ThreadKey id);
+bool sessionsEnabled();
+ThreadKey acquireSession(bool copyFixings = false);
+void releaseSession(ThreadKey id);
+
+%pythoncode %{
+class Session(object):
+    """Runs the calling thread in a QuantLib session of its own.
+
+    Within the with block, Settings.instance() and IndexManager.instance()
+    on the calling thread are the instances of the session, so that
+    several threads can price with different evaluation dates and
+    fixings at the same time.  The session starts with default settings
+    and no fixings, unless copyFixings is true; on exit, the thread goes
+    back to its previous session and the session is reused by later ones.
+
+    Objects built inside the block observe the evaluation date of the
+    session and must not be used outside of it.  QuantLib must be built
+    with QL_ENABLE_SESSIONS.
+    """
+
+    def __init__(self, evaluationDate=None, copyFixings=False):
+        self.evaluationDate = evaluationDate
+        self.copyFixings = copyFixings
+        self._id = None
+
+    def __enter__(self):
+        if not sessionsEnabled():
+            raise RuntimeError(
+                "QuantLib was built without QL_ENABLE_SESSIONS")
+        if self._id is not None:
+            raise RuntimeError("session already entered")
+        self._id = acquireSession(self.copyFixings)
+        self._previous = currentSession()
+        setCurrentSession(self._id)
+        if self.evaluationDate is not None:
+            Settings.instance().evaluationDate = self.evaluationDate
+        return self
+
+    def __exit__(self, *exc):
+        setCurrentSession(self._previous)
+        releaseSession(self._id)
+        self._id = None
+        return False
+%}
+
+%template(ObservableVector) std::vector<ext::shared_ptr<Observable>>;
+
+Size setQuoteValues(
+    const std::vector<ext::shared_ptr<Quote>>& quotes,
+    const Array& values,
+    const std::vector<ext::shared_ptr<Observable>>& held =
+        std::vector<ext::shared_ptr<Observable>>());
+
+class NotificationCounter {
+  public:
+    NotificationCounter();
+    void registerWith(const ext::shared_ptr<Observable>& observable);
+    void unregisterWithAll();
+    Size observables() const;
+    Size notifications() const;
+    Size notifiedObservables() const;
+    void reset();
+};
+
+#endif
@@ -0,0 +1,31 @@
+#ifndef qlex_patterns_threads
+#define qlex_patterns_threads
+
+%{
+// runs f with the GIL released; its errors are rethrown once the GIL
+// is taken back.  f must not call back into Python.
+template <class F>
+void runWithoutGIL(const F& f) {
+    std::string error;
+    Py_BEGIN_ALLOW_THREADS
+    try {
+        f();
+    } catch (std::exception& e) {
+        error = e.what();
+    } catch (...) {
+        error = "unknown error";
+    }
+    Py_END_ALLOW_THREADS
+    QL_REQUIRE(error.empty(), error);
+}
+
+// same as above, returning the result of f
+template <class F>
+auto callWithoutGIL(const F& f) -> decltype(f()) {
+    decltype(f()) result;
+    runWithoutGIL([&]() { result = f(); });
+    return result;
+}
+%}
+
+#endif
@@ -6,6 +6,7 @@
 %include ../ql/alltypes.i
 %include ../ql/base.i
 %include ../ql/termstructures/yieldtermstructures/fittingmethods.i
+%include ../ql/termstructures/yieldtermstructures/all.i
 
 %{
 using QuantLib::AdjustedSvenssonFitting;
@@ -14,7 +15,9 @@ using QuantLib::BlissFitting;
 using QuantLib::CubicSplinesFitting;
 using QuantLib::DieboldLiFitting;
 using QuantLib::QuadraticSplinesFitting;
+using QuantLib::LeastSquaresBondFitter;
 using QuantLib::ChinaFixingRepoSwapRateHelper;
+using QuantLib::SnapshotYieldTermStructure;
 %}
 
 class AdjustedSvenssonFitting : public FittingMethod {
@@ -56,6 +59,9 @@ class CubicSplinesFitting : public FittingMethod {
         const Array& weights,
         const Array& l2);
     Real basisFunction(Integer i, Time t) const;
+    Array basisFunctions(Time t) const;
+    Array discountGradient(const Array& x, Time t) const;
+    bool linearInParameters() const;
     static std::vector<Time> autoKnots(const std::vector<Time>& maturities);
 };
 
@@ -71,6 +77,8 @@ class DieboldLiFitting : public FittingMethod {
         const Array& weights,
         const Array& l2);
     Real kappa() const;
+    Array discountGradient(const Array& x, Time t) const;
+    bool linearInParameters() const;
 };
 
 class QuadraticSplinesFitting : public FittingMethod {
@@ -85,9 +93,28 @@ class QuadraticSplinesFitting : public FittingMethod {
         const Array& weights,
         const Array& l2);
     Real basisFunction(Integer i, Time t) const;
+    Array basisFunctions(Time t) const;
+    Array discountGradient(const Array& x, Time t) const;
+    bool linearInParameters() const;
     static std::vector<Time> autoKnots(const std::vector<Time>& maturities);
 };
 
+class LeastSquaresBondFitter {
+  public:
+    LeastSquaresBondFitter(
+        Size maxIterations = 20,
+        Real accuracy = 1.0e-10);
+    ext::shared_ptr<FittedBondDiscountCurve> fit(
+        const Date& referenceDate,
+        const std::vector<ext::shared_ptr<BondHelper>>& helpers,
+        const DayCounter& dayCounter,
+        const FittingMethod& fittingMethod,
+        const Array& guess = Array());
+    const Array& solution() const;
+    Size numberOfIterations() const;
+    Real minimumCostValue() const;
+};
+
 %shared_ptr(ChinaFixingRepoSwapRateHelper)
 class ChinaFixingRepoSwapRateHelper : public BootstrapHelper<YieldTermStructure> {
   public:
@@ -110,4 +137,100 @@ class ChinaFixingRepoSwapRateHelper : public BootstrapHelper<YieldTermStructure>
     ext::shared_ptr<ChinaFixingRepoSwap> swap() const;
 };
 
+%shared_ptr(SnapshotYieldTermStructure)
+class SnapshotYieldTermStructure : public YieldTermStructure {
+  public:
+    SnapshotYieldTermStructure(
+        ext::shared_ptr<YieldTermStructure> snapshot,
+        ext::shared_ptr<YieldTermStructure> live = ext::shared_ptr<YieldTermStructure>());
+    bool usesSnapshot() const;
+    const ext::shared_ptr<YieldTermStructure>& snapshot() const;
+    const ext::shared_ptr<YieldTermStructure>& live() const;
+};
+
+%pythoncode %{
+import struct as _struct
+import sys as _sys
+from array import array as _array
+
+_curveSnapshotMagic = b'QLCURVE2'
+_curveSnapshotHeader = _struct.Struct('<8sQQQ')
+
+
+def saveCurveSnapshot(curve, path):
+    """Write the nodes of a piecewise curve to a binary file.
+
+    The file holds a fixed header, the curve class name and day counter
+    name as ASCII strings, and the node serial numbers and values as
+    little-endian int64 and float64 arrays.
+    """
+    dates = curve.dates()
+    serials = _array('q', [d.serialNumber() for d in dates])
+    values = _array('d', curve.data())
+    name = type(curve).__name__.encode('ascii')
+    dayCounter = curve.dayCounter().name().encode('ascii')
+    if _sys.byteorder == 'big':
+        serials.byteswap()
+        values.byteswap()
+    padding = -(len(name) + len(dayCounter)) % 8
+    with open(path, 'wb') as f:
+        f.write(_curveSnapshotHeader.pack(
+            _curveSnapshotMagic, len(serials), len(name), len(dayCounter)))
+        f.write(name)
+        f.write(dayCounter)
+        f.write(b'\0' * padding)
+        f.write(serials.tobytes())
+        f.write(values.tobytes())
+
+
+def loadCurveSnapshot(path, template, attach=True, interpolator=None):
+    """Memory-map a curve saved by saveCurveSnapshot.
+
+    The template is a piecewise curve of the saved class, typically built
+    on the live helpers; loading does not bootstrap it, and only its day
+    counter and calendar are used to rebuild the saved nodes. They are
+    interpolated with the given interpolator, or with a default one of
+    the template's interpolator type; pass the one the template was
+    built with if it has parameters. The result prices off the snapshot; if attach is true, it
+    switches to the template as soon as the latter is notified of a
+    change, so that the bootstrap only runs once a quote actually moves.
+    """
+    import mmap
+    with open(path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        magic, n, nameSize, dayCounterSize = \
+            _curveSnapshotHeader.unpack_from(buffer)
+        if magic != _curveSnapshotMagic:
+            raise ValueError("%s is not a curve snapshot" % path)
+        offset = _curveSnapshotHeader.size
+        name = buffer[offset:offset + nameSize].decode('ascii')
+        offset += nameSize
+        dayCounter = buffer[offset:offset + dayCounterSize].decode('ascii')
+        offset += dayCounterSize + (-(nameSize + dayCounterSize) % 8)
+        with memoryview(buffer) as view:
+            serials = _array('q', view[offset:offset + 8 * n].cast('q'))
+            values = _array('d', view[offset + 8 * n:offset + 16 * n].cast('d'))
+    if _sys.byteorder == 'big':
+        serials.byteswap()
+        values.byteswap()
+
+    if type(template).__name__ != name:
+        raise ValueError(
+            "snapshot of a %s cannot be loaded with a %s" %
+            (name, type(template).__name__))
+    if template.dayCounter().name() != dayCounter:
+        raise ValueError(
+            "snapshot with %s day counter cannot be loaded with %s" %
+            (dayCounter, template.dayCounter().name()))
+
+    nodes = (DateVector([Date(s) for s in serials]),
+             DoubleVector(values.tolist()))
+    if interpolator is None:
+        snapshot = template.interpolatedNodeCurve(*nodes)
+    else:
+        snapshot = template.interpolatedNodeCurve(*nodes, interpolator)
+    return SnapshotYieldTermStructure(
+        snapshot, template if attach else None)
+%}
+
 #endif
@@ -4,6 +4,7 @@
 %include ../ql/types.i
 %include ../ql/common.i
 %include ../ql/alltypes.i
+%include ../ql/linearalgebra.i
 
 %{
 using QuantLib::LecuyerUniformRng;
@@ -26,6 +27,20 @@ typedef QuantLib::PseudoRandom::urng_type UniformRandomGenerator;
 typedef QuantLib::PseudoRandom::ursg_type UniformRandomSequenceGenerator;
 %}
 
+%{
+// used in the nextSequences() methods of the sequence generators
+template <class RSG>
+Matrix nextSequences(const RSG& rsg, Size n) {
+    QL_REQUIRE(n > 0, "number of sequences must be positive");
+    Matrix result(n, rsg.dimension());
+    for (Size i = 0; i < n; ++i) {
+        const std::vector<Real>& x = rsg.nextSequence().value;
+        std::copy(x.begin(), x.end(), result.row_begin(i));
+    }
+    return result;
+}
+%}
+
 /************* Uniform number generators *************/
 
 class LecuyerUniformRng {
@@ -127,6 +142,20 @@ class GaussianRandomGenerator {
 	}
 };
 
+// adds nextSequences(n), drawing n sequences at once
+%define export_next_sequences(Name)
+%extend Name {
+    Matrix _nextSequences(Size n) const {
+        return nextSequences(*self, n);
+    }
+    %pythoncode %{
+    def nextSequences(self, n):
+        """n x dimension() float64 memoryview, one sequence per row"""
+        return self._nextSequences(n).view()
+    %}
+}
+%enddef
+
 /************* Uniform sequence generators *************/
 
 class HaltonRsg {
@@ -140,6 +169,7 @@ class HaltonRsg {
     const Sample<std::vector<Real>>& lastSequence() const;
     Size dimension() const;
 };
+export_next_sequences(HaltonRsg)
 
 class SobolRsg {
   public:
@@ -170,6 +200,7 @@ class SobolRsg {
         }
     }
 };
+export_next_sequences(SobolRsg)
 
 class SobolBrownianBridgeRsg {
   public:
@@ -183,6 +214,7 @@ class SobolBrownianBridgeRsg {
     const Sample<std::vector<Real>>& lastSequence() const;
     Size dimension() const;
 };
+export_next_sequences(SobolBrownianBridgeRsg)
 
 template <class RNG>
 class RandomSequenceGenerator {
@@ -197,6 +229,7 @@ class RandomSequenceGenerator {
     const Sample<std::vector<Real>>& lastSequence() const;
     Size dimension() const;
 };
+export_next_sequences(RandomSequenceGenerator)
 
 %template(LecuyerUniformRsg)          RandomSequenceGenerator<LecuyerUniformRng>;
 %template(KnuthUniformRsg)            RandomSequenceGenerator<KnuthUniformRng>;
@@ -211,6 +244,7 @@ class UniformRandomSequenceGenerator {
     const Sample<std::vector<Real>>& lastSequence() const;
     Size dimension() const;
 };
+export_next_sequences(UniformRandomSequenceGenerator)
 
 class UniformLowDiscrepancySequenceGenerator {
   public:
@@ -222,6 +256,7 @@ class UniformLowDiscrepancySequenceGenerator {
     const Sample<std::vector<Real>>& lastSequence() const;
     Size dimension() const;
 };
+export_next_sequences(UniformLowDiscrepancySequenceGenerator)
 
 /************* Gaussian sequence generators *************/
 
@@ -237,6 +272,7 @@ class InverseCumulativeRsg {
     const Sample<std::vector<Real>>& lastSequence() const;
     Size dimension() const;
 };
+export_next_sequences(InverseCumulativeRsg)
 
 
 %template(MoroInvCumulativeLecuyerGaussianRsg)          InverseCumulativeRsg<RandomSequenceGenerator<LecuyerUniformRng>, MoroInverseCumulativeNormal>;
@@ -262,6 +298,7 @@ class GaussianRandomSequenceGenerator {
     const Sample<std::vector<Real>>& lastSequence() const;
     Size dimension() const;
 };
+export_next_sequences(GaussianRandomSequenceGenerator)
 
 class GaussianLowDiscrepancySequenceGenerator {
   public:
@@ -271,5 +308,6 @@ class GaussianLowDiscrepancySequenceGenerator {
     const Sample<std::vector<Real>>& lastSequence() const;
     Size dimension() const;
 };
+export_next_sequences(GaussianLowDiscrepancySequenceGenerator)
 
 #endif
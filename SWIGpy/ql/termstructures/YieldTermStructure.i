@@ -5,6 +5,7 @@
 %include ../ql/common.i
 %include ../ql/alltypes.i
 %include ../ql/base.i
+%include ../ql/linearalgebra.i
 
 %{
 using QuantLib::YieldTermStructure;
@@ -44,6 +45,72 @@ class YieldTermStructure : public TermStructure {
         bool extrapolate = false) const;
     const std::vector<Date>& jumpDates() const;
     const std::vector<Time>& jumpTimes() const;
+    %extend {
+        Array discounts(
+            const Array& times, bool extrapolate = false) const {
+            Array result(times.size());
+            for (Size i = 0; i < times.size(); i++)
+                result[i] = self->discount(times[i], extrapolate);
+            return result;
+        }
+        Array discounts(
+            const std::vector<Date>& dates, bool extrapolate = false) const {
+            Array result(dates.size());
+            for (Size i = 0; i < dates.size(); i++)
+                result[i] = self->discount(dates[i], extrapolate);
+            return result;
+        }
+        Array zeroRates(
+            const std::vector<Date>& dates,
+            const DayCounter& resultDayCounter,
+            Compounding comp, Frequency freq = Annual,
+            bool extrapolate = false) const {
+            Array result(dates.size());
+            for (Size i = 0; i < dates.size(); i++)
+                result[i] = self->zeroRate(
+                    dates[i], resultDayCounter, comp, freq, extrapolate).rate();
+            return result;
+        }
+        Array zeroRates(
+            const Array& times,
+            Compounding comp, Frequency freq = Annual,
+            bool extrapolate = false) const {
+            Array result(times.size());
+            for (Size i = 0; i < times.size(); i++)
+                result[i] = self->zeroRate(
+                    times[i], comp, freq, extrapolate).rate();
+            return result;
+        }
+        Array forwardRates(
+            const std::vector<Date>& starts,
+            const std::vector<Date>& ends,
+            const DayCounter& resultDayCounter,
+            Compounding comp, Frequency freq = Annual,
+            bool extrapolate = false) const {
+            QL_REQUIRE(
+                starts.size() == ends.size(),
+                "start and end dates have different sizes");
+            Array result(starts.size());
+            for (Size i = 0; i < starts.size(); i++)
+                result[i] = self->forwardRate(
+                    starts[i], ends[i], resultDayCounter,
+                    comp, freq, extrapolate).rate();
+            return result;
+        }
+        Array forwardRates(
+            const Array& starts, const Array& ends,
+            Compounding comp, Frequency freq = Annual,
+            bool extrapolate = false) const {
+            QL_REQUIRE(
+                starts.size() == ends.size(),
+                "start and end times have different sizes");
+            Array result(starts.size());
+            for (Size i = 0; i < starts.size(); i++)
+                result[i] = self->forwardRate(
+                    starts[i], ends[i], comp, freq, extrapolate).rate();
+            return result;
+        }
+    }
 };
 
 %template(YieldTermStructureHandle) Handle<YieldTermStructure>;
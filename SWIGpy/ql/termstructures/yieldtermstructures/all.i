@@ -212,6 +212,22 @@ class Name : public YieldTermStructure, public LazyObject {
                         b.maxAttempts, b.maxFactor, b.minFactor,
                         b.dontThrow, b.dontThrowSteps));
             }
+        ext::shared_ptr<YieldTermStructure> interpolatedNodeCurve(
+            const std::vector<Date>& dates,
+            const std::vector<Real>& data,
+            const Interpolator& i = Interpolator()) const {
+                return QuantLib::interpolatedNodeCurve(*self, dates, data, i);
+            }
+        Matrix finiteDifferenceQuoteJacobian(
+            const std::vector<ext::shared_ptr<RateHelper>>& helpers,
+            Real bump = 1.0e-6) {
+                return QuantLib::finiteDifferenceQuoteJacobian(*self, helpers, bump);
+            }
+        Matrix finiteDifferenceNodeJacobian(
+            const std::vector<ext::shared_ptr<RateHelper>>& helpers,
+            Real bump = 1.0e-6) {
+                return QuantLib::finiteDifferenceNodeJacobian(*self, helpers, bump);
+            }
     }
     const std::vector<Date>& dates() const;
     const std::vector<Time>& times() const;
@@ -412,6 +428,22 @@ class Name : public YieldTermStructure, public LazyObject {
                             b.accuracy));
                 }
             }
+        ext::shared_ptr<YieldTermStructure> interpolatedNodeCurve(
+            const std::vector<Date>& dates,
+            const std::vector<Real>& data,
+            const Interpolator& i = Interpolator()) const {
+                return QuantLib::interpolatedNodeCurve(*self, dates, data, i);
+            }
+        Matrix finiteDifferenceQuoteJacobian(
+            const std::vector<ext::shared_ptr<RateHelper>>& helpers,
+            Real bump = 1.0e-6) {
+                return QuantLib::finiteDifferenceQuoteJacobian(*self, helpers, bump);
+            }
+        Matrix finiteDifferenceNodeJacobian(
+            const std::vector<ext::shared_ptr<RateHelper>>& helpers,
+            Real bump = 1.0e-6) {
+                return QuantLib::finiteDifferenceNodeJacobian(*self, helpers, bump);
+            }
     }
     const std::vector<Date>& dates() const;
     const std::vector<Time>& times() const;
@@ -540,6 +572,22 @@ class Name : public YieldTermStructure, public LazyObject {
                     Name::bootstrap_type(
                         b.localisation, b.forcePositive, b.accuracy));
             }
+        ext::shared_ptr<YieldTermStructure> interpolatedNodeCurve(
+            const std::vector<Date>& dates,
+            const std::vector<Real>& data,
+            const Interpolator& i = Interpolator()) const {
+                return QuantLib::interpolatedNodeCurve(*self, dates, data, i);
+            }
+        Matrix finiteDifferenceQuoteJacobian(
+            const std::vector<ext::shared_ptr<RateHelper>>& helpers,
+            Real bump = 1.0e-6) {
+                return QuantLib::finiteDifferenceQuoteJacobian(*self, helpers, bump);
+            }
+        Matrix finiteDifferenceNodeJacobian(
+            const std::vector<ext::shared_ptr<RateHelper>>& helpers,
+            Real bump = 1.0e-6) {
+                return QuantLib::finiteDifferenceNodeJacobian(*self, helpers, bump);
+            }
     }
     const std::vector<Date>& dates() const;
     const std::vector<Time>& times() const;
@@ -561,6 +609,116 @@ export_piecewise_curve_local(LocalPiecewiseConvexMonotoneZeroYield,      ZeroYie
 // SimpleZeroYield
 export_piecewise_curve_local(LocalPiecewiseConvexMonotoneSimpleZeroYield,      SimpleZeroYield,    ConvexMonotone);
 
+%define export_piecewise_curve_incremental(Name,Traits,Interpolator)
+%{
+typedef PiecewiseYieldCurve<Traits, Interpolator, QuantLib::IncrementalBootstrap> Name;
+%}
+
+%shared_ptr(Name)
+class Name : public YieldTermStructure, public LazyObject {
+  public:
+    %extend {
+        Name(
+            const Date& referenceDate,
+            const std::vector<ext::shared_ptr<RateHelper>>& instruments,
+            const DayCounter& dayCounter,
+            const std::vector<Handle<Quote>>& jumps,
+            const std::vector<Date>& jumpDates,
+            const Interpolator& i,
+            const IncrementalBootstrap& b = IncrementalBootstrap()) {
+                return new Name(
+                    referenceDate, instruments, dayCounter, jumps, jumpDates, i,
+                    Name::bootstrap_type(
+                        b.accuracy, b.minValue, b.maxValue,
+                        b.maxAttempts, b.maxFactor, b.minFactor,
+                        b.dontThrow, b.dontThrowSteps));
+            }
+     	Name(
+            const Date& referenceDate,
+            const std::vector<ext::shared_ptr<RateHelper>>& instruments,
+            const DayCounter& dayCounter,
+            const Interpolator& i,
+            const IncrementalBootstrap& b = IncrementalBootstrap()) {
+                return new Name(
+                    referenceDate, instruments, dayCounter, i,
+                    Name::bootstrap_type(
+                        b.accuracy, b.minValue, b.maxValue,
+                        b.maxAttempts, b.maxFactor, b.minFactor,
+                        b.dontThrow, b.dontThrowSteps));
+            }
+     	Name(
+            Natural settlementDays,
+            const Calendar& calendar,
+            const std::vector<ext::shared_ptr<RateHelper>>& instruments,
+            const DayCounter& dayCounter,
+            const std::vector<Handle<Quote>>& jumps,
+            const std::vector<Date>& jumpDates,
+            const Interpolator& i,
+            const IncrementalBootstrap& b = IncrementalBootstrap()) {
+                return new Name(
+                    settlementDays, calendar, instruments, dayCounter, jumps, jumpDates, i,
+                    Name::bootstrap_type(
+                        b.accuracy, b.minValue, b.maxValue,
+                        b.maxAttempts, b.maxFactor, b.minFactor,
+                        b.dontThrow, b.dontThrowSteps));
+            }
+     	Name(
+            Natural settlementDays,
+            const Calendar& calendar,
+            const std::vector<ext::shared_ptr<RateHelper>>& instruments,
+            const DayCounter& dayCounter,
+            const Interpolator& i,
+            const IncrementalBootstrap& b = IncrementalBootstrap()) {
+                return new Name(
+                    settlementDays, calendar, instruments, dayCounter, i,
+                    Name::bootstrap_type(
+                        b.accuracy, b.minValue, b.maxValue,
+                        b.maxAttempts, b.maxFactor, b.minFactor,
+                        b.dontThrow, b.dontThrowSteps));
+            }
+        Size lastRestartPillar() const {
+                return Name::bootstrap_type::lastRestartPillar(*self);
+            }
+        ext::shared_ptr<YieldTermStructure> interpolatedNodeCurve(
+            const std::vector<Date>& dates,
+            const std::vector<Real>& data,
+            const Interpolator& i = Interpolator()) const {
+                return QuantLib::interpolatedNodeCurve(*self, dates, data, i);
+            }
+        Matrix finiteDifferenceQuoteJacobian(
+            const std::vector<ext::shared_ptr<RateHelper>>& helpers,
+            Real bump = 1.0e-6) {
+                return QuantLib::finiteDifferenceQuoteJacobian(*self, helpers, bump);
+            }
+        Matrix finiteDifferenceNodeJacobian(
+            const std::vector<ext::shared_ptr<RateHelper>>& helpers,
+            Real bump = 1.0e-6) {
+                return QuantLib::finiteDifferenceNodeJacobian(*self, helpers, bump);
+            }
+    }
+    const std::vector<Date>& dates() const;
+    const std::vector<Time>& times() const;
+    const std::vector<Real>& data() const;
+    std::vector<std::pair<Date, Real>> nodes() const;
+};
+
+%enddef
+
+// only local interpolations, for which a restart reuses the earlier nodes
+
+// ForwardRate
+export_piecewise_curve_incremental(IncrementalPiecewiseBackwardFlatForward,  ForwardRate,    BackwardFlat);
+export_piecewise_curve_incremental(IncrementalPiecewiseForwardFlatForward,   ForwardRate,    ForwardFlat);
+export_piecewise_curve_incremental(IncrementalPiecewiseLinearForward,        ForwardRate,    Linear);
+
+// Discount
+export_piecewise_curve_incremental(IncrementalPiecewiseLinearDiscount,       Discount,    Linear);
+export_piecewise_curve_incremental(IncrementalPiecewiseLogLinearDiscount,    Discount,    LogLinear);
+
+// ZeroYield
+export_piecewise_curve_incremental(IncrementalPiecewiseLinearZeroYield,      ZeroYield,    Linear);
+export_piecewise_curve_incremental(IncrementalPiecewiseLogLinearZeroYield,   ZeroYield,    LogLinear);
+
 %shared_ptr(InterpolatedDiscountCurve<LogLinear>)
 %shared_ptr(InterpolatedDiscountCurve<MonotonicLogCubic>)
 %shared_ptr(InterpolatedDiscountCurve<SplineCubic>)
@@ -4,10 +4,12 @@
 %include ../ql/types.i
 %include ../ql/common.i
 %include ../ql/alltypes.i
+%include ../ql/linearalgebra.i
 
 %{
 using QuantLib::TimeSeries;
 using QuantLib::IntervalPrice;
+using QuantLib::ColumnarTimeSeries;
 %}
 
 template <class T, class Container = std::map<Date, T>>
@@ -83,4 +85,29 @@ class IntervalPrice {
 
 typedef RealTimeSeries VolatilityTimeSeries;
 
+class ColumnarTimeSeries {
+    %rename(__len__) size;
+  public:
+    ColumnarTimeSeries();
+    ColumnarTimeSeries(const Array& serials, const Array& values);
+    ColumnarTimeSeries(const std::vector<Date>& dates, const std::vector<Real>& values);
+    ColumnarTimeSeries(const TimeSeries<Real>& series);
+    Size size() const;
+    bool empty() const;
+    Date firstDate() const;
+    Date lastDate() const;
+    std::vector<Date> dates() const;
+    const Array& serials() const;
+    const Array& values() const;
+    Array values(const Array& serials) const;
+    TimeSeries<Real> timeSeries() const;
+    %extend {
+        doubleOrNull __getitem__(const Date& d) const {
+            return (*self)[d];
+        }
+    }
+};
+
+%template(ColumnarTimeSeriesVector) std::vector<ColumnarTimeSeries>;
+
 #endif
@@ -1,4 +1,3 @@
-#include <ql/time/schedule.hpp>
 #include <qlex/cashflows/ChinaFixingRepoCoupon.hpp>
 #include <qlex/cashflows/ChinaFixingRepoCouponPricer.hpp>
 #include <qlex/indexes/ChinaFixingRepo.hpp>
@@ -29,35 +28,9 @@ namespace QuantLib {
                          refPeriodEnd,
                          dayCounter,
                          false) {
-        using namespace std;
-
-        Schedule sch = MakeSchedule()
-                           .from(startDate)
-                           .to(endDate)
-                           .withTenor(chinaFixingRepo->tenor())
-                           .withCalendar(chinaFixingRepo->fixingCalendar())
-                           .withConvention(chinaFixingRepo->businessDayConvention())
-                           .forwards();
-
-        valueDates_ = sch.dates();
-
-        QL_ENSURE(valueDates_.size() >= 2, "degenerate schedule");
-
-        n_ = valueDates_.size() - 1;
-        if (chinaFixingRepo->fixingDays() == 0) {
-            fixingDates_ = vector<Date>(valueDates_.begin(), valueDates_.end() - 1);
-        } else {
-            fixingDates_.resize(n_);
-            for (Size i = 0; i < n_; ++i) {
-                fixingDates_[i] = chinaFixingRepo->fixingDate(valueDates_[i]);
-            }
-        }
-
-        dt_.resize(n_);
-        const DayCounter& dc = chinaFixingRepo->dayCounter();
-        for (Size i = 0; i < n_; ++i) {
-            dt_[i] = dc.yearFraction(valueDates_[i], valueDates_[i + 1]);
-        }
+        subPeriods_ = ChinaFixingRepoScheduleCache::instance().subPeriods(startDate, endDate,
+                                                                          *chinaFixingRepo);
+        n_ = subPeriods_->dt.size();
 
         setPricer(ext::shared_ptr<FloatingRateCouponPricer>(new ChinaFixingRepoCouponPricer));
     }
@@ -65,7 +38,7 @@ namespace QuantLib {
     const std::vector<Rate>& ChinaFixingRepoCoupon::indexFixings() const {
         fixings_.resize(n_);
         for (Size i = 0; i < n_; ++i) {
-            fixings_[i] = index_->fixing(fixingDates_[i]);
+            fixings_[i] = index_->fixing(subPeriods_->fixingDates[i]);
         }
         return fixings_;
     }
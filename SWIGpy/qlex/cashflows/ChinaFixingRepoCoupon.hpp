@@ -3,6 +3,7 @@
 
 #include <ql/cashflows/floatingratecoupon.hpp>
 #include <ql/time/daycounters/actual365fixed.hpp>
+#include <qlex/cashflows/ChinaFixingRepoScheduleCache.hpp>
 
 namespace QuantLib {
 
@@ -22,20 +23,20 @@ namespace QuantLib {
             const Date& refPeriodEnd = Date(),
             const DayCounter& dayCounter = Actual365Fixed(Actual365Fixed::Standard));
 
-        const std::vector<Date>& fixingDates() const { return fixingDates_; }
-        const std::vector<Time>& dt() const { return dt_; }
+        const std::vector<Date>& fixingDates() const { return subPeriods_->fixingDates; }
+        const std::vector<Time>& dt() const { return subPeriods_->dt; }
         const std::vector<Rate>& indexFixings() const;
-        const std::vector<Date>& valueDates() const { return valueDates_; }
+        const std::vector<Date>& valueDates() const { return subPeriods_->valueDates; }
 
-        Date fixingDate() const override { return fixingDates_.back(); }
+        Date fixingDate() const override { return subPeriods_->fixingDates.back(); }
 
         void accept(AcyclicVisitor&) override;
 
       private:
-        std::vector<Date> valueDates_, fixingDates_;
+        // shared with other coupons over the same period
+        ext::shared_ptr<const ChinaFixingRepoSubPeriods> subPeriods_;
         mutable std::vector<Rate> fixings_;
         Size n_;
-        std::vector<Time> dt_;
     };
 
 } // namespace QuantLib
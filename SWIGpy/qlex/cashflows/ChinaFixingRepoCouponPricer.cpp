@@ -1,3 +1,5 @@
+#include <ql/indexes/indexmanager.hpp>
+#include <ql/settings.hpp>
 #include <qlex/cashflows/ChinaFixingRepoCoupon.hpp>
 #include <qlex/cashflows/ChinaFixingRepoCouponPricer.hpp>
 #include <qlex/indexes/ChinaFixingRepo.hpp>
@@ -7,6 +9,16 @@ namespace QuantLib {
     void ChinaFixingRepoCouponPricer::initialize(const FloatingRateCoupon& coupon) {
         coupon_ = dynamic_cast<const ChinaFixingRepoCoupon*>(&coupon);
         QL_ENSURE(coupon_, "wrong coupon type");
+        // the cached fixed part only depends on the fixings and on the
+        // evaluation date; the index itself also forwards every
+        // notification of its forwarding curve
+        registerWith(IndexManager::instance().notifier(coupon_->index()->name()));
+        registerWith(Settings::instance().evaluationDate());
+    }
+
+    void ChinaFixingRepoCouponPricer::update() {
+        fixedPartValid_ = false;
+        FloatingRateCouponPricer::update();
     }
 
     Rate ChinaFixingRepoCouponPricer::swapletRate() const {
@@ -22,32 +34,43 @@ namespace QuantLib {
 
         Real compoundFactor = 1.0;
 
-        // already fixed part
         Date today = Settings::instance().evaluationDate();
-        while (i < n && fixingDates[i] < today) {
-            // rate must have been fixed
-            Rate pastFixing = IndexManager::instance().getHistory(index->name())[fixingDates[i]];
-            QL_REQUIRE(pastFixing != Null<Real>(),
-                       "Missing " << index->name() << " fixing for " << fixingDates[i]);
-            compoundFactor *= (1.0 + pastFixing * dt[i]);
-            ++i;
-        }
+        if (fixedPartValid_ && fixedPartCoupon_ == coupon_ && fixedPartIndex_ == index &&
+            fixedPartToday_ == today) {
+            i = fixedPeriods_;
+            compoundFactor = fixedCompoundFactor_;
+        } else if (n > 0 && fixingDates[0] <= today) {
+            const TimeSeries<Real>& history = IndexManager::instance().getHistory(index->name());
 
-        // today is a border case
-        if (i < n && fixingDates[i] == today) {
-            // might have been fixed
-            try {
-                Rate pastFixing =
-                    IndexManager::instance().getHistory(index->name())[fixingDates[i]];
+            // already fixed part
+            while (i < n && fixingDates[i] < today) {
+                // rate must have been fixed
+                Rate pastFixing = history[fixingDates[i]];
+                QL_REQUIRE(pastFixing != Null<Real>(),
+                           "Missing " << index->name() << " fixing for " << fixingDates[i]);
+                compoundFactor *= (1.0 + pastFixing * dt[i]);
+                ++i;
+            }
+
+            // today is a border case
+            if (i < n && fixingDates[i] == today) {
+                // might have been fixed
+                Rate pastFixing = history[fixingDates[i]];
                 if (pastFixing != Null<Real>()) {
                     compoundFactor *= (1.0 + pastFixing * dt[i]);
                     ++i;
                 } else {
                     ; // fall through and forecast
                 }
-            } catch (Error&) {
-                ; // fall through and forecast
             }
+
+            ++fixedPartCalculations_;
+            fixedPartValid_ = true;
+            fixedPartCoupon_ = coupon_;
+            fixedPartIndex_ = index;
+            fixedPartToday_ = today;
+            fixedPeriods_ = i;
+            fixedCompoundFactor_ = compoundFactor;
         }
 
         // forward part using telescopic property in order
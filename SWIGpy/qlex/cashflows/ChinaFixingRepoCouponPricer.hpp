@@ -19,8 +19,24 @@ namespace QuantLib {
         Real floorletPrice(Rate) const override { QL_FAIL("floorletPrice not available"); }
         Rate floorletRate(Rate) const override { QL_FAIL("floorletRate not available"); }
 
+        void update() override;
+
+        //! number of times the compound factor of the fixed sub-periods was computed
+        Size fixedPartCalculations() const { return fixedPartCalculations_; }
+
       protected:
         const ChinaFixingRepoCoupon* coupon_;
+
+      private:
+        // compound factor of the sub-periods already fixed, valid for the
+        // cached coupon and evaluation date until a fixing is added
+        mutable bool fixedPartValid_ = false;
+        mutable const ChinaFixingRepoCoupon* fixedPartCoupon_ = nullptr;
+        mutable ext::shared_ptr<Index> fixedPartIndex_;
+        mutable Date fixedPartToday_;
+        mutable Size fixedPeriods_ = 0;
+        mutable Real fixedCompoundFactor_ = 1.0;
+        mutable Size fixedPartCalculations_ = 0;
     };
 } // namespace QuantLib
 
@@ -0,0 +1,119 @@
+#include <ql/time/schedule.hpp>
+#include <qlex/cashflows/ChinaFixingRepoScheduleCache.hpp>
+#include <qlex/indexes/ChinaFixingRepo.hpp>
+#include <tuple>
+
+namespace QuantLib {
+
+    bool ChinaFixingRepoScheduleCache::Key::operator<(const Key& other) const {
+        return std::tie(startDate, endDate, fixingDays, tenorLength, tenorUnits, convention,
+                        calendar, dayCounter) <
+               std::tie(other.startDate, other.endDate, other.fixingDays, other.tenorLength,
+                        other.tenorUnits, other.convention, other.calendar, other.dayCounter);
+    }
+
+    ChinaFixingRepoScheduleCache::ChinaFixingRepoScheduleCache() : capacity_(10000), hits_(0) {}
+
+    ext::shared_ptr<const ChinaFixingRepoSubPeriods>
+    ChinaFixingRepoScheduleCache::subPeriods(const Date& startDate,
+                                             const Date& endDate,
+                                             const ChinaFixingRepo& chinaFixingRepo) {
+        using namespace std;
+
+        Key key;
+        key.calendar = chinaFixingRepo.fixingCalendar().name();
+        key.dayCounter = chinaFixingRepo.dayCounter().name();
+        key.tenorLength = chinaFixingRepo.tenor().length();
+        key.tenorUnits = chinaFixingRepo.tenor().units();
+        key.convention = chinaFixingRepo.businessDayConvention();
+        key.fixingDays = chinaFixingRepo.fixingDays();
+        key.startDate = startDate;
+        key.endDate = endDate;
+
+        {
+            lock_guard<mutex> lock(mutex_);
+            auto i = index_.find(key);
+            if (i != index_.end()) {
+                entries_.splice(entries_.begin(), entries_, i->second);
+                ++hits_;
+                return i->second->second;
+            }
+        }
+
+        Schedule sch = MakeSchedule()
+                           .from(startDate)
+                           .to(endDate)
+                           .withTenor(chinaFixingRepo.tenor())
+                           .withCalendar(chinaFixingRepo.fixingCalendar())
+                           .withConvention(chinaFixingRepo.businessDayConvention())
+                           .forwards();
+
+        auto p = ext::make_shared<ChinaFixingRepoSubPeriods>();
+        p->valueDates = sch.dates();
+
+        QL_ENSURE(p->valueDates.size() >= 2, "degenerate schedule");
+
+        Size n = p->valueDates.size() - 1;
+        if (chinaFixingRepo.fixingDays() == 0) {
+            p->fixingDates = vector<Date>(p->valueDates.begin(), p->valueDates.end() - 1);
+        } else {
+            p->fixingDates.resize(n);
+            for (Size i = 0; i < n; ++i) {
+                p->fixingDates[i] = chinaFixingRepo.fixingDate(p->valueDates[i]);
+            }
+        }
+
+        p->dt.resize(n);
+        const DayCounter& dc = chinaFixingRepo.dayCounter();
+        for (Size i = 0; i < n; ++i) {
+            p->dt[i] = dc.yearFraction(p->valueDates[i], p->valueDates[i + 1]);
+        }
+
+        lock_guard<mutex> lock(mutex_);
+        auto i = index_.find(key);
+        if (i != index_.end()) {
+            ++hits_;
+            return i->second->second; // added meanwhile by another thread
+        }
+        entries_.emplace_front(key, p);
+        index_[key] = entries_.begin();
+        trim();
+        return p;
+    }
+
+    Size ChinaFixingRepoScheduleCache::size() const {
+        std::lock_guard<std::mutex> lock(mutex_);
+        return entries_.size();
+    }
+
+    Size ChinaFixingRepoScheduleCache::hits() const {
+        std::lock_guard<std::mutex> lock(mutex_);
+        return hits_;
+    }
+
+    Size ChinaFixingRepoScheduleCache::capacity() const {
+        std::lock_guard<std::mutex> lock(mutex_);
+        return capacity_;
+    }
+
+    void ChinaFixingRepoScheduleCache::setCapacity(Size capacity) {
+        std::lock_guard<std::mutex> lock(mutex_);
+        capacity_ = capacity;
+        trim();
+    }
+
+    void ChinaFixingRepoScheduleCache::clear() {
+        std::lock_guard<std::mutex> lock(mutex_);
+        entries_.clear();
+        index_.clear();
+        hits_ = 0;
+    }
+
+    void ChinaFixingRepoScheduleCache::trim() {
+        while (entries_.size() > capacity_) {
+            index_.erase(entries_.back().first);
+            entries_.pop_back();
+        }
+    }
+
+} // namespace QuantLib
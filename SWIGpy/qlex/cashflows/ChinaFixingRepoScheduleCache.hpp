@@ -0,0 +1,75 @@
+#ifndef ChinaFixingRepoScheduleCache_HPP
+#define ChinaFixingRepoScheduleCache_HPP
+
+#include <ql/patterns/singleton.hpp>
+#include <ql/shared_ptr.hpp>
+#include <ql/time/businessdayconvention.hpp>
+#include <ql/time/date.hpp>
+#include <list>
+#include <map>
+#include <mutex>
+#include <string>
+#include <vector>
+
+namespace QuantLib {
+
+    class ChinaFixingRepo;
+
+    //! compounding sub-periods of a ChinaFixingRepoCoupon
+    struct ChinaFixingRepoSubPeriods {
+        std::vector<Date> valueDates, fixingDates;
+        std::vector<Time> dt;
+    };
+
+    //! LRU cache of ChinaFixingRepoCoupon sub-periods
+    /*! Coupons, legs and swap rate helpers over the same accrual period
+        share the value dates, fixing dates and year fractions built from
+        the index schedule instead of regenerating them.
+
+        Entries are keyed by the index calendar, tenor, business-day
+        convention, fixing days, day counter and the accrual dates.
+        Calendars and day counters are identified by name, so clear()
+        must be called after adding or removing calendar holidays.
+    */
+    class ChinaFixingRepoScheduleCache : public Singleton<ChinaFixingRepoScheduleCache> {
+        friend class Singleton<ChinaFixingRepoScheduleCache>;
+
+      private:
+        ChinaFixingRepoScheduleCache();
+
+      public:
+        ext::shared_ptr<const ChinaFixingRepoSubPeriods>
+        subPeriods(const Date& startDate,
+                   const Date& endDate,
+                   const ChinaFixingRepo& chinaFixingRepo);
+
+        Size size() const;
+        //! number of lookups served from the cache since the last clear()
+        Size hits() const;
+        Size capacity() const;
+        void setCapacity(Size capacity);
+        void clear();
+
+      private:
+        struct Key {
+            std::string calendar, dayCounter;
+            Integer tenorLength;
+            TimeUnit tenorUnits;
+            BusinessDayConvention convention;
+            Natural fixingDays;
+            Date startDate, endDate;
+            bool operator<(const Key& other) const;
+        };
+        typedef std::pair<Key, ext::shared_ptr<const ChinaFixingRepoSubPeriods> > Entry;
+
+        void trim();
+
+        Size capacity_, hits_;
+        std::list<Entry> entries_; // most recently used first
+        std::map<Key, std::list<Entry>::iterator> index_;
+        mutable std::mutex mutex_;
+    };
+
+} // namespace QuantLib
+
+#endif // ChinaFixingRepoScheduleCache_HPP
@@ -4,5 +4,6 @@
 #include <qlex/cashflows/ChinaFixingRepoCoupon.hpp>
 #include <qlex/cashflows/ChinaFixingRepoCouponPricer.hpp>
 #include <qlex/cashflows/ChinaFixingRepoLeg.hpp>
+#include <qlex/cashflows/ChinaFixingRepoScheduleCache.hpp>
 
 #endif
@@ -0,0 +1,47 @@
+#include <ql/indexes/indexmanager.hpp>
+#include <qlex/indexes/IndexHistories.hpp>
+
+namespace QuantLib {
+
+    void setHistories(const std::vector<std::string>& names,
+                      const std::vector<ColumnarTimeSeries>& histories) {
+        QL_REQUIRE(names.size() == histories.size(),
+                   "names and histories have different sizes ("
+                       << names.size() << " vs " << histories.size() << ")");
+        std::vector<TimeSeries<Real> > series;
+        series.reserve(histories.size());
+        for (const auto& h : histories)
+            series.push_back(h.timeSeries());
+        for (Size i = 0; i < names.size(); ++i)
+            IndexManager::instance().setHistory(names[i], series[i]);
+    }
+
+    void setHistories(const std::vector<std::string>& names,
+                      const std::vector<Natural>& sizes,
+                      const Array& serials,
+                      const Array& values) {
+        QL_REQUIRE(names.size() == sizes.size(),
+                   "names and sizes have different sizes ("
+                       << names.size() << " vs " << sizes.size() << ")");
+        QL_REQUIRE(serials.size() == values.size(),
+                   "serial numbers and values have different sizes ("
+                       << serials.size() << " vs " << values.size() << ")");
+        std::vector<ColumnarTimeSeries> histories;
+        histories.reserve(sizes.size());
+        Size offset = 0;
+        for (Natural size : sizes) {
+            QL_REQUIRE(offset + size <= serials.size(),
+                       "sizes add up to more than the "
+                           << serials.size() << " given fixings");
+            histories.emplace_back(
+                Array(serials.begin() + offset, serials.begin() + offset + size),
+                Array(values.begin() + offset, values.begin() + offset + size));
+            offset += size;
+        }
+        QL_REQUIRE(offset == serials.size(),
+                   "sizes add up to " << offset << " instead of the "
+                                      << serials.size() << " given fixings");
+        setHistories(names, histories);
+    }
+
+} // namespace QuantLib
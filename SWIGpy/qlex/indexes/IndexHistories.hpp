@@ -0,0 +1,26 @@
+#ifndef IndexHistories_HPP
+#define IndexHistories_HPP
+
+#include <qlex/time/ColumnarTimeSeries.hpp>
+#include <string>
+#include <vector>
+
+namespace QuantLib {
+
+    //! installs several fixing histories in the IndexManager
+    /*! All histories are checked before any of them is installed. */
+    void setHistories(const std::vector<std::string>& names,
+                      const std::vector<ColumnarTimeSeries>& histories);
+
+    //! same as above, with the histories laid out one after the other
+    /*! The i-th history holds the next sizes[i] serial numbers and
+        values of the given arrays.
+    */
+    void setHistories(const std::vector<std::string>& names,
+                      const std::vector<Natural>& sizes,
+                      const Array& serials,
+                      const Array& values);
+
+} // namespace QuantLib
+
+#endif // IndexHistories_HPP
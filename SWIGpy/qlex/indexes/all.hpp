@@ -2,5 +2,6 @@
 #define qlex_indexes_all
 
 #include <qlex/indexes/ChinaFixingRepo.hpp>
+#include <qlex/indexes/IndexHistories.hpp>
 
 #endif
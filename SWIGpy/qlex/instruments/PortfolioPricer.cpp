@@ -0,0 +1,91 @@
+#include <qlex/instruments/PortfolioPricer.hpp>
+#include <qlex/patterns/ThreadPool.hpp>
+#include <algorithm>
+#include <limits>
+#include <map>
+
+namespace QuantLib {
+
+    namespace {
+
+        // protected members of Instrument
+        struct InstrumentAccess : Instrument {
+            static ext::shared_ptr<PricingEngine> Instrument::*engineMember() {
+                return &InstrumentAccess::engine_;
+            }
+        };
+
+        // instruments sharing an engine go in the same group, and
+        // instruments without one (e.g., composite instruments) all go
+        // in the first one
+        std::vector<std::vector<Size> >
+        instrumentGroups(const std::vector<ext::shared_ptr<Instrument> >& instruments) {
+            std::vector<std::vector<Size> > groups(1);
+            std::map<const PricingEngine*, Size> positions;
+            for (Size i = 0; i < instruments.size(); ++i) {
+                const PricingEngine* engine =
+                    instruments[i] ?
+                        ((*instruments[i]).*InstrumentAccess::engineMember()).get() :
+                        nullptr;
+                if (engine == nullptr) {
+                    groups[0].push_back(i);
+                    continue;
+                }
+                auto position = positions.find(engine);
+                if (position == positions.end()) {
+                    position = positions.insert(std::make_pair(engine, groups.size())).first;
+                    groups.emplace_back();
+                }
+                groups[position->second].push_back(i);
+            }
+            if (groups[0].empty())
+                groups.erase(groups.begin());
+            return groups;
+        }
+
+    }
+
+    bool PortfolioPricer::concurrent() {
+#if defined(QL_ENABLE_THREAD_SAFE_OBSERVER_PATTERN)
+        return true;
+#else
+        // observers are not thread safe, fall back to serial evaluation
+        return false;
+#endif
+    }
+
+    PortfolioPricer::PortfolioPricer(Size threads)
+    : threads_(concurrent() ? workerThreads(threads) : 1) {}
+
+    void PortfolioPricer::calculate(
+        const std::vector<ext::shared_ptr<Instrument> >& instruments) {
+
+        Size n = instruments.size();
+        npvs_ = Array(n, std::numeric_limits<Real>::quiet_NaN());
+        errors_.assign(n, std::string());
+
+        // engines hold the arguments and results of the instrument
+        // being priced, so each one is only used by a single thread
+        std::vector<std::vector<Size> > groups = instrumentGroups(instruments);
+        groups_ = groups.size();
+
+        parallelFor(groups.size(), threads_, [&](Size g) {
+            for (Size i : groups[g]) {
+                try {
+                    QL_REQUIRE(instruments[i], "null instrument");
+                    npvs_[i] = instruments[i]->NPV();
+                } catch (std::exception& e) {
+                    errors_[i] = e.what();
+                } catch (...) {
+                    errors_[i] = "unknown error";
+                }
+            }
+        });
+    }
+
+    Size PortfolioPricer::failures() const {
+        return std::count_if(errors_.begin(), errors_.end(),
+                             [](const std::string& e) { return !e.empty(); });
+    }
+
+} // namespace QuantLib
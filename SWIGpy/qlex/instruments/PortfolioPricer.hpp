@@ -0,0 +1,57 @@
+#ifndef PortfolioPricer_HPP
+#define PortfolioPricer_HPP
+
+#include <ql/instrument.hpp>
+#include <ql/math/array.hpp>
+#include <string>
+#include <vector>
+
+namespace QuantLib {
+
+    //! evaluates the NPV of many instruments on a pool of threads
+    /*! The instruments must already have their pricing engines set.
+        Worker threads run in the session of the calling thread, so
+        they see the same evaluation date and fixings and the results
+        match those of a serial loop.  Instruments sharing a pricing
+        engine are priced in sequence on the same thread, as are all
+        instruments without an engine of their own.
+
+        \warning concurrent evaluation is only enabled when QuantLib is
+                 built with QL_ENABLE_THREAD_SAFE_OBSERVER_PATTERN;
+                 otherwise the instruments are priced serially, as
+                 reported by concurrent().  The components of composite
+                 instruments must not share engines with other
+                 instruments.  Shared lazy objects (e.g. bootstrapped curves) should
+                 be calculated before the call.  Engines and term
+                 structures calling back into Python can only be used
+                 by a serial pricer, which the wrapper runs with the
+                 GIL held.
+    */
+    class PortfolioPricer {
+      public:
+        //! a null number of threads uses the hardware concurrency
+        explicit PortfolioPricer(Size threads = 0);
+
+        void calculate(const std::vector<ext::shared_ptr<Instrument> >& instruments);
+
+        Size threads() const { return threads_; }
+        //! whether instruments can be priced concurrently in this build
+        static bool concurrent();
+        //! NPVs of the last calculation, NaN where the pricing failed
+        const Array& NPVs() const { return npvs_; }
+        //! error messages of the last calculation, empty where it succeeded
+        const std::vector<std::string>& errors() const { return errors_; }
+        Size failures() const;
+        //! number of instrument groups priced concurrently
+        Size groups() const { return groups_; }
+
+      private:
+        Size threads_;
+        Array npvs_;
+        std::vector<std::string> errors_;
+        Size groups_ = 0;
+    };
+
+} // namespace QuantLib
+
+#endif // PortfolioPricer_HPP
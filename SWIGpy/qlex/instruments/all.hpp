@@ -3,5 +3,6 @@
 
 #include <qlex/instruments/ChinaFixingRepoSwap.hpp>
 #include <qlex/instruments/MakeChinaFixingRepoSwap.hpp>
+#include <qlex/instruments/PortfolioPricer.hpp>
 
 #endif
@@ -1,4 +1,3 @@
-#include <cmath>
 #include <qlex/math/CubicSpline.hpp>
 
 namespace QuantLib {
@@ -7,30 +6,52 @@ namespace QuantLib {
     : n_(knots.size() + 1), knots_ex_(knots) {
         knots_ex_.insert(knots_ex_.begin(), 0.0);
         knots_ex_.insert(knots_ex_.end(), knots.back());
+
+        // interval bounds and constant terms of each basis function,
+        // computed once so that evaluation needs no pow() calls
+        pieces_.resize(n_);
+        for (Size i = 1; i < n_; ++i) {
+            Piece& p = pieces_[i];
+            p.q_minus = knots_ex_[i - 1];
+            p.q = knots_ex_[i];
+            p.q_plus = knots_ex_[i + 1];
+            Real dl = p.q - p.q_minus, dr = p.q_plus - p.q;
+            p.a = 1.0 / (6.0 * dl);
+            p.b = dl * dl / 6.0;
+            p.c = 1.0 / (6.0 * dr);
+            p.d = p.q_plus - p.q_minus;
+            p.e = (2.0 * p.q_plus - p.q - p.q_minus) / 6.0;
+        }
     }
 
     CubicSpline::~CubicSpline() {}
 
-    Real CubicSpline::operator()(Natural i, Real x) const {
-        using namespace std;
+    inline Real CubicSpline::value(const Piece& p, Real x) const {
+        if (x < p.q_minus) {
+            return 0.0;
+        } else if (x < p.q) {
+            Real h = x - p.q_minus;
+            return h * h * h * p.a;
+        } else if (x < p.q_plus) {
+            Real h = x - p.q;
+            return p.b + (p.q - p.q_minus) * h / 2.0 + h * h / 2.0 - h * h * h * p.c;
+        } else {
+            return p.d * (p.e + (x - p.q_plus) / 2.0);
+        }
+    }
 
+    Real CubicSpline::operator()(Natural i, Real x) const {
         if (i < n_) {
-            Real q = knots_ex_[i], q_minus = knots_ex_[i - 1], q_plus = knots_ex_[i + 1];
-
-            if (x < q_minus) {
-                return 0.0;
-            } else if (q_minus <= x and x < q) {
-                return pow(x - q_minus, 3) / (6.0 * (q - q_minus));
-            } else if (q <= x and x < q_plus) {
-                return pow(q - q_minus, 2) / 6.0 + (q - q_minus) * (x - q) / 2.0 +
-                       pow(x - q, 2) / 2.0 - pow(x - q, 3) / (6.0 * (q_plus - q));
-            } else {
-                return (q_plus - q_minus) *
-                       ((2.0 * q_plus - q - q_minus) / 6.0 + (x - q_plus) / 2.0);
-            }
+            return value(pieces_[i], x);
         } else {
             return x;
         }
     }
 
+    void CubicSpline::values(Real x, Real* result) const {
+        for (Size i = 1; i < n_; ++i)
+            result[i - 1] = value(pieces_[i], x);
+        result[n_ - 1] = x;
+    }
+
 } // namespace QuantLib
@@ -35,10 +35,20 @@ namespace QuantLib {
         CubicSpline(const std::vector<Real>& knots);
         ~CubicSpline();
         Real operator()(Natural i, Real x) const;
+        //! number of basis functions
+        Size size() const { return n_; }
+        //! writes \f$ c_1(x), \dots, c_n(x) \f$ into result
+        void values(Real x, Real* result) const;
 
       private:
+        struct Piece {
+            Real q_minus, q, q_plus;
+            Real a, b, c, d, e;
+        };
+        Real value(const Piece& p, Real x) const;
         Size n_;
         std::vector<Real> knots_ex_;
+        std::vector<Piece> pieces_;
     };
 
 } // namespace QuantLib
@@ -0,0 +1,457 @@
+#include <ql/errors.hpp>
+#include <ql/mathconstants.hpp>
+#include <qlex/math/Expression.hpp>
+#include <algorithm>
+#include <cctype>
+#include <cmath>
+#include <cstdlib>
+#include <sstream>
+
+namespace QuantLib {
+
+    namespace {
+
+        // value and derivative, for forward-mode differentiation
+        struct Dual {
+            Real v, d;
+            Dual() : v(0.0), d(0.0) {}
+            Dual(Real value, Real derivative = 0.0) : v(value), d(derivative) {}
+        };
+
+        Dual operator-(const Dual& a) { return Dual(-a.v, -a.d); }
+        Dual operator+(const Dual& a, const Dual& b) { return Dual(a.v + b.v, a.d + b.d); }
+        Dual operator-(const Dual& a, const Dual& b) { return Dual(a.v - b.v, a.d - b.d); }
+        Dual operator*(const Dual& a, const Dual& b) {
+            return Dual(a.v * b.v, a.d * b.v + a.v * b.d);
+        }
+        Dual operator/(const Dual& a, const Dual& b) {
+            return Dual(a.v / b.v, (a.d * b.v - a.v * b.d) / (b.v * b.v));
+        }
+
+        Real expOf(Real a) { return std::exp(a); }
+        Dual expOf(const Dual& a) {
+            Real v = std::exp(a.v);
+            return Dual(v, v * a.d);
+        }
+
+        Real logOf(Real a) { return std::log(a); }
+        Dual logOf(const Dual& a) { return Dual(std::log(a.v), a.d / a.v); }
+
+        Real sqrtOf(Real a) { return std::sqrt(a); }
+        Dual sqrtOf(const Dual& a) {
+            Real v = std::sqrt(a.v);
+            return Dual(v, 0.5 * a.d / v);
+        }
+
+        Real absOf(Real a) { return std::fabs(a); }
+        Dual absOf(const Dual& a) { return a.v < 0.0 ? -a : a; }
+
+        Real normCdfOf(Real a) { return 0.5 * std::erfc(-a * M_SQRT1_2); }
+        Dual normCdfOf(const Dual& a) {
+            return Dual(normCdfOf(a.v),
+                        M_SQRT1_2 * M_1_SQRTPI * std::exp(-0.5 * a.v * a.v) * a.d);
+        }
+
+        Real powerOf(Real a, Real b) { return std::pow(a, b); }
+        Dual powerOf(const Dual& a, const Dual& b) {
+            Real v = std::pow(a.v, b.v);
+            Real d = a.d != 0.0 ? b.v * std::pow(a.v, b.v - 1.0) * a.d : 0.0;
+            // the usual case of a constant exponent avoids log(a)
+            if (b.d != 0.0)
+                d += v * std::log(a.v) * b.d;
+            return Dual(v, d);
+        }
+
+        Real maxOf(Real a, Real b) { return std::max(a, b); }
+        Dual maxOf(const Dual& a, const Dual& b) { return a.v >= b.v ? a : b; }
+
+        Real minOf(Real a, Real b) { return std::min(a, b); }
+        Dual minOf(const Dual& a, const Dual& b) { return a.v <= b.v ? a : b; }
+
+        Real call(const Expression::Function& f, Real a) { return f.value(a); }
+        Dual call(const Expression::Function& f, const Dual& a) {
+            Real d = 0.0;
+            if (a.d != 0.0) {
+                if (f.derivative) {
+                    d = f.derivative(a.v);
+                } else {
+                    Real h = 1.0e-6 * std::max(1.0, std::fabs(a.v));
+                    d = (f.value(a.v + h) - f.value(a.v - h)) / (2.0 * h);
+                }
+            }
+            return Dual(f.value(a.v), d * a.d);
+        }
+
+        bool isBuiltIn(const std::string& name, Size arguments) {
+            if (arguments == 1)
+                return name == "exp" || name == "log" || name == "sqrt" ||
+                       name == "abs" || name == "normcdf";
+            if (arguments == 2)
+                return name == "max" || name == "min" || name == "pow";
+            return false;
+        }
+
+    }
+
+    // recursive-descent parser emitting the postfix program:
+    //   expression := term (('+' | '-') term)*
+    //   term       := unary (('*' | '/') unary)*
+    //   unary      := ('-' | '+') unary | power
+    //   power      := primary (('^' | '**') unary)?
+    //   primary    := number | variable | name '(' arguments ')' | '(' expression ')'
+    class Expression::Parser {
+      public:
+        explicit Parser(Expression& e) : e_(e), s_(e.formula_), pos_(0) {}
+
+        void parse() {
+            expression();
+            skipSpaces();
+            QL_REQUIRE(pos_ == s_.size(), unexpected());
+        }
+
+      private:
+        void expression() {
+            term();
+            for (;;) {
+                if (accept('+')) {
+                    term();
+                    e_.emit(Add);
+                } else if (accept('-')) {
+                    term();
+                    e_.emit(Subtract);
+                } else {
+                    return;
+                }
+            }
+        }
+
+        void term() {
+            unary();
+            for (;;) {
+                skipSpaces();
+                if (lookingAt("**")) {
+                    return;
+                } else if (accept('*')) {
+                    unary();
+                    e_.emit(Multiply);
+                } else if (accept('/')) {
+                    unary();
+                    e_.emit(Divide);
+                } else {
+                    return;
+                }
+            }
+        }
+
+        void unary() {
+            if (accept('-')) {
+                unary();
+                e_.emit(Negate);
+            } else if (accept('+')) {
+                unary();
+            } else {
+                power();
+            }
+        }
+
+        void power() {
+            primary();
+            skipSpaces();
+            if (lookingAt("**")) {
+                pos_ += 2;
+                unary();
+                e_.emit(Power);
+            } else if (accept('^')) {
+                unary();
+                e_.emit(Power);
+            }
+        }
+
+        void primary() {
+            skipSpaces();
+            QL_REQUIRE(pos_ < s_.size(),
+                       "unexpected end of expression \"" << s_ << "\"");
+            char c = s_[pos_];
+            if (std::isdigit(static_cast<unsigned char>(c)) || c == '.') {
+                const char* begin = s_.c_str() + pos_;
+                char* end;
+                Real value = std::strtod(begin, &end);
+                QL_REQUIRE(end != begin, unexpected());
+                pos_ += end - begin;
+                e_.emit(Constant, 0, value);
+            } else if (std::isalpha(static_cast<unsigned char>(c)) || c == '_') {
+                Size start = pos_;
+                std::string name = identifier();
+                if (accept('('))
+                    function(name, start);
+                else
+                    variable(name, start);
+            } else if (accept('(')) {
+                expression();
+                QL_REQUIRE(accept(')'), unexpected());
+            } else {
+                QL_FAIL(unexpected());
+            }
+        }
+
+        void function(const std::string& name, Size start) {
+            Size arguments = 0;
+            if (!accept(')')) {
+                do {
+                    expression();
+                    ++arguments;
+                } while (accept(','));
+                QL_REQUIRE(accept(')'), unexpected());
+            }
+            for (Size i = 0; i < e_.functions_.size(); ++i) {
+                if (e_.functions_[i].name == name) {
+                    QL_REQUIRE(arguments == 1,
+                               name << " takes one argument, " << arguments
+                                    << " given at position " << start << " in \""
+                                    << s_ << "\"");
+                    e_.emit(Call, i);
+                    return;
+                }
+            }
+            QL_REQUIRE(isBuiltIn(name, arguments),
+                       (isBuiltIn(name, 1) || isBuiltIn(name, 2) ?
+                            "wrong number of arguments to " : "unknown function ")
+                           << name << " at position " << start << " in \"" << s_
+                           << "\"");
+            if (name == "exp")
+                e_.emit(Exp);
+            else if (name == "log")
+                e_.emit(Log);
+            else if (name == "sqrt")
+                e_.emit(Sqrt);
+            else if (name == "abs")
+                e_.emit(Abs);
+            else if (name == "normcdf")
+                e_.emit(NormCdf);
+            else if (name == "max")
+                e_.emit(Max);
+            else if (name == "min")
+                e_.emit(Min);
+            else
+                e_.emit(Power);
+        }
+
+        void variable(const std::string& name, Size start) {
+            auto i = std::find(e_.variables_.begin(), e_.variables_.end(), name);
+            QL_REQUIRE(i != e_.variables_.end(),
+                       "unknown variable " << name << " at position " << start
+                                           << " in \"" << s_ << "\"");
+            e_.emit(Variable, i - e_.variables_.begin());
+        }
+
+        std::string identifier() {
+            Size start = pos_;
+            while (pos_ < s_.size() &&
+                   (std::isalnum(static_cast<unsigned char>(s_[pos_])) || s_[pos_] == '_'))
+                ++pos_;
+            return s_.substr(start, pos_ - start);
+        }
+
+        void skipSpaces() {
+            while (pos_ < s_.size() && std::isspace(static_cast<unsigned char>(s_[pos_])))
+                ++pos_;
+        }
+
+        bool lookingAt(const char* token) const {
+            return s_.compare(pos_, std::char_traits<char>::length(token), token) == 0;
+        }
+
+        bool accept(char c) {
+            skipSpaces();
+            if (pos_ < s_.size() && s_[pos_] == c) {
+                ++pos_;
+                return true;
+            }
+            return false;
+        }
+
+        std::string unexpected() const {
+            std::ostringstream message;
+            if (pos_ < s_.size())
+                message << "unexpected '" << s_[pos_] << "' at position " << pos_;
+            else
+                message << "unexpected end";
+            message << " of expression \"" << s_ << "\"";
+            return message.str();
+        }
+
+        Expression& e_;
+        const std::string& s_;
+        Size pos_;
+    };
+
+    Expression::Expression(const std::string& formula,
+                           std::vector<std::string> variables,
+                           std::vector<Function> functions)
+    : formula_(formula), variables_(std::move(variables)),
+      functions_(std::move(functions)) {
+        for (Size i = 0; i < variables_.size(); ++i) {
+            QL_REQUIRE(!variables_[i].empty(), "empty variable name");
+            QL_REQUIRE(std::count(variables_.begin(), variables_.end(), variables_[i]) == 1,
+                       "duplicate variable " << variables_[i]);
+        }
+        for (const auto& f : functions_) {
+            QL_REQUIRE(!f.name.empty(), "empty function name");
+            QL_REQUIRE(f.value, "no implementation given for " << f.name);
+        }
+
+        Parser(*this).parse();
+
+        Size depth = 0, maxDepth = 0;
+        for (const auto& i : program_) {
+            if (i.op == Constant || i.op == Variable)
+                maxDepth = std::max(maxDepth, ++depth);
+            else if (i.op >= Add)
+                --depth;
+        }
+        QL_REQUIRE(maxDepth <= maxStackSize,
+                   "expression \"" << formula_ << "\" too deeply nested");
+    }
+
+    void Expression::emit(OpCode op, Size index, Real value) {
+        Instruction instruction = {op, index, value};
+        // operands are single instructions when they are constants
+        Size operands = op >= Add ? 2 : (op >= Negate ? 1 : 0);
+        Size n = program_.size();
+        bool constant = operands > 0 && n >= operands;
+        for (Size k = 1; constant && k <= operands; ++k)
+            constant = program_[n - k].op == Constant;
+        if (!constant) {
+            program_.push_back(instruction);
+            return;
+        }
+        std::vector<Instruction> folded(program_.end() - operands, program_.end());
+        folded.push_back(instruction);
+        Real result = evaluate<Real>(folded.data(), folded.data() + folded.size(), nullptr);
+        program_.resize(n - operands);
+        program_.push_back({Constant, 0, result});
+    }
+
+    template <class T>
+    T Expression::evaluate(const Instruction* begin,
+                           const Instruction* end,
+                           const T* x) const {
+        T stack[maxStackSize];
+        Size top = 0;
+        for (const Instruction* i = begin; i != end; ++i) {
+            switch (i->op) {
+              case Constant:
+                stack[top++] = T(i->value);
+                break;
+              case Variable:
+                stack[top++] = x[i->index];
+                break;
+              case Call:
+                stack[top - 1] = call(functions_[i->index], stack[top - 1]);
+                break;
+              case Negate:
+                stack[top - 1] = -stack[top - 1];
+                break;
+              case Exp:
+                stack[top - 1] = expOf(stack[top - 1]);
+                break;
+              case Log:
+                stack[top - 1] = logOf(stack[top - 1]);
+                break;
+              case Sqrt:
+                stack[top - 1] = sqrtOf(stack[top - 1]);
+                break;
+              case Abs:
+                stack[top - 1] = absOf(stack[top - 1]);
+                break;
+              case NormCdf:
+                stack[top - 1] = normCdfOf(stack[top - 1]);
+                break;
+              case Add:
+                --top;
+                stack[top - 1] = stack[top - 1] + stack[top];
+                break;
+              case Subtract:
+                --top;
+                stack[top - 1] = stack[top - 1] - stack[top];
+                break;
+              case Multiply:
+                --top;
+                stack[top - 1] = stack[top - 1] * stack[top];
+                break;
+              case Divide:
+                --top;
+                stack[top - 1] = stack[top - 1] / stack[top];
+                break;
+              case Power:
+                --top;
+                stack[top - 1] = powerOf(stack[top - 1], stack[top]);
+                break;
+              case Max:
+                --top;
+                stack[top - 1] = maxOf(stack[top - 1], stack[top]);
+                break;
+              case Min:
+                --top;
+                stack[top - 1] = minOf(stack[top - 1], stack[top]);
+                break;
+              default:
+                QL_FAIL("unknown instruction");
+            }
+        }
+        return stack[0];
+    }
+
+    Real Expression::operator()(const Real* x) const {
+        return evaluate<Real>(program_.data(), program_.data() + program_.size(), x);
+    }
+
+    Real Expression::operator()() const {
+        QL_REQUIRE(arity() == 0,
+                   "expression of " << arity() << " variables called with none");
+        return (*this)(static_cast<const Real*>(nullptr));
+    }
+
+    Real Expression::operator()(Real x) const {
+        QL_REQUIRE(arity() == 1,
+                   "expression of " << arity() << " variables called with one");
+        return (*this)(&x);
+    }
+
+    Real Expression::operator()(Real x, Real y) const {
+        QL_REQUIRE(arity() == 2,
+                   "expression of " << arity() << " variables called with two");
+        Real xy[] = {x, y};
+        return (*this)(xy);
+    }
+
+    Real Expression::operator()(const std::vector<Real>& x) const {
+        QL_REQUIRE(x.size() == arity(),
+                   "expression of " << arity() << " variables called with "
+                                    << x.size());
+        return (*this)(x.data());
+    }
+
+    Real Expression::derivative(const Real* x, Size i) const {
+        QL_REQUIRE(i < arity(), "variable index (" << i << ") out of range");
+        std::vector<Dual> dx(arity());
+        for (Size j = 0; j < arity(); ++j)
+            dx[j] = Dual(x[j], j == i ? 1.0 : 0.0);
+        return evaluate<Dual>(program_.data(), program_.data() + program_.size(),
+                              dx.data()).d;
+    }
+
+    Real Expression::derivative(Real x) const {
+        QL_REQUIRE(arity() == 1,
+                   "expression of " << arity() << " variables called with one");
+        return derivative(&x, 0);
+    }
+
+    Real Expression::derivative(const std::vector<Real>& x, Size i) const {
+        QL_REQUIRE(x.size() == arity(),
+                   "expression of " << arity() << " variables called with "
+                                    << x.size());
+        return derivative(x.data(), i);
+    }
+
+} // namespace QuantLib
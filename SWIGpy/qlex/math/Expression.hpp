@@ -0,0 +1,90 @@
+#ifndef Expression_HPP
+#define Expression_HPP
+
+#include <ql/functional.hpp>
+#include <ql/types.hpp>
+#include <string>
+#include <vector>
+
+namespace QuantLib {
+
+    //! Arithmetic expression compiled to a native evaluator
+    /*! The formula is parsed once into a postfix program, with constant
+        subexpressions folded, and evaluated on a fixed-size stack, so
+        that calls do not allocate.  It may use the given variables,
+        numbers, the operators + - * / and ^ (or **), the functions
+        exp, log, sqrt, abs, normcdf, max, min and pow, and any named
+        function given to the constructor, e.g., an interpolation;
+        for instance, "max(exp(x) - 100.0, 0.0)" or
+        "sigma(t) * exp(-0.5 * x * x)".
+
+        Derivatives are computed exactly by forward-mode differentiation
+        of the same program, using the derivatives of the named
+        functions when given and central differences otherwise.
+    */
+    class Expression {
+      public:
+        //! named function of one argument
+        struct Function {
+            std::string name;
+            ext::function<Real(Real)> value;
+            //! optional; central differences are used if empty
+            ext::function<Real(Real)> derivative;
+        };
+
+        Expression(const std::string& formula,
+                   std::vector<std::string> variables,
+                   std::vector<Function> functions = std::vector<Function>());
+
+        //! \name Inspectors
+        //@{
+        const std::string& formula() const { return formula_; }
+        const std::vector<std::string>& variables() const { return variables_; }
+        Size arity() const { return variables_.size(); }
+        //! number of instructions after constant folding
+        Size size() const { return program_.size(); }
+        //@}
+
+        //! \name Evaluation
+        //@{
+        //! x points to arity() values
+        Real operator()(const Real* x) const;
+        Real operator()() const;
+        Real operator()(Real x) const;
+        Real operator()(Real x, Real y) const;
+        Real operator()(const std::vector<Real>& x) const;
+        //! derivative with respect to the i-th variable
+        Real derivative(const Real* x, Size i) const;
+        Real derivative(Real x) const;
+        Real derivative(const std::vector<Real>& x, Size i) const;
+        //@}
+
+        //! the deepest stack a program may need
+        static const Size maxStackSize = 64;
+
+      private:
+        enum OpCode {
+            Constant, Variable, Call,
+            Negate, Exp, Log, Sqrt, Abs, NormCdf,
+            Add, Subtract, Multiply, Divide, Power, Max, Min
+        };
+        struct Instruction {
+            OpCode op;
+            Size index;
+            Real value;
+        };
+        class Parser;
+
+        template <class T>
+        T evaluate(const Instruction* begin, const Instruction* end, const T* x) const;
+        void emit(OpCode op, Size index = 0, Real value = 0.0);
+
+        std::string formula_;
+        std::vector<std::string> variables_;
+        std::vector<Function> functions_;
+        std::vector<Instruction> program_;
+    };
+
+} // namespace QuantLib
+
+#endif // Expression_HPP
@@ -1,4 +1,3 @@
-#include <cmath>
 #include <qlex/math/QuadraticSpline.hpp>
 
 namespace QuantLib {
@@ -11,11 +10,9 @@ namespace QuantLib {
     QuadraticSpline::~QuadraticSpline() {}
 
     Real QuadraticSpline::operator()(Natural i, Real x) const {
-        using namespace std;
-
         if (i == 1) {
             if (x <= knots_ex_[2]) {
-                return x - 1.0 / (2 * knots_ex_[2]) * pow(x, 2);
+                return x - 1.0 / (2 * knots_ex_[2]) * x * x;
             } else {
                 return 1.0 / 2 * knots_ex_[2];
             }
@@ -23,7 +20,8 @@ namespace QuantLib {
             if (x <= knots_ex_[i - 1]) {
                 return 0.0;
             } else {
-                return pow(x - knots_ex_[i - 1], 2) / (2.0 * (knots_ex_[n_] - knots_ex_[i - 1]));
+                Real h = x - knots_ex_[i - 1];
+                return h * h / (2.0 * (knots_ex_[n_] - knots_ex_[i - 1]));
             }
         } else {
             Real q = knots_ex_[i], q_minus = knots_ex_[i - 1], q_plus = knots_ex_[i + 1];
@@ -31,13 +29,20 @@ namespace QuantLib {
             if (x < q_minus) {
                 return 0.0;
             } else if (q_minus <= x and x < q) {
-                return pow(x - q_minus, 2) / (2.0 * (q - q_minus));
+                Real h = x - q_minus;
+                return h * h / (2.0 * (q - q_minus));
             } else if (q <= x and x < q_plus) {
-                return (q - q_minus) / 2.0 + (x - q) - pow(x - q, 2) / (2.0 * (q_plus - q));
+                Real h = x - q;
+                return (q - q_minus) / 2.0 + h - h * h / (2.0 * (q_plus - q));
             } else {
                 return (q_plus - q_minus) / 2.0;
             }
         }
     }
 
+    void QuadraticSpline::values(Real x, Real* result) const {
+        for (Size i = 1; i <= n_; ++i)
+            result[i - 1] = (*this)(i, x);
+    }
+
 } // namespace QuantLib
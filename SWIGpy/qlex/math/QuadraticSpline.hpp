@@ -43,6 +43,10 @@ namespace QuantLib {
         QuadraticSpline(const std::vector<Real>& knots);
         ~QuadraticSpline();
         Real operator()(Natural i, Real x) const;
+        //! number of basis functions
+        Size size() const { return n_; }
+        //! writes \f$ c_1(x), \dots, c_n(x) \f$ into result
+        void values(Real x, Real* result) const;
 
       private:
         Size n_;
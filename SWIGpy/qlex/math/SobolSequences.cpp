@@ -0,0 +1,38 @@
+#include <qlex/math/SobolSequences.hpp>
+#include <qlex/patterns/ThreadPool.hpp>
+#include <algorithm>
+#include <cstdint>
+#include <limits>
+#include <vector>
+
+namespace QuantLib {
+
+    Matrix sobolSequences(Size dimensionality,
+                          Size start,
+                          Size n,
+                          unsigned long seed,
+                          SobolRsg::DirectionIntegers directionIntegers,
+                          Size threads) {
+        QL_REQUIRE(n > 0, "number of sequences must be positive");
+        QL_REQUIRE(start + n <= std::numeric_limits<std::uint32_t>::max(),
+                   "Sobol sequence exhausted");
+
+        Matrix result(n, dimensionality);
+        const SobolRsg fresh(dimensionality, seed, directionIntegers);
+
+        // one copy of the fresh generator per stripe; the first draw
+        // after skipTo(k) on a fresh generator is the draw k+1
+        auto fill = [&](Size begin, Size end) {
+            SobolRsg rsg(fresh);
+            rsg.skipTo(static_cast<std::uint32_t>(start + begin));
+            for (Size i = begin; i < end; ++i) {
+                const std::vector<Real>& x = rsg.nextSequence().value;
+                std::copy(x.begin(), x.end(), result.row_begin(i));
+            }
+        };
+
+        parallelStripes(n, threads, fill);
+        return result;
+    }
+
+} // namespace QuantLib
@@ -0,0 +1,31 @@
+#ifndef SobolSequences_HPP
+#define SobolSequences_HPP
+
+#include <ql/math/matrix.hpp>
+#include <ql/math/randomnumbers/sobolrsg.hpp>
+
+namespace QuantLib {
+
+    //! block of a Sobol sequence filled by several threads
+    /*! Returns the draws start+1, ..., start+n that a fresh
+        SobolRsg(dimensionality, seed, directionIntegers) would return
+        from consecutive nextSequence() calls, one draw per row. The
+        rows are split in contiguous stripes; each thread positions its
+        own generator with skipTo(), so the result does not depend on
+        the number of threads.
+
+        Calls with disjoint [start, start+n) ranges can also be made
+        from independent worker threads to fill chunks of the same stream.
+
+        \pre start + n must not exceed the 2^32 - 1 points of the sequence
+    */
+    Matrix sobolSequences(Size dimensionality,
+                          Size start,
+                          Size n,
+                          unsigned long seed = 0,
+                          SobolRsg::DirectionIntegers directionIntegers = SobolRsg::Jaeckel,
+                          Size threads = 0);
+
+} // namespace QuantLib
+
+#endif // SobolSequences_HPP
@@ -0,0 +1,278 @@
+#include <ql/errors.hpp>
+#include <ql/mathconstants.hpp>
+#include <qlex/math/StreamingStatistics.hpp>
+#include <algorithm>
+#include <cmath>
+
+namespace QuantLib {
+
+    namespace {
+
+        // (u, Q(u)) nodes of the piecewise-linear quantile function: the
+        // centroid means at their mid cumulative weight, plus min and max
+        std::vector<std::pair<Real, Real> >
+        quantileNodes(const std::vector<std::pair<Real, Real> >& centroids,
+                      Real total, Real min, Real max) {
+            std::vector<std::pair<Real, Real> > nodes;
+            nodes.reserve(centroids.size() + 2);
+            nodes.emplace_back(0.0, min);
+            Real cumulated = 0.0;
+            for (const auto& c : centroids) {
+                nodes.emplace_back((cumulated + 0.5 * c.second) / total, c.first);
+                cumulated += c.second;
+            }
+            nodes.emplace_back(1.0, max);
+            return nodes;
+        }
+
+    }
+
+    StreamingStatistics::StreamingStatistics(Real compression)
+    : compression_(compression) {
+        QL_REQUIRE(compression_ >= 10.0,
+                   "compression (" << compression_ << ") must be at least 10");
+        reset();
+    }
+
+    Real StreamingStatistics::mean() const {
+        QL_REQUIRE(weightSum_ > 0.0, "sampleWeight_= 0, unsufficient");
+        return mean_;
+    }
+
+    Real StreamingStatistics::variance() const {
+        QL_REQUIRE(weightSum_ > 0.0, "sampleWeight_= 0, unsufficient");
+        Real n = samples_;
+        QL_REQUIRE(n > 1, "sample number <= 1, unsufficient");
+        return n / (n - 1.0) * m2_ / weightSum_;
+    }
+
+    Real StreamingStatistics::standardDeviation() const {
+        return std::sqrt(variance());
+    }
+
+    Real StreamingStatistics::errorEstimate() const {
+        return std::sqrt(variance() / samples_);
+    }
+
+    Real StreamingStatistics::skewness() const {
+        Real n = samples_;
+        QL_REQUIRE(n > 2, "sample number <= 2, unsufficient");
+        Real sigma = standardDeviation();
+        Real x = m3_ / weightSum_;
+        return (x / (sigma * sigma * sigma)) * (n / (n - 1.0)) * (n / (n - 2.0));
+    }
+
+    Real StreamingStatistics::kurtosis() const {
+        Real n = samples_;
+        QL_REQUIRE(n > 3, "sample number <= 3, unsufficient");
+        Real sigma2 = variance();
+        Real x = m4_ / weightSum_;
+        Real c1 = (n / (n - 1.0)) * (n / (n - 2.0)) * ((n + 1.0) / (n - 3.0));
+        Real c2 = 3.0 * ((n - 1.0) / (n - 2.0)) * ((n - 1.0) / (n - 3.0));
+        return c1 * (x / (sigma2 * sigma2)) - c2;
+    }
+
+    Real StreamingStatistics::min() const {
+        QL_REQUIRE(samples_ > 0, "empty sample set");
+        return min_;
+    }
+
+    Real StreamingStatistics::max() const {
+        QL_REQUIRE(samples_ > 0, "empty sample set");
+        return max_;
+    }
+
+    Size StreamingStatistics::centroids() const {
+        compress();
+        return centroids_.size();
+    }
+
+    Real StreamingStatistics::percentile(Real y) const {
+        QL_REQUIRE(y >= 0.0 && y <= 1.0,
+                   "percentile (" << y << ") must be in [0.0, 1.0]");
+        QL_REQUIRE(weightSum_ > 0.0, "empty sample set");
+        compress();
+
+        std::vector<std::pair<Real, Real> > nodes =
+            quantileNodes(centroids_, weightSum_, min_, max_);
+        Size k = 1;
+        while (k < nodes.size() - 1 && nodes[k].first < y)
+            ++k;
+        Real u0 = nodes[k - 1].first, u1 = nodes[k].first;
+        if (u1 <= u0)
+            return nodes[k].second;
+        return nodes[k - 1].second +
+               (y - u0) / (u1 - u0) * (nodes[k].second - nodes[k - 1].second);
+    }
+
+    Real StreamingStatistics::topPercentile(Real y) const {
+        QL_REQUIRE(y >= 0.0 && y <= 1.0,
+                   "percentile (" << y << ") must be in [0.0, 1.0]");
+        return percentile(1.0 - y);
+    }
+
+    Real StreamingStatistics::valueAtRisk(Real p) const {
+        QL_REQUIRE(p >= 0.9 && p < 1.0,
+                   "percentile (" << p << ") out of range [0.9, 1.0)");
+        return -std::min<Real>(percentile(1.0 - p), 0.0);
+    }
+
+    Real StreamingStatistics::expectedShortfall(Real p) const {
+        QL_REQUIRE(p >= 0.9 && p < 1.0,
+                   "percentile (" << p << ") out of range [0.9, 1.0)");
+        QL_REQUIRE(weightSum_ > 0.0, "empty sample set");
+        return -std::min<Real>(tailMean(1.0 - p), 0.0);
+    }
+
+    Real StreamingStatistics::tailMean(Real p) const {
+        compress();
+        std::vector<std::pair<Real, Real> > nodes =
+            quantileNodes(centroids_, weightSum_, min_, max_);
+        Real area = 0.0;
+        for (Size k = 1; k < nodes.size() && nodes[k - 1].first < p; ++k) {
+            Real u0 = nodes[k - 1].first, u1 = nodes[k].first;
+            Real v0 = nodes[k - 1].second, v1 = nodes[k].second;
+            if (u1 <= u0)
+                continue;
+            if (u1 > p) {
+                v1 = v0 + (p - u0) / (u1 - u0) * (v1 - v0);
+                u1 = p;
+            }
+            area += 0.5 * (u1 - u0) * (v0 + v1);
+        }
+        return area / p;
+    }
+
+    void StreamingStatistics::add(Real value, Real weight) {
+        QL_REQUIRE(weight >= 0.0, "negative weight (" << weight << ") not allowed");
+        mergeMoments(1, weight, value, 0.0, 0.0, 0.0);
+        min_ = std::min(min_, value);
+        max_ = std::max(max_, value);
+        if (weight > 0.0) {
+            buffer_.emplace_back(value, weight);
+            if (buffer_.size() >= 5 * compression_)
+                compress();
+        }
+    }
+
+    void StreamingStatistics::merge(const StreamingStatistics& other) {
+        if (other.samples_ == 0)
+            return;
+        other.compress();
+        // copied first, other may be *this
+        std::vector<Centroid> centroids(other.centroids_);
+        Real otherMin = other.min_, otherMax = other.max_;
+        mergeMoments(other.samples_, other.weightSum_, other.mean_,
+                     other.m2_, other.m3_, other.m4_);
+        min_ = std::min(min_, otherMin);
+        max_ = std::max(max_, otherMax);
+        buffer_.insert(buffer_.end(), centroids.begin(), centroids.end());
+        compress();
+    }
+
+    void StreamingStatistics::reset() {
+        samples_ = 0;
+        weightSum_ = mean_ = m2_ = m3_ = m4_ = 0.0;
+        min_ = QL_MAX_REAL;
+        max_ = QL_MIN_REAL;
+        centroids_.clear();
+        buffer_.clear();
+    }
+
+    Array StreamingStatistics::state() const {
+        compress();
+        Array result(9 + 2 * centroids_.size());
+        result[0] = compression_;
+        result[1] = Real(samples_);
+        result[2] = weightSum_;
+        result[3] = mean_;
+        result[4] = m2_;
+        result[5] = m3_;
+        result[6] = m4_;
+        result[7] = min_;
+        result[8] = max_;
+        for (Size i = 0; i < centroids_.size(); ++i) {
+            result[9 + 2 * i] = centroids_[i].first;
+            result[10 + 2 * i] = centroids_[i].second;
+        }
+        return result;
+    }
+
+    void StreamingStatistics::restore(const Array& state) {
+        QL_REQUIRE(state.size() >= 9 && (state.size() - 9) % 2 == 0,
+                   "invalid statistics state");
+        compression_ = state[0];
+        samples_ = Size(state[1]);
+        weightSum_ = state[2];
+        mean_ = state[3];
+        m2_ = state[4];
+        m3_ = state[5];
+        m4_ = state[6];
+        min_ = state[7];
+        max_ = state[8];
+        buffer_.clear();
+        centroids_.resize((state.size() - 9) / 2);
+        for (Size i = 0; i < centroids_.size(); ++i)
+            centroids_[i] = Centroid(state[9 + 2 * i], state[10 + 2 * i]);
+    }
+
+    void StreamingStatistics::mergeMoments(
+        Size n, Real w, Real mean, Real m2, Real m3, Real m4) {
+        samples_ += n;
+        if (w == 0.0)
+            return;
+
+        Real wA = weightSum_, wB = w, total = wA + wB;
+        Real d = mean - mean_;
+        Real d2 = d * d;
+
+        m4_ += m4 + d2 * d2 * wA * wB * (wA * wA - wA * wB + wB * wB) / (total * total * total) +
+               6.0 * d2 * (wA * wA * m2 + wB * wB * m2_) / (total * total) +
+               4.0 * d * (wA * m3 - wB * m3_) / total;
+        m3_ += m3 + d2 * d * wA * wB * (wA - wB) / (total * total) +
+               3.0 * d * (wA * m2 - wB * m2_) / total;
+        m2_ += m2 + d2 * wA * wB / total;
+        mean_ += d * wB / total;
+        weightSum_ = total;
+    }
+
+    void StreamingStatistics::compress() const {
+        if (buffer_.empty())
+            return;
+
+        buffer_.insert(buffer_.end(), centroids_.begin(), centroids_.end());
+        std::sort(buffer_.begin(), buffer_.end());
+        Real total = 0.0;
+        for (const auto& c : buffer_)
+            total += c.second;
+
+        // k1 scale function: centroids are small in the tails
+        Real normalizer = compression_ / (2.0 * M_PI);
+        auto limit = [normalizer](Real q) {
+            Real k = normalizer * std::asin(2.0 * q - 1.0) + 1.0;
+            return k >= normalizer * M_PI_2 ? 1.0 : 0.5 * (std::sin(k / normalizer) + 1.0);
+        };
+
+        centroids_.clear();
+        Centroid current = buffer_.front();
+        Real weightSoFar = 0.0;
+        Real qLimit = limit(0.0);
+        for (Size i = 1; i < buffer_.size(); ++i) {
+            const Centroid& next = buffer_[i];
+            Real q = (weightSoFar + current.second + next.second) / total;
+            if (q <= qLimit) {
+                Real weight = current.second + next.second;
+                current.first += (next.first - current.first) * next.second / weight;
+                current.second = weight;
+            } else {
+                centroids_.push_back(current);
+                weightSoFar += current.second;
+                qLimit = limit(weightSoFar / total);
+                current = next;
+            }
+        }
+        centroids_.push_back(current);
+        buffer_.clear();
+    }
+
+} // namespace QuantLib
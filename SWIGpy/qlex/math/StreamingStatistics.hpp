@@ -0,0 +1,98 @@
+#ifndef StreamingStatistics_HPP
+#define StreamingStatistics_HPP
+
+#include <ql/math/array.hpp>
+#include <utility>
+#include <vector>
+
+namespace QuantLib {
+
+    //! Mergeable statistics tool in bounded memory
+    /*! Keeps the weighted mean and central moment sums, combined
+        exactly when samples are added or another accumulator is merged
+        (Pébay, "Formulas for robust, one-pass parallel computation of
+        covariances and arbitrary-order statistical moments", 2008), and
+        a merging t-digest (Dunning and Ertl, "Computing extremely
+        accurate quantiles using t-digests", 2019) for percentiles.
+
+        Mean, variance, skewness and kurtosis use the same bias
+        corrections as GeneralStatistics; percentiles, value at risk and
+        expected shortfall are t-digest estimates whose error is smallest
+        in the tails. The digest holds at most a few times
+        \f$ \delta \f$ centroids, \f$ \delta \f$ being the compression.
+    */
+    class StreamingStatistics {
+      public:
+        explicit StreamingStatistics(Real compression = 200.0);
+
+        //! \name Inspectors
+        //@{
+        Size samples() const { return samples_; }
+        Real weightSum() const { return weightSum_; }
+        Real mean() const;
+        Real variance() const;
+        Real standardDeviation() const;
+        Real errorEstimate() const;
+        Real skewness() const;
+        Real kurtosis() const;
+        Real min() const;
+        Real max() const;
+        Real compression() const { return compression_; }
+        Size centroids() const;
+        //@}
+
+        //! \name Percentiles
+        //@{
+        //! y-th percentile of the distribution, \f$ 0 \le y \le 1 \f$
+        Real percentile(Real y) const;
+        //! y-th top percentile of the distribution
+        Real topPercentile(Real y) const;
+        //! as in GenericRiskStatistics, \f$ 0.9 \le p < 1 \f$
+        Real valueAtRisk(Real p) const;
+        //! as in GenericRiskStatistics, \f$ 0.9 \le p < 1 \f$
+        Real expectedShortfall(Real p) const;
+        //@}
+
+        //! \name Modifiers
+        //@{
+        void add(Real value, Real weight = 1.0);
+        template <class DataIterator>
+        void addSequence(DataIterator begin, DataIterator end) {
+            for (; begin != end; ++begin)
+                add(*begin);
+        }
+        template <class DataIterator, class WeightIterator>
+        void addSequence(DataIterator begin, DataIterator end, WeightIterator wbegin) {
+            for (; begin != end; ++begin, ++wbegin)
+                add(*begin, *wbegin);
+        }
+        //! combines the samples of other into this accumulator
+        void merge(const StreamingStatistics& other);
+        void reset();
+        //@}
+
+        //! \name Serialization
+        //@{
+        //! flat representation of the accumulator
+        Array state() const;
+        //! restores an accumulator saved by state()
+        void restore(const Array& state);
+        //@}
+
+      private:
+        typedef std::pair<Real, Real> Centroid; // mean, weight
+
+        void mergeMoments(Size n, Real w, Real mean, Real m2, Real m3, Real m4);
+        void compress() const;
+        // average of the estimated quantile function over [0, p]
+        Real tailMean(Real p) const;
+
+        Real compression_;
+        Size samples_;
+        Real weightSum_, mean_, m2_, m3_, m4_, min_, max_;
+        mutable std::vector<Centroid> centroids_, buffer_;
+    };
+
+} // namespace QuantLib
+
+#endif // StreamingStatistics_HPP
@@ -2,6 +2,9 @@
 #define qlex_math_all
 
 #include <qlex/math/CubicSpline.hpp>
+#include <qlex/math/Expression.hpp>
 #include <qlex/math/QuadraticSpline.hpp>
+#include <qlex/math/SobolSequences.hpp>
+#include <qlex/math/StreamingStatistics.hpp>
 
 #endif
@@ -0,0 +1,202 @@
+#include <ql/math/optimization/problem.hpp>
+#include <ql/patterns/lazyobject.hpp>
+#include <ql/math/optimization/projectedconstraint.hpp>
+#include <ql/math/optimization/projection.hpp>
+#include <ql/models/calibrationhelper.hpp>
+#include <qlex/models/ParallelCalibration.hpp>
+#include <qlex/patterns/ThreadPool.hpp>
+#include <chrono>
+#include <cmath>
+#include <map>
+
+namespace QuantLib {
+
+    namespace {
+
+        typedef std::chrono::steady_clock Clock;
+
+        Real seconds(Clock::time_point start, Clock::time_point end) {
+            return std::chrono::duration<Real>(end - start).count();
+        }
+
+        // protected members of BlackCalibrationHelper
+        struct BlackCalibrationHelperAccess : BlackCalibrationHelper {
+            static ext::shared_ptr<PricingEngine> BlackCalibrationHelper::*engineMember() {
+                return &BlackCalibrationHelperAccess::engine_;
+            }
+        };
+
+        // protected members of LazyObject
+        struct LazyObjectAccess : LazyObject {
+            static void (LazyObject::*calculateMember())() const {
+                return &LazyObjectAccess::calculate;
+            }
+        };
+
+        // helpers sharing an engine go in the same group, and helpers
+        // whose engine is not known all go in the first one
+        std::vector<std::vector<Size> >
+        helperGroups(const std::vector<ext::shared_ptr<CalibrationHelper> >& helpers) {
+            std::vector<std::vector<Size> > groups(1);
+            std::map<const PricingEngine*, Size> positions;
+            for (Size i = 0; i < helpers.size(); ++i) {
+                auto black = ext::dynamic_pointer_cast<BlackCalibrationHelper>(helpers[i]);
+                const PricingEngine* engine =
+                    black ? ((*black).*BlackCalibrationHelperAccess::engineMember()).get() :
+                            nullptr;
+                if (engine == nullptr) {
+                    groups[0].push_back(i);
+                    continue;
+                }
+                auto position = positions.find(engine);
+                if (position == positions.end()) {
+                    position = positions.insert(std::make_pair(engine, groups.size())).first;
+                    groups.emplace_back();
+                }
+                groups[position->second].push_back(i);
+            }
+            if (groups[0].empty())
+                groups.erase(groups.begin());
+            return groups;
+        }
+
+    }
+
+    class ParallelCalibration::CalibrationFunction : public CostFunction {
+      public:
+        CalibrationFunction(ParallelCalibration& calibration,
+                            ext::shared_ptr<CalibratedModel> model,
+                            const std::vector<ext::shared_ptr<CalibrationHelper> >& helpers,
+                            const std::vector<Real>& weights,
+                            const Projection& projection,
+                            std::vector<std::vector<Size> > groups)
+        : calibration_(calibration), model_(std::move(model)), helpers_(helpers),
+          weights_(weights), projection_(projection), groups_(std::move(groups)),
+          lazyModel_(ext::dynamic_pointer_cast<LazyObject>(model_)) {}
+
+        Real value(const Array& params) const override {
+            Array errors = weightedErrors(params);
+            return std::sqrt(DotProduct(errors, errors));
+        }
+
+        Array values(const Array& params) const override {
+            return weightedErrors(params);
+        }
+
+        Real finiteDifferenceEpsilon() const override { return 1e-6; }
+
+        // later evaluations are not recorded in the timings
+        void stopTiming() { timed_ = false; }
+
+      private:
+        Array weightedErrors(const Array& params) const {
+            Clock::time_point start = Clock::now();
+            model_->setParams(projection_.include(params));
+            // setting the parameters invalidates a lazy model, which
+            // must not be calculated by the first worker asking for it
+            if (lazyModel_)
+                ((*lazyModel_).*LazyObjectAccess::calculateMember())();
+            Clock::time_point helperStart = Clock::now();
+            Array errors = calibrationErrors();
+            Clock::time_point end = Clock::now();
+            if (timed_) {
+                calibration_.evaluationTimes_.push_back(seconds(start, end));
+                calibration_.helperTimes_.push_back(seconds(helperStart, end));
+            }
+            for (Size i = 0; i < errors.size(); ++i)
+                errors[i] *= std::sqrt(weights_[i]);
+            return errors;
+        }
+
+        Array calibrationErrors() const {
+            Array errors(helpers_.size());
+            parallelFor(groups_.size(), calibration_.threads_, [&](Size g) {
+                for (Size i : groups_[g])
+                    errors[i] = helpers_[i]->calibrationError();
+            });
+            return errors;
+        }
+
+        ParallelCalibration& calibration_;
+        ext::shared_ptr<CalibratedModel> model_;
+        const std::vector<ext::shared_ptr<CalibrationHelper> >& helpers_;
+        const std::vector<Real>& weights_;
+        const Projection& projection_;
+        std::vector<std::vector<Size> > groups_;
+        ext::shared_ptr<LazyObject> lazyModel_;
+        bool timed_ = true;
+    };
+
+    bool ParallelCalibration::concurrent() {
+#if defined(QL_ENABLE_THREAD_SAFE_OBSERVER_PATTERN)
+        return true;
+#else
+        // observers are not thread safe, fall back to serial evaluation
+        return false;
+#endif
+    }
+
+    ParallelCalibration::ParallelCalibration(Size threads)
+    : threads_(concurrent() ? workerThreads(threads) : 1) {}
+
+    void ParallelCalibration::calibrate(
+        const ext::shared_ptr<CalibratedModel>& model,
+        const std::vector<ext::shared_ptr<CalibrationHelper> >& helpers,
+        OptimizationMethod& method,
+        const EndCriteria& endCriteria,
+        const Constraint& constraint,
+        const std::vector<Real>& weights,
+        const std::vector<bool>& fixParameters) {
+
+        QL_REQUIRE(model, "null model given");
+        QL_REQUIRE(!helpers.empty(), "no helpers given");
+        for (const auto& helper : helpers)
+            QL_REQUIRE(helper, "null helper given");
+        QL_REQUIRE(weights.empty() || weights.size() == helpers.size(),
+                   "mismatch between number of helpers (" << helpers.size()
+                                                          << ") and weights ("
+                                                          << weights.size() << ")");
+        Array params = model->params();
+        QL_REQUIRE(fixParameters.empty() || fixParameters.size() == params.size(),
+                   "mismatch between number of parameters (" << params.size()
+                                                             << ") and fixed-parameter specs ("
+                                                             << fixParameters.size() << ")");
+
+        Clock::time_point start = Clock::now();
+        evaluationTimes_.clear();
+        helperTimes_.clear();
+
+        Constraint c;
+        if (constraint.empty()) {
+            c = *model->constraint();
+        } else {
+            CompositeConstraint cc(*model->constraint(), constraint);
+            c = cc;
+        }
+        std::vector<Real> w =
+            weights.empty() ? std::vector<Real>(helpers.size(), 1.0) : weights;
+        Projection projection(
+            params, fixParameters.empty() ? std::vector<bool>(params.size(), false) :
+                                            fixParameters);
+
+        std::vector<std::vector<Size> > groups = helperGroups(helpers);
+        groups_ = groups.size();
+
+        // shared lazy objects are calculated before the threads start
+        for (const auto& helper : helpers)
+            helper->calibrationError();
+
+        CalibrationFunction f(*this, model, helpers, w, projection, std::move(groups));
+        ProjectedConstraint pc(c, projection);
+        Problem problem(f, pc, projection.project(params));
+        endCriteria_ = method.minimize(problem, endCriteria);
+        Array result(problem.currentValue());
+        model->setParams(projection.include(result));
+        f.stopTiming();
+        problemValues_ = problem.values(result);
+        functionEvaluation_ = problem.functionEvaluation();
+
+        totalTime_ = seconds(start, Clock::now());
+    }
+
+} // namespace QuantLib
@@ -0,0 +1,87 @@
+#ifndef ParallelCalibration_HPP
+#define ParallelCalibration_HPP
+
+#include <ql/math/array.hpp>
+#include <ql/math/optimization/constraint.hpp>
+#include <ql/math/optimization/endcriteria.hpp>
+#include <ql/math/optimization/method.hpp>
+#include <ql/models/model.hpp>
+#include <vector>
+
+namespace QuantLib {
+
+    //! calibrates a model evaluating its helpers on a pool of threads
+    /*! Does what CalibratedModel::calibrate does, except that at each
+        evaluation of the cost function, after the model parameters are
+        set, the calibration errors of the helpers are computed
+        concurrently.  Helpers sharing a pricing engine are evaluated
+        in sequence on the same thread; helpers other than
+        BlackCalibrationHelper are all evaluated on a single thread.
+        Worker threads run in the session of the calling thread.
+
+        All helpers are evaluated once serially before the optimization,
+        so that shared lazy objects such as bootstrapped curves are
+        calculated in advance.  Models that are lazy objects, such as
+        Gaussian1dModel, are calculated on the calling thread each time
+        their parameters are set.  The results of the calibration (end
+        criteria, problem values and function evaluations) are held by
+        this class, since those of the model can only be set by its
+        own calibrate method.
+
+        \warning concurrent evaluation is only enabled when QuantLib is
+                 built with QL_ENABLE_THREAD_SAFE_OBSERVER_PATTERN;
+                 otherwise the helpers are evaluated serially, as
+                 reported by concurrent().  Engines calling back into
+                 Python must not be used.
+    */
+    class ParallelCalibration {
+      public:
+        //! a null number of threads uses the hardware concurrency
+        explicit ParallelCalibration(Size threads = 0);
+
+        void calibrate(const ext::shared_ptr<CalibratedModel>& model,
+                       const std::vector<ext::shared_ptr<CalibrationHelper> >& helpers,
+                       OptimizationMethod& method,
+                       const EndCriteria& endCriteria,
+                       const Constraint& constraint = Constraint(),
+                       const std::vector<Real>& weights = std::vector<Real>(),
+                       const std::vector<bool>& fixParameters = std::vector<bool>());
+
+        Size threads() const { return threads_; }
+        //! whether helpers can be evaluated concurrently in this build
+        static bool concurrent();
+
+        //! \name Results of the last calibration
+        //@{
+        EndCriteria::Type endCriteria() const { return endCriteria_; }
+        const Array& problemValues() const { return problemValues_; }
+        Integer functionEvaluation() const { return functionEvaluation_; }
+        //! number of helper groups evaluated concurrently
+        Size groups() const { return groups_; }
+        //@}
+
+        //! \name Timing of the last calibration
+        //@{
+        //! wall-clock seconds of each evaluation of the cost function
+        const std::vector<Real>& evaluationTimes() const { return evaluationTimes_; }
+        //! of which spent computing the helper errors
+        const std::vector<Real>& helperTimes() const { return helperTimes_; }
+        //! wall-clock seconds of the whole calibration
+        Real totalTime() const { return totalTime_; }
+        //@}
+
+      private:
+        class CalibrationFunction;
+
+        Size threads_;
+        EndCriteria::Type endCriteria_ = EndCriteria::None;
+        Array problemValues_;
+        Integer functionEvaluation_ = 0;
+        Size groups_ = 0;
+        std::vector<Real> evaluationTimes_, helperTimes_;
+        Real totalTime_ = 0.0;
+    };
+
+} // namespace QuantLib
+
+#endif // ParallelCalibration_HPP
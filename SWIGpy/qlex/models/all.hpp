@@ -0,0 +1,6 @@
+#ifndef qlex_models_all
+#define qlex_models_all
+
+#include <qlex/models/ParallelCalibration.hpp>
+
+#endif
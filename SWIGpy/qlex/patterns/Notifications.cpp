@@ -0,0 +1,98 @@
+#include <ql/patterns/lazyobject.hpp>
+#include <ql/quotes/simplequote.hpp>
+#include <qlex/patterns/Notifications.hpp>
+#include <algorithm>
+
+namespace QuantLib {
+
+    namespace {
+
+        // protected member of LazyObject
+        struct LazyObjectAccess : LazyObject {
+            static bool LazyObject::*frozenMember() { return &LazyObjectAccess::frozen_; }
+        };
+
+    }
+
+    Size setQuoteValues(const std::vector<ext::shared_ptr<Quote> >& quotes,
+                        const Array& values,
+                        const std::vector<ext::shared_ptr<Observable> >& held) {
+        QL_REQUIRE(quotes.size() == values.size(),
+                   "quotes and values have different sizes ("
+                       << quotes.size() << " vs " << values.size() << ")");
+        std::vector<ext::shared_ptr<SimpleQuote> > simpleQuotes(quotes.size());
+        Size changed = 0;
+        for (Size i = 0; i < quotes.size(); ++i) {
+            simpleQuotes[i] = ext::dynamic_pointer_cast<SimpleQuote>(quotes[i]);
+            QL_REQUIRE(simpleQuotes[i], "quote #" << i << " is not a SimpleQuote");
+            bool valid = simpleQuotes[i]->isValid();
+            if (valid ? simpleQuotes[i]->value() != values[i] : values[i] != Null<Real>())
+                ++changed;
+        }
+        std::vector<ext::shared_ptr<LazyObject> > lazyObjects;
+        for (Size i = 0; i < held.size(); ++i) {
+            auto lazy = ext::dynamic_pointer_cast<LazyObject>(held[i]);
+            QL_REQUIRE(lazy, "held observable #" << i << " is not a lazy object");
+            if (!((*lazy).*LazyObjectAccess::frozenMember()))
+                lazyObjects.push_back(lazy);
+        }
+        if (changed == 0)
+            return 0;
+
+        ObservableSettings& settings = ObservableSettings::instance();
+        bool deferring = settings.updatesEnabled();
+        for (const auto& lazy : lazyObjects)
+            lazy->freeze();
+        try {
+            if (deferring)
+                settings.disableUpdates(true);
+            try {
+                for (Size i = 0; i < quotes.size(); ++i)
+                    simpleQuotes[i]->setValue(values[i]);
+            } catch (...) {
+                if (deferring)
+                    settings.enableUpdates();
+                throw;
+            }
+            // the direct observers of the quotes are notified here
+            if (deferring)
+                settings.enableUpdates();
+        } catch (...) {
+            for (const auto& lazy : lazyObjects)
+                lazy->unfreeze();
+            throw;
+        }
+        // and the held objects send a single notification each
+        for (const auto& lazy : lazyObjects)
+            lazy->unfreeze();
+        return changed;
+    }
+
+    void NotificationCounter::registerWith(const ext::shared_ptr<Observable>& observable) {
+        auto probe = ext::make_shared<Probe>();
+        probe->registerWith(observable);
+        probes_.push_back(probe);
+    }
+
+    void NotificationCounter::unregisterWithAll() {
+        probes_.clear();
+    }
+
+    Size NotificationCounter::notifications() const {
+        Size result = 0;
+        for (const auto& p : probes_)
+            result += p->count;
+        return result;
+    }
+
+    Size NotificationCounter::notifiedObservables() const {
+        return std::count_if(probes_.begin(), probes_.end(),
+                             [](const ext::shared_ptr<Probe>& p) { return p->count > 0; });
+    }
+
+    void NotificationCounter::reset() {
+        for (auto& p : probes_)
+            p->count = 0;
+    }
+
+} // namespace QuantLib
@@ -0,0 +1,58 @@
+#ifndef Notifications_HPP
+#define Notifications_HPP
+
+#include <ql/math/array.hpp>
+#include <ql/patterns/observable.hpp>
+#include <ql/quote.hpp>
+#include <vector>
+
+namespace QuantLib {
+
+    //! sets the values of many SimpleQuote instances at once
+    /*! Notifications are deferred while the values are set, so that
+        each direct observer of the quotes (e.g., a handle or a rate
+        helper) is notified once.  Observers further down receive one
+        notification from each of those, unless they are given in
+        \p held: these lazy objects, typically the curves built on the
+        quotes, are frozen while the deferred notifications go out and
+        send a single one when released.  Held objects should depend on
+        the quotes, since they notify even if none of their inputs
+        changed; those already frozen are left alone, and so are updates
+        if already disabled.  Returns the number of quotes whose value
+        changed; nothing is notified if none did.
+    */
+    Size setQuoteValues(const std::vector<ext::shared_ptr<Quote> >& quotes,
+                        const Array& values,
+                        const std::vector<ext::shared_ptr<Observable> >& held =
+                            std::vector<ext::shared_ptr<Observable> >());
+
+    //! counts the notifications sent by a set of observables
+    /*! Meant for diagnostics: registered with the curves or
+        instruments of a pricing graph, it tells how many notifications
+        reached them and how many of them were invalidated, i.e., will
+        recalculate when next asked for results.
+    */
+    class NotificationCounter {
+      public:
+        void registerWith(const ext::shared_ptr<Observable>& observable);
+        void unregisterWithAll();
+        //! number of registered observables
+        Size observables() const { return probes_.size(); }
+        //! notifications received since construction or the last reset
+        Size notifications() const;
+        //! registered observables that sent at least one of them
+        Size notifiedObservables() const;
+        void reset();
+
+      private:
+        class Probe : public Observer {
+          public:
+            Size count = 0;
+            void update() override { ++count; }
+        };
+        std::vector<ext::shared_ptr<Probe> > probes_;
+    };
+
+} // namespace QuantLib
+
+#endif // Notifications_HPP
@@ -0,0 +1,84 @@
+#include <ql/indexes/indexmanager.hpp>
+#include <ql/settings.hpp>
+#include <qlex/patterns/Sessions.hpp>
+#include <mutex>
+#include <vector>
+
+namespace QuantLib {
+
+    namespace {
+        thread_local ThreadKey currentSession_ = ThreadKey();
+
+        std::mutex sessionsMutex_;
+        ThreadKey nextSession_ = ThreadKey() + 1;
+        std::vector<ThreadKey> releasedSessions_;
+    }
+
+#if defined(QL_ENABLE_SESSIONS)
+    // required by QuantLib when sessions are enabled
+    ThreadKey sessionId() { return currentSession_; }
+#endif
+
+    ThreadKey currentSession() { return currentSession_; }
+
+    void setCurrentSession(ThreadKey id) { currentSession_ = id; }
+
+    bool sessionsEnabled() {
+#if defined(QL_ENABLE_SESSIONS)
+        return true;
+#else
+        return false;
+#endif
+    }
+
+    ThreadKey acquireSession(bool copyFixings) {
+        ThreadKey id;
+        bool reused;
+        {
+            std::lock_guard<std::mutex> lock(sessionsMutex_);
+            reused = !releasedSessions_.empty();
+            if (reused) {
+                id = releasedSessions_.back();
+                releasedSessions_.pop_back();
+            } else {
+                id = nextSession_++;
+            }
+        }
+
+        std::vector<std::string> names;
+        std::vector<TimeSeries<Real> > histories;
+        if (copyFixings) {
+            names = IndexManager::instance().histories();
+            for (const auto& name : names)
+                histories.push_back(IndexManager::instance().getHistory(name));
+        }
+
+        SessionGuard guard(id);
+        if (reused) {
+            Settings& settings = Settings::instance();
+            settings.evaluationDate() = Date();
+            settings.includeReferenceDateEvents() = false;
+            settings.includeTodaysCashFlows() = boost::none;
+            settings.enforcesTodaysHistoricFixings() = false;
+            IndexManager::instance().clearHistories();
+        }
+        for (Size i = 0; i < names.size(); ++i)
+            IndexManager::instance().setHistory(names[i], histories[i]);
+        return id;
+    }
+
+    void releaseSession(ThreadKey id) {
+        QL_REQUIRE(id != ThreadKey(), "the default session cannot be released");
+        QL_REQUIRE(id != currentSession_,
+                   "the current session of the calling thread cannot be released");
+        std::lock_guard<std::mutex> lock(sessionsMutex_);
+        releasedSessions_.push_back(id);
+    }
+
+    SessionGuard::SessionGuard(ThreadKey id) : previous_(currentSession_) {
+        currentSession_ = id;
+    }
+
+    SessionGuard::~SessionGuard() { currentSession_ = previous_; }
+
+} // namespace QuantLib
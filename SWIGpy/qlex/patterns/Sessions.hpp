@@ -0,0 +1,47 @@
+#ifndef Sessions_HPP
+#define Sessions_HPP
+
+#include <ql/patterns/singleton.hpp>
+
+namespace QuantLib {
+
+    //! session used by the QuantLib singletons on the calling thread
+    /*! Unless changed, every thread works in the default session.
+        When QuantLib is built with QL_ENABLE_SESSIONS, this value is
+        what sessionId() returns, so that Settings, IndexManager and
+        the other singletons are looked up per session.
+    */
+    ThreadKey currentSession();
+
+    //! moves the calling thread to the given session
+    void setCurrentSession(ThreadKey id);
+
+    //! whether QuantLib was built with QL_ENABLE_SESSIONS
+    bool sessionsEnabled();
+
+    //! a session with default settings and no fixings
+    /*! Sessions given back with releaseSession are reused, after
+        their settings are reset and their fixings cleared.  If
+        copyFixings is true, the fixings of the session of the calling
+        thread are copied into the new one.
+    */
+    ThreadKey acquireSession(bool copyFixings = false);
+
+    //! gives back a session obtained from acquireSession
+    void releaseSession(ThreadKey id);
+
+    //! moves the calling thread to a session for the guard lifetime
+    class SessionGuard {
+      public:
+        explicit SessionGuard(ThreadKey id);
+        ~SessionGuard();
+        SessionGuard(const SessionGuard&) = delete;
+        SessionGuard& operator=(const SessionGuard&) = delete;
+
+      private:
+        ThreadKey previous_;
+    };
+
+} // namespace QuantLib
+
+#endif // Sessions_HPP
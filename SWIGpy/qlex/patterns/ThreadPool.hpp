@@ -0,0 +1,100 @@
+#ifndef ThreadPool_HPP
+#define ThreadPool_HPP
+
+#include <ql/errors.hpp>
+#include <qlex/patterns/Sessions.hpp>
+#include <algorithm>
+#include <atomic>
+#include <mutex>
+#include <string>
+#include <thread>
+#include <vector>
+
+namespace QuantLib {
+
+    //! the given number of threads, or the hardware concurrency if null
+    inline Size workerThreads(Size threads) {
+        return threads == 0 ? std::max<Size>(std::thread::hardware_concurrency(), 1) : threads;
+    }
+
+    namespace detail {
+
+        // runs worker(k) for k in [0, nThreads) on as many threads, in
+        // the session of the calling thread, and rethrows the first error
+        template <class Worker>
+        void runWorkers(Size nThreads, const Worker& worker) {
+            if (nThreads <= 1) {
+                worker(0);
+                return;
+            }
+
+            ThreadKey session = currentSession();
+            std::string error;
+            std::mutex errorMutex;
+            auto run = [&](Size k) {
+                SessionGuard guard(session);
+                try {
+                    worker(k);
+                } catch (std::exception& e) {
+                    std::lock_guard<std::mutex> lock(errorMutex);
+                    if (error.empty())
+                        error = e.what();
+                } catch (...) {
+                    std::lock_guard<std::mutex> lock(errorMutex);
+                    if (error.empty())
+                        error = "unknown error";
+                }
+            };
+
+            std::vector<std::thread> pool;
+            pool.reserve(nThreads);
+            for (Size k = 0; k < nThreads; ++k)
+                pool.emplace_back(run, k);
+            for (auto& t : pool)
+                t.join();
+            QL_REQUIRE(error.empty(), error);
+        }
+
+    }
+
+    //! calls f(begin, end) over contiguous stripes covering [0, n)
+    /*! The stripes are spread over the given number of threads (a null
+        number meaning the hardware concurrency); with a single one, f
+        runs on the calling thread.  Worker threads run in the session
+        of the calling thread, and the first error thrown by f is
+        rethrown once all of them are joined.
+    */
+    template <class F>
+    void parallelStripes(Size n, Size threads, const F& f) {
+        Size nThreads = std::min(workerThreads(threads), n);
+        if (nThreads <= 1) {
+            if (n > 0)
+                f(Size(0), n);
+            return;
+        }
+        Size stripe = (n + nThreads - 1) / nThreads;
+        detail::runWorkers(nThreads, [&](Size k) {
+            Size begin = k * stripe;
+            if (begin < n)
+                f(begin, std::min(begin + stripe, n));
+        });
+    }
+
+    //! calls f(i) for i in [0, n), handing out one index at a time
+    /*! Meant for tasks of uneven cost, such as pricing instruments;
+        threads and errors are handled as in parallelStripes, except
+        that a thread stops taking indices after an error.
+    */
+    template <class F>
+    void parallelFor(Size n, Size threads, const F& f) {
+        Size nThreads = std::min(workerThreads(threads), n);
+        std::atomic<Size> next(0);
+        detail::runWorkers(nThreads, [&](Size) {
+            for (Size i = next++; i < n; i = next++)
+                f(i);
+        });
+    }
+
+} // namespace QuantLib
+
+#endif // ThreadPool_HPP
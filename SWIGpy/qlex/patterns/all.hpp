@@ -0,0 +1,8 @@
+#ifndef qlex_patterns_all
+#define qlex_patterns_all
+
+#include <qlex/patterns/Notifications.hpp>
+#include <qlex/patterns/Sessions.hpp>
+#include <qlex/patterns/ThreadPool.hpp>
+
+#endif
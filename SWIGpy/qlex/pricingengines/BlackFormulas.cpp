@@ -0,0 +1,146 @@
+#include <ql/pricingengines/blackformula.hpp>
+#include <qlex/patterns/ThreadPool.hpp>
+#include <qlex/pricingengines/BlackFormulas.hpp>
+#include <initializer_list>
+#include <limits>
+
+namespace QuantLib {
+
+    namespace {
+
+        // common size of arguments holding one value or n values
+        Size batchSize(std::initializer_list<const Array*> arguments) {
+            Size n = 1;
+            for (const Array* a : arguments) {
+                QL_REQUIRE(!a->empty(), "empty argument");
+                if (a->size() != 1) {
+                    QL_REQUIRE(n == 1 || a->size() == n,
+                               "arguments of sizes " << n << " and " << a->size()
+                                                     << " cannot be broadcast together");
+                    n = a->size();
+                }
+            }
+            return n;
+        }
+
+        inline Real at(const Array& a, Size i) {
+            return a.size() == 1 ? a[0] : a[i];
+        }
+
+        Option::Type optionType(Real type) {
+            QL_REQUIRE(type == Real(Option::Call) || type == Real(Option::Put),
+                       "unknown option type (" << type << ")");
+            return Option::Type(int(type));
+        }
+
+        // calls f(i) for i in [0, n) over contiguous stripes
+        template <class F>
+        void forEach(Size n, Size threads, const F& f) {
+            parallelStripes(n, threads, [&](Size begin, Size end) {
+                for (Size i = begin; i < end; ++i)
+                    f(i);
+            });
+        }
+
+    }
+
+    Array blackFormulas(const Array& optionTypes,
+                        const Array& strikes,
+                        const Array& forwards,
+                        const Array& stdDevs,
+                        const Array& discounts,
+                        const Array& displacements,
+                        Size threads) {
+        Size n = batchSize(
+            {&optionTypes, &strikes, &forwards, &stdDevs, &discounts, &displacements});
+        Array result(n);
+        forEach(n, threads, [&](Size i) {
+            result[i] = blackFormula(optionType(at(optionTypes, i)), at(strikes, i),
+                                     at(forwards, i), at(stdDevs, i), at(discounts, i),
+                                     at(displacements, i));
+        });
+        return result;
+    }
+
+    Array bachelierBlackFormulas(const Array& optionTypes,
+                                 const Array& strikes,
+                                 const Array& forwards,
+                                 const Array& stdDevs,
+                                 const Array& discounts,
+                                 Size threads) {
+        Size n = batchSize({&optionTypes, &strikes, &forwards, &stdDevs, &discounts});
+        Array result(n);
+        forEach(n, threads, [&](Size i) {
+            result[i] = bachelierBlackFormula(optionType(at(optionTypes, i)), at(strikes, i),
+                                              at(forwards, i), at(stdDevs, i),
+                                              at(discounts, i));
+        });
+        return result;
+    }
+
+    Array blackFormulaImpliedStdDevs(const Array& optionTypes,
+                                     const Array& strikes,
+                                     const Array& forwards,
+                                     const Array& blackPrices,
+                                     const Array& discounts,
+                                     const Array& displacements,
+                                     Real accuracy,
+                                     Natural maxIterations,
+                                     Size threads) {
+        Size n = batchSize(
+            {&optionTypes, &strikes, &forwards, &blackPrices, &discounts, &displacements});
+        for (Size i = 0; i < optionTypes.size(); ++i)
+            optionType(optionTypes[i]);
+
+        Array result(n);
+        forEach(n, threads, [&](Size i) {
+            Option::Type type = optionType(at(optionTypes, i));
+            Real strike = at(strikes, i), forward = at(forwards, i),
+                 price = at(blackPrices, i), discount = at(discounts, i),
+                 displacement = at(displacements, i);
+            try {
+                Real guess = Null<Real>();
+                try {
+                    guess = blackFormulaImpliedStdDevApproximationRS(
+                        type, strike, forward, price, discount, displacement);
+                    if (!(guess > 0.0) || guess == QL_MAX_REAL)
+                        guess = Null<Real>();
+                } catch (Error&) {
+                    guess = Null<Real>();
+                }
+                result[i] = blackFormulaImpliedStdDev(type, strike, forward, price, discount,
+                                                      displacement, guess, accuracy,
+                                                      maxIterations);
+            } catch (Error&) {
+                result[i] = std::numeric_limits<Real>::quiet_NaN();
+            }
+        });
+        return result;
+    }
+
+    Array bachelierBlackFormulaImpliedVols(const Array& optionTypes,
+                                           const Array& strikes,
+                                           const Array& forwards,
+                                           const Array& tte,
+                                           const Array& bachelierPrices,
+                                           const Array& discounts,
+                                           Size threads) {
+        Size n = batchSize(
+            {&optionTypes, &strikes, &forwards, &tte, &bachelierPrices, &discounts});
+        for (Size i = 0; i < optionTypes.size(); ++i)
+            optionType(optionTypes[i]);
+
+        Array result(n);
+        forEach(n, threads, [&](Size i) {
+            try {
+                result[i] = bachelierBlackFormulaImpliedVol(
+                    optionType(at(optionTypes, i)), at(strikes, i), at(forwards, i),
+                    at(tte, i), at(bachelierPrices, i), at(discounts, i));
+            } catch (Error&) {
+                result[i] = std::numeric_limits<Real>::quiet_NaN();
+            }
+        });
+        return result;
+    }
+
+} // namespace QuantLib
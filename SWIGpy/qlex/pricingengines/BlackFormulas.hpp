@@ -0,0 +1,59 @@
+#ifndef BlackFormulas_HPP
+#define BlackFormulas_HPP
+
+#include <ql/math/array.hpp>
+
+namespace QuantLib {
+
+    /*! \name Black formulas over arrays
+
+        Each argument holds either one value, used for all options, or
+        one value per option; option types are given as 1 (call) or -1
+        (put), i.e., as Option::Type values.  The options are split in
+        contiguous stripes over the given number of threads.
+    */
+    //@{
+    Array blackFormulas(const Array& optionTypes,
+                        const Array& strikes,
+                        const Array& forwards,
+                        const Array& stdDevs,
+                        const Array& discounts,
+                        const Array& displacements,
+                        Size threads = 1);
+
+    Array bachelierBlackFormulas(const Array& optionTypes,
+                                 const Array& strikes,
+                                 const Array& forwards,
+                                 const Array& stdDevs,
+                                 const Array& discounts,
+                                 Size threads = 1);
+
+    //! implied standard deviations, NaN where no solution is found
+    /*! Each solve starts from the rational approximation of
+        blackFormulaImpliedStdDevApproximationRS, falling back to the
+        default guess of blackFormulaImpliedStdDev when it is not
+        available.
+    */
+    Array blackFormulaImpliedStdDevs(const Array& optionTypes,
+                                     const Array& strikes,
+                                     const Array& forwards,
+                                     const Array& blackPrices,
+                                     const Array& discounts,
+                                     const Array& displacements,
+                                     Real accuracy = 1.0e-6,
+                                     Natural maxIterations = 100,
+                                     Size threads = 1);
+
+    //! implied normal volatilities, NaN where no solution is found
+    Array bachelierBlackFormulaImpliedVols(const Array& optionTypes,
+                                           const Array& strikes,
+                                           const Array& forwards,
+                                           const Array& tte,
+                                           const Array& bachelierPrices,
+                                           const Array& discounts,
+                                           Size threads = 1);
+    //@}
+
+} // namespace QuantLib
+
+#endif // BlackFormulas_HPP
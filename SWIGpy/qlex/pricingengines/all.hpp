@@ -0,0 +1,6 @@
+#ifndef qlex_pricingengines_all
+#define qlex_pricingengines_all
+
+#include <qlex/pricingengines/BlackFormulas.hpp>
+
+#endif
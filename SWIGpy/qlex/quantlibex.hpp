@@ -5,6 +5,9 @@
 #include <qlex/indexes/all.hpp>
 #include <qlex/instruments/all.hpp>
 #include <qlex/math/all.hpp>
+#include <qlex/models/all.hpp>
+#include <qlex/patterns/all.hpp>
+#include <qlex/pricingengines/all.hpp>
 #include <qlex/termstructures/all.hpp>
 #include <qlex/time/all.hpp>
 
@@ -1,5 +1,6 @@
 #include <algorithm>
 #include <qlex/termstructures/yield/CubicSplinesFitting.hpp>
+#include <qlex/termstructures/yield/FittedBondTimes.hpp>
 
 namespace QuantLib {
 
@@ -31,6 +32,14 @@ namespace QuantLib {
         return splines_(i, t);
     }
 
+    Array CubicSplinesFitting::basisFunctions(Time t) const {
+        return basis_.values(splines_, t);
+    }
+
+    Array CubicSplinesFitting::discountGradient(const Array&, Time t) const {
+        return basisFunctions(t);
+    }
+
     QL_UNIQUE_OR_AUTO_PTR<FittedBondDiscountCurve::FittingMethod>
     CubicSplinesFitting::clone() const {
         return QL_UNIQUE_OR_AUTO_PTR<FittedBondDiscountCurve::FittingMethod>(
@@ -41,14 +50,13 @@ namespace QuantLib {
         return size_;
     }
 
-    DiscountFactor CubicSplinesFitting::discountFunction(const Array& x, Time t) const {
-        DiscountFactor d = 1.0;
-
-        for (Size i = 0; i < size_; ++i) {
-            d += x[i] * splines_(i + 1, t);
-        }
+    void CubicSplinesFitting::init() {
+        FittedBondDiscountCurve::FittingMethod::init();
+        basis_.reset(splines_, fittedBondTimes(*curve_));
+    }
 
-        return d;
+    DiscountFactor CubicSplinesFitting::discountFunction(const Array& x, Time t) const {
+        return 1.0 + basis_.dot(splines_, t, x);
     }
 
     std::vector<Time> CubicSplinesFitting::autoKnots(const std::vector<Time>& maturities) {
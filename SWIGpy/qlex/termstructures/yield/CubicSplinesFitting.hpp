@@ -4,6 +4,8 @@
 #include <ql/auto_ptr.hpp>
 #include <ql/termstructures/yield/fittedbonddiscountcurve.hpp>
 #include <qlex/math/CubicSpline.hpp>
+#include <qlex/termstructures/yield/FittingMethodGradient.hpp>
+#include <qlex/termstructures/yield/SplineBasisCache.hpp>
 
 namespace QuantLib {
 
@@ -20,7 +22,8 @@ namespace QuantLib {
 
         McCulloch JH (1975). The Tax-Adjusted Yield Curve. The Journal of Finance, 30(3), 811–830.
     */
-    class CubicSplinesFitting : public FittedBondDiscountCurve::FittingMethod {
+    class CubicSplinesFitting : public FittedBondDiscountCurve::FittingMethod,
+                                public FittingMethodGradient {
       public:
         CubicSplinesFitting(const std::vector<Time>& knotVector,
                             const Array& weights = Array(),
@@ -32,6 +35,10 @@ namespace QuantLib {
                             const Array& l2);
         //! cubic spline basis functions
         Real basisFunction(Integer i, Time t) const;
+        //! values of all basis functions, i.e. the gradient of d(t) w.r.t. the coefficients
+        Array basisFunctions(Time t) const;
+        Array discountGradient(const Array& x, Time t) const;
+        bool linearInParameters() const { return true; }
 
         //! function that calculates knot points from maturities of bonds
         static std::vector<Time> autoKnots(const std::vector<Time>& maturities);
@@ -42,9 +49,11 @@ namespace QuantLib {
 #endif
       private:
         Size size() const;
+        void init();
         DiscountFactor discountFunction(const Array& x, Time t) const;
         CubicSpline splines_;
         Size size_;
+        SplineBasisCache<CubicSpline> basis_;
     };
 
 } // namespace QuantLib
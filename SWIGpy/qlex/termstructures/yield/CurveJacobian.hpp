@@ -0,0 +1,159 @@
+#ifndef CurveJacobian_HPP
+#define CurveJacobian_HPP
+
+#include <ql/math/matrix.hpp>
+#include <ql/math/interpolations/interpolation.hpp>
+#include <ql/termstructures/yield/ratehelpers.hpp>
+#include <ql/utilities/dataformatters.hpp>
+#include <ql/utilities/null.hpp>
+#include <algorithm>
+#include <vector>
+
+namespace QuantLib {
+
+    namespace detail {
+
+        // protected members of the nodes of a piecewise curve; they are
+        // inherited from InterpolatedCurve through a protected base, so
+        // they are reached from a class derived from the curve itself
+        template <class PiecewiseCurve>
+        struct PiecewiseCurveAccess : PiecewiseCurve {
+            static std::vector<Real>& data(PiecewiseCurve& curve) {
+                return curve.*(&PiecewiseCurveAccess::data_);
+            }
+            static Interpolation& interpolation(PiecewiseCurve& curve) {
+                return curve.*(&PiecewiseCurveAccess::interpolation_);
+            }
+        };
+
+        // index of the curve node whose date is the pillar of each helper,
+        // or Null<Size>() for expired helpers
+        inline std::vector<Size>
+        helperNodes(const std::vector<Date>& dates,
+                    const std::vector<ext::shared_ptr<RateHelper> >& helpers) {
+            std::vector<Size> nodes(helpers.size(), Null<Size>());
+            for (Size k = 0; k < helpers.size(); ++k) {
+                QL_REQUIRE(helpers[k] != nullptr, "null helper given");
+                Date pillar = helpers[k]->pillarDate();
+                if (pillar <= dates.front())
+                    continue;
+                for (Size i = 1; i < dates.size(); ++i) {
+                    if (dates[i] == pillar) {
+                        nodes[k] = i;
+                        break;
+                    }
+                }
+                QL_REQUIRE(nodes[k] != Null<Size>(),
+                           "no curve node at the pillar (" << pillar << ") of the "
+                                                           << io::ordinal(k + 1) << " helper");
+            }
+            return nodes;
+        }
+
+    }
+
+    //! finite-difference sensitivities of the implied quotes to the nodes
+    /*! Entry (k, i) is the derivative of the k-th helper's implied
+        quote with respect to the i-th value in curve.data(), for i > 0,
+        obtained by central differences on the node values of the
+        bootstrapped curve; the curve is not bootstrapped again, but
+        all helpers are repriced twice for each node.  The helpers must
+        be the ones the curve was built on, in any order; expired
+        helpers have zero rows.
+    */
+    template <class PiecewiseCurve>
+    Matrix finiteDifferenceQuoteJacobian(
+        PiecewiseCurve& curve,
+        const std::vector<ext::shared_ptr<RateHelper> >& helpers,
+        Real bump = 1.0e-6) {
+        typedef typename PiecewiseCurve::traits_type Traits;
+        typedef detail::PiecewiseCurveAccess<PiecewiseCurve> Access;
+        QL_REQUIRE(bump > 0.0, "positive bump required");
+
+        // bootstraps the curve if needed
+        const std::vector<Date>& dates = curve.dates();
+        std::vector<Size> nodes = detail::helperNodes(dates, helpers);
+        std::vector<Real>& data = Access::data(curve);
+        Interpolation& interpolation = Access::interpolation(curve);
+
+        Matrix result(helpers.size(), data.size(), 0.0);
+        std::vector<Real> saved = data, up(helpers.size()), down(helpers.size());
+        for (Size i = 1; i < data.size(); ++i) {
+            try {
+                // as the bootstrap does, e.g., zero-yield traits also
+                // set the first node together with the second
+                Traits::updateGuess(data, saved[i] + bump, i);
+                interpolation.update();
+                for (Size k = 0; k < helpers.size(); ++k)
+                    if (nodes[k] != Null<Size>())
+                        up[k] = helpers[k]->impliedQuote();
+                Traits::updateGuess(data, saved[i] - bump, i);
+                interpolation.update();
+                for (Size k = 0; k < helpers.size(); ++k)
+                    if (nodes[k] != Null<Size>())
+                        down[k] = helpers[k]->impliedQuote();
+            } catch (...) {
+                data = saved;
+                interpolation.update();
+                throw;
+            }
+            data = saved;
+            interpolation.update();
+            for (Size k = 0; k < helpers.size(); ++k)
+                if (nodes[k] != Null<Size>())
+                    result[k][i] = (up[k] - down[k]) / (2.0 * bump);
+        }
+        return result;
+    }
+
+    //! finite-difference sensitivities of the curve nodes to the quotes
+    /*! Entry (i, k) is the derivative of the i-th value in curve.data()
+        with respect to the quote of the k-th helper.  Since the
+        bootstrap makes each implied quote equal to its quote, this is
+        the inverse of finiteDifferenceQuoteJacobian restricted to the
+        alive helpers; it is computed after the bootstrap, not during
+        it, and costs O(n^2) helper repricings for n nodes instead of
+        n bootstraps.  Expired helpers have zero columns; the first
+        node has zero sensitivities unless the traits tie it to the
+        second one.  Bucketed risk then follows by the chain rule from
+        sensitivities to the node values.
+    */
+    template <class PiecewiseCurve>
+    Matrix finiteDifferenceNodeJacobian(
+        PiecewiseCurve& curve,
+        const std::vector<ext::shared_ptr<RateHelper> >& helpers,
+        Real bump = 1.0e-6) {
+        typedef typename PiecewiseCurve::traits_type Traits;
+        Matrix quoteJacobian = finiteDifferenceQuoteJacobian(curve, helpers, bump);
+        std::vector<Size> nodes = detail::helperNodes(curve.dates(), helpers);
+
+        std::vector<Size> alive;
+        for (Size k = 0; k < helpers.size(); ++k)
+            if (nodes[k] != Null<Size>())
+                alive.push_back(k);
+        Size n = quoteJacobian.columns() - 1;
+        QL_REQUIRE(alive.size() == n,
+                   alive.size() << " alive helpers given for " << n << " curve nodes");
+
+        Matrix square(n, n);
+        for (Size r = 0; r < n; ++r)
+            for (Size i = 1; i <= n; ++i)
+                square[r][i - 1] = quoteJacobian[alive[r]][i];
+        Matrix inv = inverse(square);
+
+        Matrix result(n + 1, helpers.size(), 0.0);
+        for (Size i = 1; i <= n; ++i)
+            for (Size r = 0; r < n; ++r)
+                result[i][alive[r]] = inv[i - 1][r];
+
+        std::vector<Real> data = curve.data();
+        Real first = data[0];
+        Traits::updateGuess(data, data[1] + 1.0, 1);
+        if (data[0] != first)
+            std::copy(result.row_begin(1), result.row_end(1), result.row_begin(0));
+        return result;
+    }
+
+} // namespace QuantLib
+
+#endif // CurveJacobian_HPP
@@ -32,4 +32,15 @@ namespace QuantLib {
         return d;
     }
 
+    Array DieboldLiFitting::discountGradient(const Array& x, Time t) const {
+        Real e = std::exp(-kappa_ * t);
+        Real g = (1.0 - e) / ((kappa_ + QL_EPSILON) * (t + QL_EPSILON));
+        Real scale = -t * discountFunction(x, t);
+        Array gradient(3);
+        gradient[0] = scale;
+        gradient[1] = scale * g;
+        gradient[2] = scale * (g - e);
+        return gradient;
+    }
+
 } // namespace QuantLib
@@ -3,6 +3,7 @@
 
 #include <ql/auto_ptr.hpp>
 #include <ql/termstructures/yield/fittedbonddiscountcurve.hpp>
+#include <qlex/termstructures/yield/FittingMethodGradient.hpp>
 
 namespace QuantLib {
 
@@ -20,7 +21,8 @@ namespace QuantLib {
         See: Ferstl R, Hayden J (2010). Zero-Coupon Yield Curve Estimation with
         the Package termstrc. Journal of Statistical Software, Volume 36, Issue 1.
     */
-    class DieboldLiFitting : public FittedBondDiscountCurve::FittingMethod {
+    class DieboldLiFitting : public FittedBondDiscountCurve::FittingMethod,
+                             public FittingMethodGradient {
       public:
         DieboldLiFitting(Real kappa,
                          const Array& weights = Array(),
@@ -38,6 +40,10 @@ namespace QuantLib {
             return kappa_;
         }
 
+        Array discountGradient(const Array& x, Time t) const;
+        //! the zero rate, not the discount factor, is linear in x
+        bool linearInParameters() const { return false; }
+
       private:
         Size size() const;
         DiscountFactor discountFunction(const Array& x, Time t) const;
@@ -0,0 +1,41 @@
+#include <algorithm>
+#include <qlex/termstructures/yield/FittedBondTimes.hpp>
+
+namespace QuantLib {
+
+    namespace {
+
+        // the helpers are private and only FittingMethod is a friend of
+        // the curve; an explicit instantiation may name private members
+        typedef std::vector<ext::shared_ptr<BondHelper> > FittedBondDiscountCurve::*HelpersMember;
+
+        template <HelpersMember Member>
+        struct BondHelpersAccess {
+            friend HelpersMember bondHelpersMember() { return Member; }
+        };
+
+        HelpersMember bondHelpersMember();
+
+        template struct BondHelpersAccess<&FittedBondDiscountCurve::bondHelpers_>;
+
+    }
+
+    std::vector<Time> fittedBondTimes(const FittedBondDiscountCurve& curve) {
+        const std::vector<ext::shared_ptr<BondHelper> >& helpers = curve.*bondHelpersMember();
+        Date referenceDate = curve.referenceDate();
+        DayCounter dayCounter = curve.dayCounter();
+
+        std::vector<Time> times;
+        for (Size i = 0; i < helpers.size(); ++i) {
+            const ext::shared_ptr<Bond>& bond = helpers[i]->bond();
+            times.push_back(dayCounter.yearFraction(referenceDate, bond->settlementDate()));
+            const Leg& cashflows = bond->cashflows();
+            for (Size j = 0; j < cashflows.size(); ++j)
+                times.push_back(dayCounter.yearFraction(referenceDate, cashflows[j]->date()));
+        }
+        std::sort(times.begin(), times.end());
+        times.erase(std::unique(times.begin(), times.end()), times.end());
+        return times;
+    }
+
+} // namespace QuantLib
@@ -0,0 +1,21 @@
+#ifndef FittedBondTimes_HPP
+#define FittedBondTimes_HPP
+
+#include <ql/termstructures/yield/fittedbonddiscountcurve.hpp>
+
+namespace QuantLib {
+
+    //! times at which the fitting cost of a curve evaluates its discount function
+    /*! These are the cashflow and settlement dates of the bonds fitted
+        by the curve, measured from its reference date with its day
+        counter as FittedBondDiscountCurve does. The result is sorted
+        and has no duplicates.
+
+        \note the bond helpers are private to FittedBondDiscountCurve;
+              this is meant to be called from FittingMethod::init().
+    */
+    std::vector<Time> fittedBondTimes(const FittedBondDiscountCurve& curve);
+
+} // namespace QuantLib
+
+#endif // FittedBondTimes_HPP
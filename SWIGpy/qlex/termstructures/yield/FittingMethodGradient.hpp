@@ -0,0 +1,24 @@
+#ifndef FittingMethodGradient_HPP
+#define FittingMethodGradient_HPP
+
+#include <ql/math/array.hpp>
+
+namespace QuantLib {
+
+    //! fitting methods with an analytic gradient of the discount function
+    /*! Implemented by the qlex fitting methods alongside
+        FittedBondDiscountCurve::FittingMethod, so that LeastSquaresBondFitter
+        can build exact Jacobians.
+    */
+    class FittingMethodGradient {
+      public:
+        virtual ~FittingMethodGradient() = default;
+        //! gradient of d(t) with respect to the parameters x
+        virtual Array discountGradient(const Array& x, Time t) const = 0;
+        //! true if d(t) is affine in the parameters
+        virtual bool linearInParameters() const = 0;
+    };
+
+} // namespace QuantLib
+
+#endif // FittingMethodGradient_HPP
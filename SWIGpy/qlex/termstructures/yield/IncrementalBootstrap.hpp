@@ -0,0 +1,405 @@
+#ifndef IncrementalBootstrap_HPP
+#define IncrementalBootstrap_HPP
+
+#include <ql/math/interpolations/linearinterpolation.hpp>
+#include <ql/math/solvers1d/brent.hpp>
+#include <ql/math/solvers1d/finitedifferencenewtonsafe.hpp>
+#include <ql/patterns/observable.hpp>
+#include <ql/termstructures/bootstraperror.hpp>
+#include <ql/termstructures/bootstraphelper.hpp>
+#include <ql/termstructures/iterativebootstrap.hpp>
+#include <ql/utilities/dataformatters.hpp>
+#include <algorithm>
+#include <cmath>
+#include <numeric>
+#include <vector>
+
+namespace QuantLib {
+
+    namespace detail {
+
+        //! raised when the observed bootstrap helper notifies
+        class HelperChangeFlag : public Observer {
+          public:
+            void update() override { raised_ = true; }
+            bool raised() const { return raised_; }
+            void lower() { raised_ = false; }
+
+          private:
+            bool raised_ = true;
+        };
+
+    }
+
+    //! Iterative bootstrap re-solving only the pillars after a change
+    /*! Works as IterativeBootstrap, but keeps track of the helpers
+        that notified since the last bootstrap.  When the curve nodes
+        can be reused, the pillar loop restarts from the first pillar
+        whose helper changed: earlier nodes are kept as they are, and
+        later ones are solved starting from their previous values.
+
+        Reusing the earlier nodes is exact when the interpolation is
+        local and each helper's pillar is its latest relevant date.
+        Otherwise, and whenever the curve dates move, the jumps change
+        or a restart fails, a full warm-started bootstrap is run as in
+        IterativeBootstrap.  Changes in the jumps are detected by
+        comparing their effect on the node discounts with the one seen
+        by the previous bootstrap.
+    */
+    template <class Curve>
+    class IncrementalBootstrap {
+        typedef typename Curve::traits_type Traits;
+        typedef typename Curve::interpolator_type Interpolator;
+
+      public:
+        explicit IncrementalBootstrap(Real accuracy = Null<Real>(),
+                                      Real minValue = Null<Real>(),
+                                      Real maxValue = Null<Real>(),
+                                      Size maxAttempts = 1,
+                                      Real maxFactor = 2.0,
+                                      Real minFactor = 2.0,
+                                      bool dontThrow = false,
+                                      Size dontThrowSteps = 10)
+        : accuracy_(accuracy), minValue_(minValue), maxValue_(maxValue),
+          maxAttempts_(maxAttempts), maxFactor_(maxFactor), minFactor_(minFactor),
+          dontThrow_(dontThrow), dontThrowSteps_(dontThrowSteps) {
+            QL_REQUIRE(maxFactor_ >= 1.0, "Expected that maxFactor would be at least 1.0 "
+                                          "but got " << maxFactor_);
+            QL_REQUIRE(minFactor_ >= 1.0, "Expected that minFactor would be at least 1.0 "
+                                          "but got " << minFactor_);
+        }
+
+        void setup(Curve* ts);
+        void calculate() const;
+
+        //! first pillar solved by the last bootstrap of the given curve
+        /*! This is 1 after a full bootstrap, and 0 if the curve was not
+            bootstrapped yet.
+        */
+        static Size lastRestartPillar(const Curve& ts) {
+            return ts.bootstrap_.restartPillar_;
+        }
+
+      private:
+        void initialize() const;
+        // first pillar to be solved, 1 for a full bootstrap
+        Size firstChangedPillar() const;
+        // cumulated jump factors at the node times
+        std::vector<Real> jumpEffects() const;
+
+        Real accuracy_;
+        Real minValue_, maxValue_;
+        Size maxAttempts_;
+        Real maxFactor_, minFactor_;
+        bool dontThrow_;
+        Size dontThrowSteps_;
+        Curve* ts_ = nullptr;
+        Size n_ = 0;
+        Brent firstSolver_;
+        FiniteDifferenceNewtonSafe solver_;
+        mutable bool initialized_ = false, validCurve_ = false, loopRequired_ = false;
+        mutable bool datesChanged_ = true;
+        mutable Size firstAliveHelper_ = 0, alive_ = 0;
+        mutable Size restartPillar_ = 0;
+        mutable std::vector<Real> jumpEffects_;
+        mutable std::vector<Real> previousData_;
+        mutable std::vector<ext::shared_ptr<BootstrapError<Curve> > > errors_;
+        // parallel to ts_->instruments_
+        mutable std::vector<ext::shared_ptr<detail::HelperChangeFlag> > changed_;
+    };
+
+
+    template <class Curve>
+    void IncrementalBootstrap<Curve>::setup(Curve* ts) {
+        ts_ = ts;
+        n_ = ts_->instruments_.size();
+        QL_REQUIRE(n_ > 0, "no bootstrap helpers given");
+        changed_.resize(n_);
+        for (Size j = 0; j < n_; ++j) {
+            ts_->registerWith(ts_->instruments_[j]);
+            changed_[j] = ext::make_shared<detail::HelperChangeFlag>();
+            changed_[j]->registerWith(ts_->instruments_[j]);
+        }
+        // do not initialize yet: instruments could be invalid here
+        // but valid later when bootstrapping is actually required
+    }
+
+    template <class Curve>
+    void IncrementalBootstrap<Curve>::initialize() const {
+        // ensure helpers are sorted, keeping their flags alongside
+        std::vector<Size> order(n_);
+        std::iota(order.begin(), order.end(), Size(0));
+        std::stable_sort(order.begin(), order.end(), [this](Size i, Size j) {
+            return detail::BootstrapHelperSorter()(ts_->instruments_[i],
+                                                   ts_->instruments_[j]);
+        });
+        auto instruments = ts_->instruments_;
+        auto changed = changed_;
+        for (Size j = 0; j < n_; ++j) {
+            ts_->instruments_[j] = instruments[order[j]];
+            changed_[j] = changed[order[j]];
+        }
+
+        // skip expired helpers
+        Date firstDate = Traits::initialDate(ts_);
+        QL_REQUIRE(ts_->instruments_[n_ - 1]->pillarDate() > firstDate,
+                   "all instruments expired");
+        firstAliveHelper_ = 0;
+        while (ts_->instruments_[firstAliveHelper_]->pillarDate() <= firstDate)
+            ++firstAliveHelper_;
+        alive_ = n_ - firstAliveHelper_;
+        Size nodes = alive_ + 1;
+        QL_REQUIRE(nodes >= Interpolator::requiredPoints,
+                   "not enough alive instruments: " << alive_ << " provided, "
+                                                    << Interpolator::requiredPoints - 1
+                                                    << " required");
+
+        // calculate dates and times, create errors_
+        std::vector<Date> previousDates = ts_->dates_;
+        std::vector<Date>& dates = ts_->dates_;
+        std::vector<Time>& times = ts_->times_;
+        dates.resize(alive_ + 1);
+        times.resize(alive_ + 1);
+        errors_.resize(alive_ + 1);
+        dates[0] = firstDate;
+        times[0] = ts_->timeFromReference(dates[0]);
+
+        loopRequired_ = false;
+        Date latestRelevantDate, maxDate = firstDate;
+        // pillar counter: i
+        // helper counter: j
+        for (Size i = 1, j = firstAliveHelper_; j < n_; ++i, ++j) {
+            const ext::shared_ptr<typename Traits::helper>& helper = ts_->instruments_[j];
+            dates[i] = helper->pillarDate();
+            times[i] = ts_->timeFromReference(dates[i]);
+            // check for duplicated pillars
+            QL_REQUIRE(dates[i - 1] != dates[i],
+                       "more than one instrument with pillar " << dates[i]);
+
+            latestRelevantDate = helper->latestRelevantDate();
+            // check that the helper is really extending the curve, i.e. that
+            // pillar-sorted helpers are also sorted by latestRelevantDate
+            QL_REQUIRE(latestRelevantDate > maxDate,
+                       io::ordinal(j + 1) << " instrument (pillar: " << dates[i]
+                                          << ") has latestRelevantDate ("
+                                          << latestRelevantDate
+                                          << ") before or equal to "
+                                             "previous instrument's latestRelevantDate ("
+                                          << maxDate << ")");
+            maxDate = latestRelevantDate;
+
+            // when a pillar date is different from the last relevant date the
+            // convergence loop is required even if the Interpolator is local
+            if (dates[i] != latestRelevantDate)
+                loopRequired_ = true;
+
+            errors_[i] = ext::make_shared<BootstrapError<Curve> >(ts_, helper, i);
+        }
+        ts_->maxDate_ = maxDate;
+        datesChanged_ = (dates != previousDates);
+
+        // set initial guess only if the current curve cannot be used as guess
+        if (!validCurve_ || ts_->data_.size() != alive_ + 1) {
+            // ts_->data_[0] is the only relevant item,
+            // but reasonable numbers might be needed for the whole data vector
+            // because, e.g., of interpolation's early checks
+            ts_->data_ = std::vector<Real>(alive_ + 1, Traits::initialValue(ts_));
+            previousData_.resize(alive_ + 1);
+        }
+        initialized_ = true;
+    }
+
+    template <class Curve>
+    Size IncrementalBootstrap<Curve>::firstChangedPillar() const {
+        if (!validCurve_ || datesChanged_ || Interpolator::global || loopRequired_)
+            return 1;
+        // a jump moves all the nodes after it, whatever the helpers did
+        if (jumpEffects() != jumpEffects_)
+            return 1;
+        for (Size i = 1; i <= alive_; ++i) {
+            if (changed_[firstAliveHelper_ + i - 1]->raised())
+                return i;
+        }
+        // no helper changed, so something else did
+        return 1;
+    }
+
+    template <class Curve>
+    std::vector<Real> IncrementalBootstrap<Curve>::jumpEffects() const {
+        std::vector<Real> effects;
+        if (ts_->jumpDates().empty())
+            return effects;
+        // the curve nodes are valid here, and the ratio does not depend on them
+        effects.resize(alive_);
+        for (Size i = 1; i <= alive_; ++i) {
+            Time t = ts_->times_[i];
+            effects[i - 1] = ts_->discount(t, true) / ts_->discountImpl(t);
+        }
+        return effects;
+    }
+
+    template <class Curve>
+    void IncrementalBootstrap<Curve>::calculate() const {
+        // as in IterativeBootstrap, helpers might be date relative
+        // and change with the evaluation date
+        if (!initialized_ || ts_->moving_)
+            initialize();
+
+        // setup helpers
+        for (Size j = firstAliveHelper_; j < n_; ++j) {
+            const ext::shared_ptr<typename Traits::helper>& helper = ts_->instruments_[j];
+            // check for valid quote
+            QL_REQUIRE(helper->quote()->isValid(),
+                       io::ordinal(j + 1) << " instrument (maturity: "
+                                          << helper->maturityDate()
+                                          << ", pillar: " << helper->pillarDate()
+                                          << ") has an invalid quote");
+            // don't try this at home!
+            // This call creates helpers, and removes "const".
+            // There is a significant interaction with observability.
+            helper->setTermStructure(const_cast<Curve*>(ts_));
+        }
+
+        const std::vector<Time>& times = ts_->times_;
+        const std::vector<Real>& data = ts_->data_;
+        // same default as PiecewiseYieldCurve
+        Real accuracy = accuracy_ != Null<Real>() ? accuracy_ : 1.0e-12;
+
+        Size maxIterations = Traits::maxIterations() - 1;
+
+        // there might be a valid curve state to use as guess
+        bool validData = validCurve_;
+        // nodes before this pillar are kept as they are
+        Size firstPillar = firstChangedPillar();
+
+        for (Size iteration = 0;; ++iteration) {
+            previousData_ = ts_->data_;
+
+            // Store min value and max value at each pillar so that we can
+            // expand search if necessary.
+            std::vector<Real> minValues(alive_ + 1, Null<Real>());
+            std::vector<Real> maxValues(alive_ + 1, Null<Real>());
+            std::vector<Size> attempts(alive_ + 1, 1);
+
+            for (Size i = firstPillar; i <= alive_; ++i) { // pillar loop
+
+                // shorter aliases for readability and to avoid duplication
+                Real& min = minValues[i];
+                Real& max = maxValues[i];
+
+                // bracket root and calculate guess
+                if (min == Null<Real>()) {
+                    // First attempt so we take min and max from the user or the traits.
+                    min = (minValue_ != Null<Real>() ?
+                               minValue_ :
+                               Traits::minValueAfter(i, ts_, validData, firstAliveHelper_));
+                    max = (maxValue_ != Null<Real>() ?
+                               maxValue_ :
+                               Traits::maxValueAfter(i, ts_, validData, firstAliveHelper_));
+                } else {
+                    // Subsequent attempts: widen the min and max bracket.
+                    min = (min < 0.0 ? Real(min * minFactor_) : Real(min / minFactor_));
+                    max = (max > 0.0 ? Real(max * maxFactor_) : Real(max / maxFactor_));
+                }
+                Real guess = Traits::guess(i, ts_, validData, firstAliveHelper_);
+
+                // adjust guess if needed
+                if (guess >= max)
+                    guess = max - (max - min) / 5.0;
+                else if (guess <= min)
+                    guess = min + (max - min) / 5.0;
+
+                // extend interpolation if needed
+                if (!validData) {
+                    try { // extend interpolation a point at a time
+                          // including the pillar to be boostrapped
+                        ts_->interpolation_ = ts_->interpolator_.interpolate(
+                            times.begin(), times.begin() + i + 1, data.begin());
+                    } catch (...) {
+                        if (!Interpolator::global)
+                            throw; // no chance to fix it in a later iteration
+
+                        // otherwise use Linear while the target
+                        // interpolation is not usable yet
+                        ts_->interpolation_ = Linear().interpolate(
+                            times.begin(), times.begin() + i + 1, data.begin());
+                    }
+                    ts_->interpolation_.update();
+                }
+
+                try {
+                    if (validData)
+                        solver_.solve(*errors_[i], accuracy, guess, min, max);
+                    else
+                        firstSolver_.solve(*errors_[i], accuracy, guess, min, max);
+                } catch (std::exception& e) {
+                    if (validCurve_) {
+                        // the previous curve state might have been a
+                        // bad guess, so we retry without using it.
+                        validCurve_ = initialized_ = false;
+                        calculate();
+                        return;
+                    }
+
+                    // If we have more attempts left on this iteration, try
+                    // again. The max and min bounds will be widened on the retry.
+                    if (attempts[i] < maxAttempts_) {
+                        attempts[i]++;
+                        i--;
+                        continue;
+                    }
+
+                    if (dontThrow_) {
+                        // Use the fallback value
+                        ts_->data_[i] = detail::dontThrowFallback(*errors_[i], min, max,
+                                                                  dontThrowSteps_);
+                        ts_->interpolation_.update();
+                    } else {
+                        QL_FAIL(io::ordinal(iteration + 1)
+                                << " iteration: failed "
+                                   "at "
+                                << io::ordinal(i)
+                                << " alive instrument, "
+                                   "pillar "
+                                << errors_[i]->helper()->pillarDate() << ", maturity "
+                                << errors_[i]->helper()->maturityDate()
+                                << ", reference date " << ts_->dates_[0] << ": "
+                                << e.what());
+                    }
+                }
+            }
+
+            if (!loopRequired_)
+                break;
+
+            // exit condition
+            Real change = std::fabs(data[1] - previousData_[1]);
+            for (Size i = 2; i <= alive_; ++i)
+                change = std::max(change, std::fabs(data[i] - previousData_[i]));
+            if (change <= accuracy) // convergence reached
+                break;
+
+            // If we hit the max number of iterations and dontThrow is true,
+            // just use what we have
+            if (iteration == maxIterations) {
+                if (dontThrow_) {
+                    break;
+                } else {
+                    QL_FAIL("convergence not reached after "
+                            << iteration << " iterations; last improvement " << change
+                            << ", required accuracy " << accuracy);
+                }
+            }
+            validData = true;
+        }
+        validCurve_ = true;
+        datesChanged_ = false;
+        restartPillar_ = firstPillar;
+        jumpEffects_ = jumpEffects();
+        for (const auto& flag : changed_)
+            flag->lower();
+    }
+
+} // namespace QuantLib
+
+#endif // IncrementalBootstrap_HPP
@@ -0,0 +1,165 @@
+#include <ql/math/matrixutilities/qrdecomposition.hpp>
+#include <ql/pricingengines/bond/bondfunctions.hpp>
+#include <qlex/termstructures/yield/FittingMethodGradient.hpp>
+#include <qlex/termstructures/yield/LeastSquaresBondFitter.hpp>
+
+namespace QuantLib {
+
+    namespace {
+
+        struct BondData {
+            std::vector<Time> times;
+            std::vector<Real> amounts;
+            Real accrued;
+            Time settlement; // null when settling at the reference date
+            Real price;
+        };
+
+        Array discountGradient(const FittedBondDiscountCurve::FittingMethod& method,
+                               const FittingMethodGradient* analytic,
+                               const Array& x,
+                               Time t) {
+            if (analytic != nullptr)
+                return analytic->discountGradient(x, t);
+
+            Array gradient(x.size());
+            Array y(x);
+            Real d = method.discount(x, t);
+            for (Size j = 0; j < x.size(); ++j) {
+                Real h = 1.0e-7 * std::max(1.0, std::fabs(x[j]));
+                y[j] = x[j] + h;
+                gradient[j] = (method.discount(y, t) - d) / h;
+                y[j] = x[j];
+            }
+            return gradient;
+        }
+
+    }
+
+    LeastSquaresBondFitter::LeastSquaresBondFitter(Size maxIterations, Real accuracy)
+    : maxIterations_(maxIterations), accuracy_(accuracy), iterations_(0), costValue_(Null<Real>()) {
+        QL_REQUIRE(maxIterations_ > 0, "at least one iteration required");
+    }
+
+    ext::shared_ptr<FittedBondDiscountCurve>
+    LeastSquaresBondFitter::fit(const Date& referenceDate,
+                                const std::vector<ext::shared_ptr<BondHelper> >& helpers,
+                                const DayCounter& dayCounter,
+                                const FittedBondDiscountCurve::FittingMethod& fittingMethod,
+                                const Array& guess) {
+
+        Size n = helpers.size();
+        Size p = fittingMethod.size();
+        QL_REQUIRE(n > 0, "no bond helpers given");
+
+        Array x = guess.empty() ? Array(p, 0.0) : guess;
+        QL_REQUIRE(x.size() == p, "guess has " << x.size() << " elements, "
+                                                << p << " required");
+        const Array prior(x);
+
+        Array l2 = fittingMethod.l2();
+        Size N = l2.size();
+        QL_REQUIRE(N <= p, "too many l2 weights given");
+
+        // same default weights as FittedBondDiscountCurve: 1/duration
+        Array weights = fittingMethod.weights();
+        bool calculateWeights = weights.empty();
+        if (calculateWeights)
+            weights = Array(n);
+        QL_REQUIRE(weights.size() == n, "wrong number of weights given");
+
+        std::vector<BondData> bonds(n);
+        Real squaredSum = 0.0;
+        for (Size i = 0; i < n; ++i) {
+            const ext::shared_ptr<BondHelper>& helper = helpers[i];
+            ext::shared_ptr<Bond> bond = helper->bond();
+            Date settlement = bond->settlementDate();
+            BondData& b = bonds[i];
+
+            const Leg& cf = bond->cashflows();
+            for (const auto& c : cf) {
+                if (!c->hasOccurred(settlement, false)) {
+                    b.times.push_back(dayCounter.yearFraction(referenceDate, c->date()));
+                    b.amounts.push_back(c->amount());
+                }
+            }
+            b.accrued = helper->useCleanPrice() ? bond->accruedAmount(settlement) : 0.0;
+            b.settlement = settlement != referenceDate ?
+                               dayCounter.yearFraction(referenceDate, settlement) :
+                               Null<Time>();
+            b.price = helper->quote()->value();
+
+            if (calculateWeights) {
+                Real cleanPrice = helper->useCleanPrice() ?
+                                      b.price :
+                                      b.price - bond->accruedAmount(settlement);
+                Rate ytm = BondFunctions::yield(*bond, cleanPrice, dayCounter, Compounded,
+                                                Annual, settlement);
+                Time duration = BondFunctions::duration(*bond, ytm, dayCounter, Compounded,
+                                                        Annual, Duration::Modified, settlement);
+                weights[i] = 1.0 / duration;
+                squaredSum += weights[i] * weights[i];
+            }
+        }
+        if (calculateWeights)
+            weights /= std::sqrt(squaredSum);
+
+        const FittingMethodGradient* analytic =
+            dynamic_cast<const FittingMethodGradient*>(&fittingMethod);
+        bool linear = analytic != nullptr && analytic->linearInParameters();
+        bool forwardSettlement = false;
+        for (const auto& b : bonds)
+            forwardSettlement = forwardSettlement || b.settlement != Null<Time>();
+
+        // Jacobian and residuals of the weighted price errors at x;
+        // returns the cost value used by FittedBondDiscountCurve
+        Matrix A(n + N, p, 0.0);
+        Array r(n + N);
+        auto linearize = [&](const Array& x) {
+            for (Size i = 0; i < n; ++i) {
+                const BondData& b = bonds[i];
+                Real model = -b.accrued;
+                Array grad(p, 0.0);
+                for (Size k = 0; k < b.times.size(); ++k) {
+                    model += b.amounts[k] * fittingMethod.discount(x, b.times[k]);
+                    Array g = discountGradient(fittingMethod, analytic, x, b.times[k]);
+                    for (Size j = 0; j < p; ++j)
+                        grad[j] += b.amounts[k] * g[j];
+                }
+                if (b.settlement != Null<Time>()) {
+                    Real ds = fittingMethod.discount(x, b.settlement);
+                    Array gs = discountGradient(fittingMethod, analytic, x, b.settlement);
+                    for (Size j = 0; j < p; ++j)
+                        grad[j] = grad[j] / ds - model * gs[j] / (ds * ds);
+                    model /= ds;
+                }
+                r[i] = weights[i] * (b.price - model);
+                for (Size j = 0; j < p; ++j)
+                    A[i][j] = weights[i] * grad[j];
+            }
+            for (Size j = 0; j < N; ++j) {
+                Real s = std::sqrt(l2[j]);
+                A[n + j][j] = s;
+                r[n + j] = -s * (x[j] - prior[j]);
+            }
+            return DotProduct(r, r);
+        };
+
+        for (iterations_ = 1; iterations_ <= maxIterations_; ++iterations_) {
+            linearize(x);
+            Array dx = qrSolve(A, r);
+            x += dx;
+            if (linear && !forwardSettlement)
+                break;
+            if (Norm2(dx) <= accuracy_ * (1.0 + Norm2(x)))
+                break;
+        }
+        iterations_ = std::min(iterations_, maxIterations_);
+        costValue_ = linearize(x);
+        solution_ = x;
+
+        return ext::make_shared<FittedBondDiscountCurve>(referenceDate, helpers, dayCounter,
+                                                         fittingMethod, accuracy_, 0, x);
+    }
+
+} // namespace QuantLib
@@ -0,0 +1,54 @@
+#ifndef LeastSquaresBondFitter_HPP
+#define LeastSquaresBondFitter_HPP
+
+#include <ql/termstructures/yield/bondhelpers.hpp>
+#include <ql/termstructures/yield/fittedbonddiscountcurve.hpp>
+
+namespace QuantLib {
+
+    //! Gauss-Newton fit of a FittedBondDiscountCurve
+    /*! Minimizes the same weighted, L2-regularized price errors as
+        FittedBondDiscountCurve, but solves each Gauss-Newton step as a
+        linear least-squares problem by QR decomposition instead of
+        running a generic optimizer.
+
+        For fitting methods whose discount function is linear in the
+        parameters (CubicSplinesFitting, QuadraticSplinesFitting) the
+        first step is exact; further steps are only needed for bonds
+        settling after the reference date. DieboldLiFitting converges
+        in a few steps. Methods not implementing FittingMethodGradient
+        use a finite-difference gradient of the discount function.
+
+        \warning the returned curve is evaluated at the solution found
+                 (maxEvaluations = 0) and does not refit when quotes
+                 change; call fit() again instead.
+    */
+    class LeastSquaresBondFitter {
+      public:
+        LeastSquaresBondFitter(Size maxIterations = 20, Real accuracy = 1.0e-10);
+
+        ext::shared_ptr<FittedBondDiscountCurve>
+        fit(const Date& referenceDate,
+            const std::vector<ext::shared_ptr<BondHelper> >& helpers,
+            const DayCounter& dayCounter,
+            const FittedBondDiscountCurve::FittingMethod& fittingMethod,
+            const Array& guess = Array());
+
+        //! \name results of the last fit
+        //@{
+        const Array& solution() const { return solution_; }
+        Size numberOfIterations() const { return iterations_; }
+        Real minimumCostValue() const { return costValue_; }
+        //@}
+
+      private:
+        Size maxIterations_;
+        Real accuracy_;
+        Array solution_;
+        Size iterations_;
+        Real costValue_;
+    };
+
+} // namespace QuantLib
+
+#endif // LeastSquaresBondFitter_HPP
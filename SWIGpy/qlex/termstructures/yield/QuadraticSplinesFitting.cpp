@@ -1,4 +1,5 @@
 #include <algorithm>
+#include <qlex/termstructures/yield/FittedBondTimes.hpp>
 #include <qlex/termstructures/yield/QuadraticSplinesFitting.hpp>
 
 namespace QuantLib {
@@ -22,6 +23,14 @@ namespace QuantLib {
         return splines_(i, t);
     }
 
+    Array QuadraticSplinesFitting::basisFunctions(Time t) const {
+        return basis_.values(splines_, t);
+    }
+
+    Array QuadraticSplinesFitting::discountGradient(const Array&, Time t) const {
+        return basisFunctions(t);
+    }
+
     QL_UNIQUE_OR_AUTO_PTR<FittedBondDiscountCurve::FittingMethod>
     QuadraticSplinesFitting::clone() const {
         return QL_UNIQUE_OR_AUTO_PTR<FittedBondDiscountCurve::FittingMethod>(
@@ -32,14 +41,13 @@ namespace QuantLib {
         return size_;
     }
 
-    DiscountFactor QuadraticSplinesFitting::discountFunction(const Array& x, Time t) const {
-        DiscountFactor d = 1.0;
-
-        for (Size i = 0; i < size_; ++i) {
-            d += x[i] * splines_(i + 1, t);
-        }
+    void QuadraticSplinesFitting::init() {
+        FittedBondDiscountCurve::FittingMethod::init();
+        basis_.reset(splines_, fittedBondTimes(*curve_));
+    }
 
-        return d;
+    DiscountFactor QuadraticSplinesFitting::discountFunction(const Array& x, Time t) const {
+        return 1.0 + basis_.dot(splines_, t, x);
     }
 
     std::vector<Time> QuadraticSplinesFitting::autoKnots(const std::vector<Time>& maturities) {
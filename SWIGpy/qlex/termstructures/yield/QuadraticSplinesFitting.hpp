@@ -4,6 +4,8 @@
 #include <ql/auto_ptr.hpp>
 #include <ql/termstructures/yield/fittedbonddiscountcurve.hpp>
 #include <qlex/math/QuadraticSpline.hpp>
+#include <qlex/termstructures/yield/FittingMethodGradient.hpp>
+#include <qlex/termstructures/yield/SplineBasisCache.hpp>
 
 namespace QuantLib {
 
@@ -19,7 +21,8 @@ namespace QuantLib {
         Business, 44(1), 19-31.
     */
 
-    class QuadraticSplinesFitting : public FittedBondDiscountCurve::FittingMethod {
+    class QuadraticSplinesFitting : public FittedBondDiscountCurve::FittingMethod,
+                                    public FittingMethodGradient {
       public:
         QuadraticSplinesFitting(const std::vector<Time>& knotVector,
                                 const Array& weights = Array(),
@@ -31,6 +34,10 @@ namespace QuantLib {
                                 const Array& l2);
         //! quadratic spline basis functions
         Real basisFunction(Integer i, Time t) const;
+        //! values of all basis functions, i.e. the gradient of d(t) w.r.t. the coefficients
+        Array basisFunctions(Time t) const;
+        Array discountGradient(const Array& x, Time t) const;
+        bool linearInParameters() const { return true; }
 
         //! function that calculates knot points from maturities of bonds
         static std::vector<Time> autoKnots(const std::vector<Time>& maturities);
@@ -41,9 +48,11 @@ namespace QuantLib {
 #endif
       private:
         Size size() const;
+        void init();
         DiscountFactor discountFunction(const Array& x, Time t) const;
         QuadraticSpline splines_;
         Size size_;
+        SplineBasisCache<QuadraticSpline> basis_;
     };
 
 } // namespace QuantLib
@@ -0,0 +1,49 @@
+#include <qlex/termstructures/yield/SnapshotYieldTermStructure.hpp>
+#include <utility>
+
+namespace QuantLib {
+
+    SnapshotYieldTermStructure::SnapshotYieldTermStructure(
+        ext::shared_ptr<YieldTermStructure> snapshot,
+        ext::shared_ptr<YieldTermStructure> live)
+    : snapshot_(std::move(snapshot)), live_(std::move(live)) {
+        QL_REQUIRE(snapshot_, "null snapshot curve");
+        if (live_)
+            registerWith(live_);
+    }
+
+    DayCounter SnapshotYieldTermStructure::dayCounter() const {
+        return current()->dayCounter();
+    }
+
+    Date SnapshotYieldTermStructure::maxDate() const {
+        return current()->maxDate();
+    }
+
+    Time SnapshotYieldTermStructure::maxTime() const {
+        return current()->maxTime();
+    }
+
+    const Date& SnapshotYieldTermStructure::referenceDate() const {
+        return current()->referenceDate();
+    }
+
+    Calendar SnapshotYieldTermStructure::calendar() const {
+        return current()->calendar();
+    }
+
+    Natural SnapshotYieldTermStructure::settlementDays() const {
+        return current()->settlementDays();
+    }
+
+    void SnapshotYieldTermStructure::update() {
+        if (live_)
+            switched_ = true;
+        YieldTermStructure::update();
+    }
+
+    DiscountFactor SnapshotYieldTermStructure::discountImpl(Time t) const {
+        return current()->discount(t, true);
+    }
+
+} // namespace QuantLib
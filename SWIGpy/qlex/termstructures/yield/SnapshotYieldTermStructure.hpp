@@ -0,0 +1,77 @@
+#ifndef SnapshotYieldTermStructure_HPP
+#define SnapshotYieldTermStructure_HPP
+
+#include <ql/math/interpolations/interpolation.hpp>
+#include <ql/termstructures/yieldtermstructure.hpp>
+
+namespace QuantLib {
+
+    //! curve restored from saved nodes, optionally attached to a live curve
+    /*! Prices off the snapshot curve until the live curve (typically a
+        PiecewiseYieldCurve built on the current quotes, not yet
+        bootstrapped) sends a notification. From then on every call is
+        forwarded to the live curve, which bootstraps lazily on first use.
+    */
+    class SnapshotYieldTermStructure : public YieldTermStructure {
+      public:
+        SnapshotYieldTermStructure(
+            ext::shared_ptr<YieldTermStructure> snapshot,
+            ext::shared_ptr<YieldTermStructure> live = ext::shared_ptr<YieldTermStructure>());
+
+        //! \name TermStructure interface
+        //@{
+        DayCounter dayCounter() const override;
+        Date maxDate() const override;
+        Time maxTime() const override;
+        const Date& referenceDate() const override;
+        Calendar calendar() const override;
+        Natural settlementDays() const override;
+        //@}
+
+        //! \name Observer interface
+        //@{
+        void update() override;
+        //@}
+
+        //! whether calls are still served by the snapshot
+        bool usesSnapshot() const { return !switched_; }
+        const ext::shared_ptr<YieldTermStructure>& snapshot() const { return snapshot_; }
+        const ext::shared_ptr<YieldTermStructure>& live() const { return live_; }
+
+      protected:
+        DiscountFactor discountImpl(Time t) const override;
+
+      private:
+        const ext::shared_ptr<YieldTermStructure>& current() const {
+            return switched_ ? live_ : snapshot_;
+        }
+
+        ext::shared_ptr<YieldTermStructure> snapshot_, live_;
+        bool switched_ = false;
+    };
+
+    //! interpolated curve with the traits and interpolator of a piecewise curve
+    /*! Builds the Traits::curve<Interpolator>::type curve underlying
+        PiecewiseCurve (e.g. InterpolatedDiscountCurve<LogLinear> for
+        PiecewiseLogLinearDiscount) on the given nodes, reusing the day
+        counter and calendar of \p curve. The interpolator of \p curve
+        is held by a protected base and cannot be reused, so the given
+        one is used instead; it must be passed when it has parameters.
+        Jumps are not carried over.
+    */
+    template <class PiecewiseCurve>
+    ext::shared_ptr<YieldTermStructure> interpolatedNodeCurve(
+        const PiecewiseCurve& curve,
+        const std::vector<Date>& dates,
+        const std::vector<Real>& data,
+        const typename PiecewiseCurve::interpolator_type& interpolator =
+            typename PiecewiseCurve::interpolator_type()) {
+        typedef typename PiecewiseCurve::interpolator_type I;
+        typedef typename PiecewiseCurve::traits_type::template curve<I>::type Curve;
+        return ext::make_shared<Curve>(
+            dates, data, curve.dayCounter(), curve.calendar(), interpolator);
+    }
+
+} // namespace QuantLib
+
+#endif // SnapshotYieldTermStructure_HPP
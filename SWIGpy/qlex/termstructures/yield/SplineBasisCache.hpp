@@ -0,0 +1,74 @@
+#ifndef SplineBasisCache_HPP
+#define SplineBasisCache_HPP
+
+#include <ql/math/array.hpp>
+#include <algorithm>
+#include <unordered_map>
+#include <vector>
+
+namespace QuantLib {
+
+    //! basis function values of a spline at a fixed set of times
+    /*! While fitting, the optimizer evaluates the discount function at
+        the cashflow times of the fitted bonds on every iteration. The
+        basis rows at those times are computed once by reset(), when the
+        fitting method is initialized for its bonds, and each evaluation
+        is then a dot product.
+
+        The rows are only read after reset(), so no lock is needed when
+        a fitted curve is used from several threads. Other times, e.g.
+        those of instruments priced off the fitted curve, are evaluated
+        directly and not stored.
+    */
+    template <class Spline>
+    class SplineBasisCache {
+      public:
+        //! replaces the stored rows with those at the given times
+        void reset(const Spline& spline, const std::vector<Time>& times) {
+            Size n = spline.size();
+            rows_.clear();
+            values_.assign(times.size() * n, 0.0);
+            for (Size i = 0; i < times.size(); ++i) {
+                spline.values(times[i], &values_[i * n]);
+                rows_.emplace(times[i], i);
+            }
+        }
+
+        //! values of all basis functions at t
+        Array values(const Spline& spline, Time t) const {
+            Array result(spline.size());
+            const Real* c = row(t, spline.size());
+            if (c != nullptr)
+                std::copy(c, c + spline.size(), result.begin());
+            else
+                spline.values(t, result.begin());
+            return result;
+        }
+
+        //! sum of the basis function values at t weighted by x
+        Real dot(const Spline& spline, Time t, const Array& x) const {
+            const Real* c = row(t, spline.size());
+            if (c == nullptr)
+                return DotProduct(values(spline, t), x);
+            Real result = 0.0;
+            for (Size i = 0; i < spline.size(); ++i)
+                result += x[i] * c[i];
+            return result;
+        }
+
+        //! number of stored rows
+        Size size() const { return rows_.size(); }
+
+      private:
+        const Real* row(Time t, Size n) const {
+            typename std::unordered_map<Time, Size>::const_iterator i = rows_.find(t);
+            return i != rows_.end() ? &values_[i->second * n] : nullptr;
+        }
+
+        std::unordered_map<Time, Size> rows_;
+        std::vector<Real> values_;
+    };
+
+} // namespace QuantLib
+
+#endif // SplineBasisCache_HPP
@@ -6,7 +6,13 @@
 #include <qlex/termstructures/yield/BlissFitting.hpp>
 #include <qlex/termstructures/yield/ChinaFixingRepoSwapRateHelper.hpp>
 #include <qlex/termstructures/yield/CubicSplinesFitting.hpp>
+#include <qlex/termstructures/yield/CurveJacobian.hpp>
 #include <qlex/termstructures/yield/DieboldLiFitting.hpp>
+#include <qlex/termstructures/yield/FittedBondTimes.hpp>
+#include <qlex/termstructures/yield/FittingMethodGradient.hpp>
+#include <qlex/termstructures/yield/IncrementalBootstrap.hpp>
+#include <qlex/termstructures/yield/LeastSquaresBondFitter.hpp>
 #include <qlex/termstructures/yield/QuadraticSplinesFitting.hpp>
+#include <qlex/termstructures/yield/SnapshotYieldTermStructure.hpp>
 
 #endif
@@ -0,0 +1,127 @@
+#include <ql/utilities/null.hpp>
+#include <qlex/time/ColumnarTimeSeries.hpp>
+#include <algorithm>
+#include <cmath>
+#include <numeric>
+
+namespace QuantLib {
+
+    ColumnarTimeSeries::ColumnarTimeSeries(const Array& serials, const Array& values)
+    : serials_(serials), values_(values) {
+        initialize();
+    }
+
+    ColumnarTimeSeries::ColumnarTimeSeries(const std::vector<Date>& dates,
+                                           const std::vector<Real>& values)
+    : serials_(dates.size()), values_(values.begin(), values.end()) {
+        for (Size i = 0; i < dates.size(); ++i)
+            serials_[i] = Real(dates[i].serialNumber());
+        initialize();
+    }
+
+    ColumnarTimeSeries::ColumnarTimeSeries(const TimeSeries<Real>& series)
+    : serials_(series.size()), values_(series.size()) {
+        Size i = 0;
+        for (const auto& fixing : series) {
+            serials_[i] = Real(fixing.first.serialNumber());
+            values_[i] = fixing.second;
+            ++i;
+        }
+        initialize();
+    }
+
+    void ColumnarTimeSeries::initialize() {
+        QL_REQUIRE(serials_.size() == values_.size(),
+                   "serial numbers and values have different sizes ("
+                       << serials_.size() << " vs " << values_.size() << ")");
+        Size n = serials_.size();
+        for (Size i = 0; i < n; ++i)
+            QL_REQUIRE(serials_[i] == std::floor(serials_[i]),
+                       "serial number " << serials_[i] << " is not an integer");
+
+        if (!std::is_sorted(serials_.begin(), serials_.end())) {
+            std::vector<Size> order(n);
+            std::iota(order.begin(), order.end(), Size(0));
+            std::sort(order.begin(), order.end(),
+                      [this](Size i, Size j) { return serials_[i] < serials_[j]; });
+            Array serials(n), values(n);
+            for (Size i = 0; i < n; ++i) {
+                serials[i] = serials_[order[i]];
+                values[i] = values_[order[i]];
+            }
+            serials_.swap(serials);
+            values_.swap(values);
+        }
+        for (Size i = 1; i < n; ++i)
+            QL_REQUIRE(serials_[i] != serials_[i - 1],
+                       "duplicate date " << Date(Date::serial_type(serials_[i])));
+
+        positions_.clear();
+        if (n == 0)
+            return;
+
+        QL_REQUIRE(serials_.front() >= Date::minDate().serialNumber() &&
+                       serials_.back() <= Date::maxDate().serialNumber(),
+                   "serial numbers outside the allowed date range");
+        first_ = BigInteger(serials_.front());
+
+        // dense table for series with no long gaps, e.g., business days
+        Size span = Size(serials_.back() - serials_.front()) + 1;
+        if (span <= 4 * n + 32) {
+            positions_.resize(span, Null<Size>());
+            for (Size i = 0; i < n; ++i)
+                positions_[Size(serials_[i] - serials_.front())] = i;
+        }
+    }
+
+    Size ColumnarTimeSeries::position(Real serial) const {
+        if (!positions_.empty()) {
+            Real offset = serial - first_;
+            if (offset < 0.0 || offset >= positions_.size() ||
+                offset != std::floor(offset))
+                return Null<Size>();
+            return positions_[Size(offset)];
+        }
+        auto i = std::lower_bound(serials_.begin(), serials_.end(), serial);
+        if (i == serials_.end() || *i != serial)
+            return Null<Size>();
+        return i - serials_.begin();
+    }
+
+    Date ColumnarTimeSeries::firstDate() const {
+        QL_REQUIRE(!empty(), "empty timeseries");
+        return Date(Date::serial_type(serials_.front()));
+    }
+
+    Date ColumnarTimeSeries::lastDate() const {
+        QL_REQUIRE(!empty(), "empty timeseries");
+        return Date(Date::serial_type(serials_.back()));
+    }
+
+    std::vector<Date> ColumnarTimeSeries::dates() const {
+        std::vector<Date> result(size());
+        for (Size i = 0; i < size(); ++i)
+            result[i] = Date(Date::serial_type(serials_[i]));
+        return result;
+    }
+
+    Real ColumnarTimeSeries::operator[](const Date& d) const {
+        Size i = position(Real(d.serialNumber()));
+        return i == Null<Size>() ? Null<Real>() : values_[i];
+    }
+
+    Array ColumnarTimeSeries::values(const Array& serials) const {
+        Array result(serials.size());
+        for (Size j = 0; j < serials.size(); ++j) {
+            Size i = position(serials[j]);
+            result[j] = i == Null<Size>() ? Null<Real>() : values_[i];
+        }
+        return result;
+    }
+
+    TimeSeries<Real> ColumnarTimeSeries::timeSeries() const {
+        std::vector<Date> d = dates();
+        return TimeSeries<Real>(d.begin(), d.end(), values_.begin());
+    }
+
+} // namespace QuantLib
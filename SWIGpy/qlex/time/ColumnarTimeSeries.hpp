@@ -0,0 +1,58 @@
+#ifndef ColumnarTimeSeries_HPP
+#define ColumnarTimeSeries_HPP
+
+#include <ql/math/array.hpp>
+#include <ql/timeseries.hpp>
+#include <vector>
+
+namespace QuantLib {
+
+    //! Time series stored as sorted serial-number and value arrays
+    /*! Lookups go through a dense position table when the dates are
+        close enough together (e.g., daily fixings), and through a
+        binary search otherwise.  The series is built in one pass from
+        contiguous arrays and converts to and from TimeSeries<Real>,
+        which IndexManager requires.
+    */
+    class ColumnarTimeSeries {
+      public:
+        ColumnarTimeSeries() = default;
+        //! serial numbers need not be sorted, but must be unique
+        ColumnarTimeSeries(const Array& serials, const Array& values);
+        ColumnarTimeSeries(const std::vector<Date>& dates,
+                           const std::vector<Real>& values);
+        explicit ColumnarTimeSeries(const TimeSeries<Real>& series);
+
+        //! \name Inspectors
+        //@{
+        Size size() const { return serials_.size(); }
+        bool empty() const { return serials_.empty(); }
+        Date firstDate() const;
+        Date lastDate() const;
+        std::vector<Date> dates() const;
+        const Array& serials() const { return serials_; }
+        const Array& values() const { return values_; }
+        //@}
+
+        //! \name Lookups
+        //@{
+        //! value at the given date, or Null<Real>() if none
+        Real operator[](const Date& d) const;
+        //! values at the given serial numbers, Null<Real>() where missing
+        Array values(const Array& serials) const;
+        //@}
+
+        TimeSeries<Real> timeSeries() const;
+
+      private:
+        void initialize();
+        Size position(Real serial) const;
+
+        Array serials_, values_;
+        BigInteger first_ = 0;
+        std::vector<Size> positions_;
+    };
+
+} // namespace QuantLib
+
+#endif // ColumnarTimeSeries_HPP
@@ -1,6 +1,7 @@
 #ifndef qlex_time_all
 #define qlex_time_all
 
+#include <qlex/time/ColumnarTimeSeries.hpp>
 #include <qlex/time/daycounters/all.hpp>
 
 #endif
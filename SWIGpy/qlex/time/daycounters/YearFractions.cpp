@@ -0,0 +1,64 @@
+#include <qlex/time/daycounters/YearFractions.hpp>
+
+namespace QuantLib {
+
+    namespace {
+
+        // denominator of day counters computing (d2 - d1) / denominator,
+        // or Null<Real>() if the day counter is not one of them
+        Real fixedDenominator(const DayCounter& dayCounter) {
+#ifndef QL_HIGH_RESOLUTION_DATE
+            const std::string name = dayCounter.name();
+            if (name == "Actual/360")
+                return 360.0;
+            if (name == "Actual/365 (Fixed)")
+                return 365.0;
+            if (name == "Actual/365.25 (Fixed)")
+                return 365.25;
+#endif
+            return Null<Real>();
+        }
+
+    }
+
+    Array yearFractions(const DayCounter& dayCounter,
+                        const std::vector<Date>& startDates,
+                        const std::vector<Date>& endDates) {
+        QL_REQUIRE(startDates.size() == endDates.size(),
+                   "start and end dates have different sizes");
+        Size n = startDates.size();
+        Array result(n);
+
+        Real denominator = fixedDenominator(dayCounter);
+        if (denominator != Null<Real>()) {
+            for (Size i = 0; i < n; ++i)
+                result[i] = Real(endDates[i] - startDates[i]) / denominator;
+        } else {
+            for (Size i = 0; i < n; ++i)
+                result[i] = dayCounter.yearFraction(startDates[i], endDates[i]);
+        }
+        return result;
+    }
+
+    Array yearFractions(const DayCounter& dayCounter,
+                        const Array& startSerials,
+                        const Array& endSerials) {
+        QL_REQUIRE(startSerials.size() == endSerials.size(),
+                   "start and end serial numbers have different sizes");
+        Size n = startSerials.size();
+        Array result(n);
+
+        Real denominator = fixedDenominator(dayCounter);
+        if (denominator != Null<Real>()) {
+            for (Size i = 0; i < n; ++i)
+                result[i] = (endSerials[i] - startSerials[i]) / denominator;
+        } else {
+            for (Size i = 0; i < n; ++i)
+                result[i] = dayCounter.yearFraction(
+                    Date(Date::serial_type(startSerials[i])),
+                    Date(Date::serial_type(endSerials[i])));
+        }
+        return result;
+    }
+
+} // namespace QuantLib
@@ -0,0 +1,27 @@
+#ifndef YearFractions_HPP
+#define YearFractions_HPP
+
+#include <ql/math/array.hpp>
+#include <ql/time/daycounter.hpp>
+#include <vector>
+
+namespace QuantLib {
+
+    //! year fractions between pairs of dates in a single call
+    /*! Day counters with a fixed denominator and no reference-period
+        dependence (Actual/360, Actual/365 (Fixed), Actual/365.25 (Fixed))
+        are evaluated directly on serial numbers; any other day counter
+        goes through DayCounter::yearFraction for each pair.
+    */
+    Array yearFractions(const DayCounter& dayCounter,
+                        const std::vector<Date>& startDates,
+                        const std::vector<Date>& endDates);
+
+    //! same as above, with dates given as serial numbers
+    Array yearFractions(const DayCounter& dayCounter,
+                        const Array& startSerials,
+                        const Array& endSerials);
+
+} // namespace QuantLib
+
+#endif // YearFractions_HPP
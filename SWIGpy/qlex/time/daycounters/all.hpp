@@ -2,5 +2,6 @@
 #define qlex_time_daycounters_all
 
 #include <qlex/time/daycounters/Actual365_25.hpp>
+#include <qlex/time/daycounters/YearFractions.hpp>
 
 #endif
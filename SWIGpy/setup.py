@@ -11,19 +11,34 @@ ql_module = Extension(
         'qlex/cashflows/ChinaFixingRepoCoupon.cpp',
         'qlex/cashflows/ChinaFixingRepoLeg.cpp',
         'qlex/cashflows/ChinaFixingRepoCouponPricer.cpp',
+        'qlex/cashflows/ChinaFixingRepoScheduleCache.cpp',
         'qlex/indexes/ChinaFixingRepo.cpp',
+        'qlex/indexes/IndexHistories.cpp',
         'qlex/instruments/MakeChinaFixingRepoSwap.cpp',
         'qlex/instruments/ChinaFixingRepoSwap.cpp',
+        'qlex/instruments/PortfolioPricer.cpp',
         'qlex/math/CubicSpline.cpp',
+        'qlex/math/Expression.cpp',
         'qlex/math/QuadraticSpline.cpp',
+        'qlex/math/SobolSequences.cpp',
+        'qlex/math/StreamingStatistics.cpp',
+        'qlex/models/ParallelCalibration.cpp',
+        'qlex/patterns/Notifications.cpp',
+        'qlex/patterns/Sessions.cpp',
+        'qlex/pricingengines/BlackFormulas.cpp',
         'qlex/termstructures/yield/AdjustedSvenssonFitting.cpp',
         'qlex/termstructures/yield/CubicSplinesFitting.cpp',
         'qlex/termstructures/yield/BjorkChristensenFitting.cpp',
         'qlex/termstructures/yield/DieboldLiFitting.cpp',
+        'qlex/termstructures/yield/FittedBondTimes.cpp',
         'qlex/termstructures/yield/BlissFitting.cpp',
+        'qlex/termstructures/yield/LeastSquaresBondFitter.cpp',
         'qlex/termstructures/yield/QuadraticSplinesFitting.cpp',
+        'qlex/termstructures/yield/SnapshotYieldTermStructure.cpp',
         'qlex/termstructures/yield/ChinaFixingRepoSwapRateHelper.cpp',
-        'qlex/time/daycounters/Actual365_25.cpp'],
+        'qlex/time/ColumnarTimeSeries.cpp',
+        'qlex/time/daycounters/Actual365_25.cpp',
+        'qlex/time/daycounters/YearFractions.cpp'],
     include_dirs=['/usr/include/', './'],
     library_dirs=['/usr/lib/'],
     libraries=[
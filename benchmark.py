@@ -0,0 +1,282 @@
+'''
+Timing the test suite scenarios:
+
+    python benchmark.py -o results.json
+    python benchmark.py -o new.json --baseline results.json
+
+Each workload is a test of testsuite/ run as it is, so that pricing,
+calibration, bootstrapping and Monte Carlo code paths are timed on the
+same market data used for correctness. For every workload the wall time
+of several runs, the Python-side allocations (tracemalloc does not see
+the C++ heap, whose growth shows in the resident set size instead) and
+the number of calls into the SWIG module are saved to JSON. Comparing
+against a baseline file reports slower and faster workloads and exits
+with status 1 on regressions.
+'''
+import argparse
+import contextlib
+import gc
+import io
+import json
+import platform
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+import unittest
+from collections import Counter
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+WORKLOADS = [
+    # pricing
+    ('pricing', 'testsuite.europeanoption.EuropeanOptionTest.testValues'),
+    ('pricing', 'testsuite.europeanoption.EuropeanOptionTest.testGreeks'),
+    ('pricing', 'testsuite.americanoption.AmericanOptionTest.testBaroneAdesiWhaleyValues'),
+    ('pricing', 'testsuite.barrieroption.BarrierOptionTest.testHaugValues'),
+    ('pricing', 'testsuite.asianoptions.AsianOptionTest.testAnalyticDiscreteGeometricAveragePrice'),
+    ('pricing', 'testsuite.hestonmodel.HestonModelTest.testAnalyticVsCached'),
+    ('pricing', 'testsuite.fdheston.FdHestonTest.testFdmHestonAmerican'),
+    ('pricing', 'testsuite.capfloor.CapFloorTest.testConsistency'),
+    ('pricing', 'testsuite.swaption.SwaptionTest.testCachedValue'),
+    ('pricing', 'testsuite.bermudanswaption.BermudanSwaptionTest.testCachedValues'),
+    ('pricing', 'testsuite.blackformula.BlackFormulaTest.testBatchFormulas'),
+    # calibration
+    ('calibration', 'testsuite.hestonmodel.HestonModelTest.testBlackCalibration'),
+    ('calibration', 'testsuite.hestonmodel.HestonModelTest.testDAXCalibration'),
+    ('calibration', 'testsuite.batesmodel.BatesModelTest.testDAXCalibration'),
+    ('calibration', 'testsuite.shortratemodels.ShortRateModelTest.testCachedHullWhite'),
+    ('calibration', 'testsuite.optionletstripper.OptionletStripperTest.testTermVolatilityStripping1'),
+    ('calibration', 'testsuite.swaptionvolatilitycube.SwaptionVolatilityCubeTest.testSabrVols'),
+    ('calibration', 'testsuite.fittedbonddiscountcurve.FittedBondDiscountCurveTest.testEvaluation'),
+    # bootstrapping
+    ('bootstrapping', 'testsuite.piecewiseyieldcurve.PiecewiseYieldCurveTest.testLogLinearDiscountConsistency'),
+    ('bootstrapping', 'testsuite.piecewiseyieldcurve.PiecewiseYieldCurveTest.testLinearZeroConsistency'),
+    ('bootstrapping', 'testsuite.piecewiseyieldcurve.PiecewiseYieldCurveTest.testIncrementalBootstrap'),
+    ('bootstrapping', 'testsuite.defaultprobabilitycurves.DefaultProbabilityCurveTest.testFlatHazardConsistency'),
+    ('bootstrapping', 'testsuite.defaultprobabilitycurves.DefaultProbabilityCurveTest.testSingleInstrumentBootstrap'),
+    # Monte Carlo
+    ('mc', 'testsuite.europeanoption.EuropeanOptionTest.testMcEngines'),
+    ('mc', 'testsuite.asianoptions.AsianOptionTest.testMCDiscreteArithmeticAveragePrice'),
+    ('mc', 'testsuite.mclongstaffschwartzengine.MCLongstaffSchwartzEngineTest.testAmericanOption'),
+    ('mc', 'testsuite.marketmodel.MarketModelTest.testOneStepForwardsAndOptionlets'),
+    ('mc', 'testsuite.pathgenerator.PathGeneratorTest.testBulkGeneration'),
+    ('mc', 'testsuite.hestonmodel.HestonModelTest.testMcVsCached'),
+]
+
+CATEGORIES = sorted(set(category for category, _ in WORKLOADS))
+
+
+def workloadName(test):
+    # e.g. 'europeanoption.testValues'
+    parts = test.split('.')
+    return '%s.%s' % (parts[1], parts[-1])
+
+
+def runTest(test, verbose=False):
+    '''Runs a single test case and returns its status'''
+    suite = unittest.defaultTestLoader.loadTestsFromName(test)
+    result = unittest.TestResult()
+    output = contextlib.nullcontext() if verbose else \
+        contextlib.redirect_stdout(io.StringIO())
+    with output:
+        suite.run(result)
+    if result.errors or result.failures:
+        return 'failed'
+    if result.skipped:
+        return 'skipped'
+    return 'ok'
+
+
+class SwigCallCounter(object):
+    '''Counts the calls into the SWIG extension module'''
+
+    def __init__(self):
+        self.calls = Counter()
+
+    def __call__(self, frame, event, arg):
+        if event == 'c_call':
+            module = getattr(arg, '__module__', None) or ''
+            if module.endswith('_QuantLib'):
+                self.calls[arg.__name__] += 1
+
+    def __enter__(self):
+        threading.setprofile(self)
+        sys.setprofile(self)
+        return self
+
+    def __exit__(self, *args):
+        sys.setprofile(None)
+        threading.setprofile(None)
+
+
+def maxRss():
+    if resource is None:
+        return 0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def measure(test, repeat, verbose=False):
+    '''Times a workload and records its allocations and SWIG calls'''
+    status = runTest(test, verbose)  # warm-up: imports, caches
+    if status != 'ok':
+        return {'status': status}
+
+    times = []
+    rss = maxRss()
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        status = runTest(test, verbose)
+        times.append(time.perf_counter() - start)
+        if status != 'ok':
+            return {'status': status}
+
+    gc.collect()
+    tracemalloc.start()
+    runTest(test, verbose)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    with SwigCallCounter() as counter:
+        runTest(test, verbose)
+
+    return {
+        'status': 'ok',
+        'time': {
+            'min': min(times),
+            'median': statistics.median(times),
+            'mean': statistics.mean(times),
+            'stdev': statistics.stdev(times) if len(times) > 1 else 0.0,
+            'repeat': repeat,
+        },
+        'allocations': {
+            'peakBytes': peak,
+            'retainedBytes': current,
+            'rssGrowth': maxRss() - rss,
+        },
+        'swigCalls': sum(counter.calls.values()),
+        'topSwigCalls': dict(counter.calls.most_common(10)),
+    }
+
+
+def metadata(repeat):
+    import QuantLib
+    return {
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'quantlib': getattr(QuantLib, '__version__', None),
+        'repeat': repeat,
+    }
+
+
+def compare(results, baseline, threshold, minDifference):
+    '''Returns the lines of the comparison report and the regressions'''
+    lines = []
+    regressions = []
+    for name, result in sorted(results['workloads'].items()):
+        base = baseline['workloads'].get(name)
+        if base is None:
+            lines.append('%-60s new' % name)
+            continue
+        if result['status'] != 'ok' or base['status'] != 'ok':
+            if result['status'] != base['status']:
+                lines.append('%-60s %s (was %s)' % (
+                    name, result['status'], base['status']))
+                if base['status'] == 'ok':
+                    regressions.append(name)
+            continue
+
+        now, before = result['time']['min'], base['time']['min']
+        ratio = now / before if before > 0.0 else float('inf')
+        verdict = ''
+        if abs(now - before) > minDifference:
+            if ratio > 1.0 + threshold:
+                verdict = 'SLOWER'
+                regressions.append(name)
+            elif ratio < 1.0 - threshold:
+                verdict = 'faster'
+        calls = result['swigCalls'] - base['swigCalls']
+        lines.append('%-60s %9.4fs %9.4fs %6.2fx %+9d calls  %s' % (
+            name, before, now, ratio, calls, verdict))
+
+    for name in sorted(set(baseline['workloads']) - set(results['workloads'])):
+        lines.append('%-60s missing' % name)
+    return lines, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Times the test suite scenarios and compares them '
+                    'against a baseline.')
+    parser.add_argument('-o', '--output', default='benchmark-results.json',
+                        help='JSON file for the results')
+    parser.add_argument('-b', '--baseline',
+                        help='JSON results of a previous run to compare with')
+    parser.add_argument('-r', '--repeat', type=int, default=5,
+                        help='timed runs of each workload')
+    parser.add_argument('-c', '--category', action='append', choices=CATEGORIES,
+                        help='only run the workloads of this category')
+    parser.add_argument('-k', dest='pattern',
+                        help='only run the workloads whose name contains this')
+    parser.add_argument('-t', '--threshold', type=float, default=0.10,
+                        help='relative slowdown reported as regression')
+    parser.add_argument('--min-difference', type=float, default=0.002,
+                        help='seconds below which differences are ignored')
+    parser.add_argument('-l', '--list', action='store_true',
+                        help='list the workloads and exit')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='show the output of the tests')
+    args = parser.parse_args(argv)
+
+    workloads = [
+        (category, test) for category, test in WORKLOADS
+        if (not args.category or category in args.category) and
+           (not args.pattern or args.pattern in workloadName(test))]
+
+    if args.list:
+        for category, test in workloads:
+            print('%-14s %s' % (category, workloadName(test)))
+        return 0
+
+    results = {'metadata': metadata(args.repeat), 'workloads': {}}
+    for category, test in workloads:
+        name = workloadName(test)
+        result = measure(test, args.repeat, args.verbose)
+        result['category'] = category
+        result['test'] = test
+        results['workloads'][name] = result
+        if result['status'] == 'ok':
+            print('%-60s %9.4fs %9d calls' % (
+                name, result['time']['min'], result['swigCalls']))
+        else:
+            print('%-60s %s' % (name, result['status']))
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        lines, regressions = compare(
+            results, baseline, args.threshold, args.min_difference)
+        print()
+        print('%-60s %10s %10s %7s' % ('workload', 'baseline', 'current', 'ratio'))
+        for line in lines:
+            print(line)
+        if regressions:
+            print('\n%d regression(s): %s' % (
+                len(regressions), ', '.join(regressions)))
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
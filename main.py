@@ -131,6 +131,7 @@ from testsuite.pathgenerator import PathGeneratorTest
 from testsuite.period import PeriodTest
 from testsuite.piecewiseyieldcurve import PiecewiseYieldCurveTest
 from testsuite.piecewisezerospreadedtermstructure import PiecewiseZeroSpreadedTermStructureTest
+from testsuite.pickling import PicklingTest
 # Q
 from testsuite.quantooption import QuantoOptionTest
 from testsuite.quotes import QuoteTest
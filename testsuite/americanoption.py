@@ -1,5 +1,8 @@
 import unittest
+from math import exp, log
+from time import perf_counter
 
+import numpy as np
 from QuantLib import *
 
 from utilities import *
@@ -25,6 +28,37 @@ class AmericanOptionData(object):
         self.result = result
 
 
+class PointwisePutValue(object):
+    def __init__(self, mesher, strike):
+        self.mesher = mesher
+        self.strike = strike
+
+    def innerValue(self, iter, t):
+        return max(self.strike - exp(self.mesher.location(iter, 0)), 0.0)
+
+    def avgInnerValue(self, iter, t):
+        return self.innerValue(iter, t)
+
+
+class VectorizedPutValue(object):
+    def __init__(self, strike):
+        self.strike = strike
+        self.calls = 0
+
+    def innerValues(self, locations, t):
+        self.calls += 1
+        return np.maximum(self.strike - np.exp(np.asarray(locations)[0]), 0.0)
+
+
+class AmericanExerciseCondition(object):
+    def __init__(self, exerciseValues):
+        self.exerciseValues = exerciseValues
+
+    def applyTo(self, a, t):
+        values = np.asarray(a)
+        np.maximum(values, self.exerciseValues, out=values)
+
+
 class AmericanOptionTest(unittest.TestCase):
 
     def testBaroneAdesiWhaleyValues(self):
@@ -716,3 +750,94 @@ class AmericanOptionTest(unittest.TestCase):
                                             error = relativeError(expct, calcl, u)
 
                                             self.assertFalse(error > tol)
+
+    def testVectorizedFdmCallbacks(self):
+        TEST_MESSAGE(
+            "Testing array callbacks of Python FDM inner values "
+            "and step conditions...")
+
+        today = knownGoodDefault
+        dc = Actual365Fixed()
+        spot = 40.0
+        strike = 40.0
+        maturityDate = today + Period(1, Years)
+        maturity = dc.yearFraction(today, maturityDate)
+        timeSteps = 100
+
+        process = BlackScholesMertonProcess(
+            QuoteHandle(SimpleQuote(spot)),
+            YieldTermStructureHandle(flatRate(today, 0.02, dc)),
+            YieldTermStructureHandle(flatRate(today, 0.06, dc)),
+            BlackVolTermStructureHandle(flatVol(today, 0.30, dc)))
+
+        mesher = FdmMesherComposite(
+            FdmBlackScholesMesher(400, process, maturity, strike))
+        op = FdmBlackScholesOp(mesher, process, strike)
+        exercise = AmericanExercise(today, maturityDate)
+
+        def price(calculator, condition=None):
+            if condition is None:
+                condition = FdmStepConditionComposite.vanillaComposite(
+                    DividendSchedule(), exercise, mesher, calculator,
+                    today, dc)
+            desc = FdmSolverDesc(
+                mesher, FdmBoundaryConditionSet(), condition, calculator,
+                maturity, timeSteps, 0)
+            solver = Fdm1DimSolver(desc, FdmSchemeDesc.Douglas(), op)
+            return solver.interpolateAt(log(spot))
+
+        start = perf_counter()
+        expected = price(
+            FdmInnerValueCalculatorProxy(PointwisePutValue(mesher, strike)))
+        pointwiseTime = perf_counter() - start
+
+        payoff = VectorizedPutValue(strike)
+        start = perf_counter()
+        calculated = price(FdmInnerValueCalculatorArrayProxy(payoff, mesher))
+        vectorizedTime = perf_counter() - start
+
+        TEST_MESSAGE(
+            "%d grid points, %d steps: pointwise %.4fs, vectorized %.4fs" %
+            (mesher.layout().size(), timeSteps, pointwiseTime, vectorizedTime))
+
+        tolerance = 1.0e-12
+        self.assertFalse(abs(calculated - expected) > tolerance)
+        self.assertFalse(payoff.calls > timeSteps + 2)
+
+        exerciseValues = np.maximum(
+            strike - np.exp(np.asarray(mesher.locations(0).view())), 0.0)
+        condition = FdmStepConditionComposite(
+            [], [FdmStepConditionArrayProxy(
+                AmericanExerciseCondition(exerciseValues))])
+        calculated = price(
+            FdmInnerValueCalculatorArrayProxy(VectorizedPutValue(strike), mesher),
+            condition)
+        self.assertFalse(abs(calculated - expected) > tolerance)
+
+        # exports kept by the callback outlive the solver safely, and
+        # writing to them afterwards does not touch the solution
+        class KeepingCondition(object):
+            def applyTo(self, a, t):
+                if hasattr(self, "kept"):
+                    self.kept[:] = 0.0
+                self.kept = np.asarray(a)
+
+        keeping = KeepingCondition()
+        condition = FdmStepConditionComposite(
+            [], [FdmStepConditionArrayProxy(keeping)])
+        calculator = FdmInnerValueCalculatorArrayProxy(
+            VectorizedPutValue(strike), mesher)
+        european = price(calculator, condition)
+        self.assertFalse(
+            abs(european - price(calculator, FdmStepConditionComposite([], [])))
+            > tolerance)
+        self.assertFalse(len(keeping.kept) != mesher.layout().size())
+        self.assertFalse(not np.all(np.isfinite(keeping.kept)))
+
+        class FailingCondition(object):
+            def applyTo(self, a, t):
+                raise ValueError("failing on purpose")
+
+        condition = FdmStepConditionComposite(
+            [], [FdmStepConditionArrayProxy(FailingCondition())])
+        self.assertRaises(RuntimeError, price, calculator, condition)
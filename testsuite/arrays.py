@@ -1,6 +1,8 @@
 import unittest
 from math import sin, exp, sqrt, log
 
+import numpy as np
+
 from QuantLib import *
 
 from utilities import *
@@ -100,3 +102,26 @@ class ArrayTest(unittest.TestCase):
         for i in range(5):
             self.assertFalse(
                 abs(a[i] - float(1 + i)) > tol)
+
+    def testBufferProtocol(self):
+        TEST_MESSAGE(
+            "Testing array buffer protocol...")
+        a = Array(10, 1.0, 1.0)
+
+        v = np.asarray(a)
+        self.assertTrue(v.shape == (10,))
+        for i in range(10):
+            self.assertFalse(v[i] != a[i])
+
+        v[3] = 42.0
+        self.assertFalse(
+            a[3] != 42.0,
+            "array view does not share storage")
+
+        b = Array(np.linspace(0.0, 1.0, 11))
+        self.assertTrue(len(b) == 11)
+        for i in range(11):
+            self.assertFalse(abs(b[i] - 0.1 * i) > 10 * QL_EPSILON)
+
+        self.assertFalse(
+            abs(DotProduct(np.ones(10), a) - np.sum(v)) > 10 * QL_EPSILON)
@@ -446,3 +446,109 @@ class CashFlowsTest(unittest.TestCase):
         amount = coupon.amount()
         expected = pastFixing * coupon.nominal() * coupon.accrualPeriod()
         self.assertFalse(abs(amount - expected) > 1e-8)
+
+    def testChinaFixingRepoFixedPartCache(self):
+        TEST_MESSAGE(
+            "Testing the cached fixed part of China fixing repo coupons...")
+
+        backup = SavedSettings()
+
+        forwardRate = SimpleQuote(0.02)
+        curve = RelinkableYieldTermStructureHandle()
+        index = ChinaFixingRepo(Period(7, Days), 1, curve)
+        IndexManager.instance().clearHistory(index.name())
+
+    def testChinaFixingRepoScheduleCache(self):
+        TEST_MESSAGE(
+            "Testing the schedule cache of China fixing repo coupons...")
+
+        cache = ChinaFixingRepoScheduleCache.instance()
+        capacity = cache.capacity()
+        cache.clear()
+
+        index = ChinaFixingRepo(Period(7, Days), 1, RelinkableYieldTermStructureHandle())
+        periods = [(Date(11, January, 2021), Date(12, April, 2021)),
+                   (Date(12, April, 2021), Date(12, July, 2021)),
+                   (Date(12, July, 2021), Date(11, October, 2021))]
+
+        def makeCoupon(period, nominal=100.0, spread=0.0):
+            start, end = period
+            return ChinaFixingRepoCoupon(end, nominal, start, end, index, 1.0, spread)
+
+        try:
+            # coupons over the same period share the cached sub-periods
+            first = makeCoupon(periods[0])
+            self.assertEqual(cache.size(), 1)
+            self.assertEqual(cache.hits(), 0)
+            second = makeCoupon(periods[0], 50.0, 0.001)
+            self.assertEqual(cache.size(), 1)
+            self.assertEqual(cache.hits(), 1)
+            self.assertEqual(list(second.valueDates()), list(first.valueDates()))
+            self.assertEqual(list(second.fixingDates()), list(first.fixingDates()))
+            self.assertEqual(list(second.dt()), list(first.dt()))
+
+            # the least recently used entry is evicted at capacity
+            cache.setCapacity(2)
+            makeCoupon(periods[1])
+            self.assertEqual(cache.size(), 2)
+            makeCoupon(periods[0])
+            self.assertEqual(cache.hits(), 2)
+            makeCoupon(periods[2])
+            self.assertEqual(cache.size(), 2)
+            makeCoupon(periods[0])
+            self.assertEqual(cache.hits(), 3)
+            makeCoupon(periods[1])
+            self.assertEqual(cache.hits(), 3)
+            self.assertEqual(cache.size(), 2)
+
+            # coupons built without the cache are identical
+            cached = [makeCoupon(p) for p in periods]
+            cache.setCapacity(0)
+            self.assertEqual(cache.size(), 0)
+            for p, c in zip(periods, cached):
+                hits = cache.hits()
+                uncached = makeCoupon(p)
+                self.assertEqual(cache.hits(), hits)
+                self.assertEqual(cache.size(), 0)
+                self.assertEqual(list(uncached.valueDates()), list(c.valueDates()))
+                self.assertEqual(list(uncached.fixingDates()), list(c.fixingDates()))
+                self.assertEqual(list(uncached.dt()), list(c.dt()))
+                self.assertEqual(uncached.accrualStartDate(), c.accrualStartDate())
+                self.assertEqual(uncached.accrualEndDate(), c.accrualEndDate())
+                self.assertEqual(uncached.accrualPeriod(), c.accrualPeriod())
+        finally:
+            cache.setCapacity(capacity)
+            cache.clear()
+
+        coupon = ChinaFixingRepoCoupon(
+            Date(12, April, 2021), 100.0,
+            Date(11, January, 2021), Date(12, April, 2021), index)
+        fixingDates = coupon.fixingDates()
+        today = fixingDates[len(fixingDates) // 2]
+        Settings.instance().evaluationDate = today
+        curve.linkTo(FlatForward(today, QuoteHandle(forwardRate), Actual365Fixed()))
+        for d in fixingDates:
+            if d < today:
+                index.addFixing(d, 0.021)
+
+        pricer = as_china_fixing_repo_coupon_pricer(coupon.pricer())
+
+        rate = coupon.rate()
+        self.assertEqual(pricer.fixedPartCalculations(), 1)
+
+        # a move of the forwarding curve only changes the forecast part
+        forwardRate.setValue(0.025)
+        self.assertFalse(abs(coupon.rate() - rate) < 1e-6)
+        self.assertEqual(pricer.fixedPartCalculations(), 1)
+
+        # a new fixing invalidates the cached fixed part
+        index.addFixing(today, 0.03)
+        coupon.rate()
+        self.assertEqual(pricer.fixedPartCalculations(), 2)
+
+        # and so does a change of the evaluation date
+        Settings.instance().evaluationDate = fixingDates[len(fixingDates) // 2 + 1]
+        coupon.rate()
+        self.assertEqual(pricer.fixedPartCalculations(), 3)
+
+        IndexManager.instance().clearHistory(index.name())
@@ -1,4 +1,5 @@
 import unittest
+from time import perf_counter
 
 from QuantLib import *
 
@@ -744,3 +745,41 @@ class DayCounterTest(unittest.TestCase):
         self.assertFalse(not raised)
 
         Settings.instance().evaluationDate = temp
+
+    def testBatchYearFractions(self):
+        TEST_MESSAGE(
+            "Testing batch year fractions against scalar loop...")
+
+        today = Date(10, November, 2020)
+        n = 10000
+        starts = DateVector([today + i for i in range(n)])
+        ends = DateVector([d + Period(1 + i % 120, Months) for i, d in enumerate(starts)])
+        startSerials = Array([d.serialNumber() for d in starts])
+        endSerials = Array([d.serialNumber() for d in ends])
+
+        dayCounters = [
+            Actual365_25(), Actual365Fixed(), Actual360(),
+            ActualActual(ActualActual.ISDA)]
+
+        for dc in dayCounters:
+            start = perf_counter()
+            expected = [dc.yearFraction(d1, d2) for d1, d2 in zip(starts, ends)]
+            scalarTime = perf_counter() - start
+
+            start = perf_counter()
+            calculated = dc.yearFractions(starts, ends)
+            batchTime = perf_counter() - start
+
+            fromSerials = dc.yearFractions(startSerials, endSerials)
+
+            TEST_MESSAGE(
+                "%s, %d pairs: scalar loop %.4fs, batch %.4fs" %
+                (dc.name(), n, scalarTime, batchTime))
+
+            for i in range(n):
+                self.assertFalse(
+                    abs(calculated[i] - expected[i]) > 1.0e-15,
+                    "batch year fraction mismatch for " + dc.name())
+                self.assertFalse(
+                    abs(fromSerials[i] - expected[i]) > 1.0e-15,
+                    "serial year fraction mismatch for " + dc.name())
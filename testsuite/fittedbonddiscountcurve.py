@@ -5,6 +5,61 @@ from QuantLib import *
 from utilities import *
 
 
+def cubicSplineReference(knots, i, x):
+    # CubicSpline basis functions as originally written with pow()
+    n = len(knots) + 1
+    if i == n:
+        return x
+    k = [0.0] + list(knots) + [knots[-1]]
+    q, qMinus, qPlus = k[i], k[i - 1], k[i + 1]
+    if x < qMinus:
+        return 0.0
+    elif x < q:
+        return pow(x - qMinus, 3) / (6.0 * (q - qMinus))
+    elif x < qPlus:
+        return (pow(q - qMinus, 2) / 6.0 + (q - qMinus) * (x - q) / 2.0 +
+                pow(x - q, 2) / 2.0 - pow(x - q, 3) / (6.0 * (qPlus - q)))
+    else:
+        return (qPlus - qMinus) * ((2.0 * qPlus - q - qMinus) / 6.0 + (x - qPlus) / 2.0)
+
+
+def quadraticSplineReference(knots, i, x):
+    # QuadraticSpline basis functions as originally written with pow()
+    n = len(knots)
+    k = [0.0] + list(knots)
+    if i == 1:
+        if x <= k[2]:
+            return x - 1.0 / (2 * k[2]) * pow(x, 2)
+        return 1.0 / 2 * k[2]
+    elif i == n:
+        if x <= k[i - 1]:
+            return 0.0
+        return pow(x - k[i - 1], 2) / (2.0 * (k[n] - k[i - 1]))
+    q, qMinus, qPlus = k[i], k[i - 1], k[i + 1]
+    if x < qMinus:
+        return 0.0
+    elif x < q:
+        return pow(x - qMinus, 2) / (2.0 * (q - qMinus))
+    elif x < qPlus:
+        return (q - qMinus) / 2.0 + (x - q) - pow(x - q, 2) / (2.0 * (qPlus - q))
+    return (qPlus - qMinus) / 2.0
+
+
+def makeBondHelpers(asof):
+    helpers = BondHelperVector()
+    for years, coupon, price in [(1, 0.02, 100.4), (2, 0.025, 100.7),
+                                 (3, 0.03, 101.1), (5, 0.035, 101.9),
+                                 (7, 0.04, 102.8), (10, 0.045, 103.2)]:
+        schedule = Schedule(
+            asof, asof + Period(years, Years), Period(6, Months),
+            NullCalendar(), Unadjusted, Unadjusted,
+            DateGeneration.Backward, False)
+        bond = FixedRateBond(
+            0, 100.0, schedule, DoubleVector(1, coupon), Actual365Fixed())
+        helpers.append(BondHelper(QuoteHandle(SimpleQuote(price)), bond))
+    return helpers
+
+
 class FittedBondDiscountCurveTest(unittest.TestCase):
 
     def testEvaluation(self):
@@ -144,3 +199,123 @@ class FittedBondDiscountCurveTest(unittest.TestCase):
             curveYield2 = curve2.zeroRate(t, Continuous).rate()
 
             self.assertTrue(abs(modelYield2 - curveYield2) / modelYield2 < 0.01)
+
+    def testSplineBasisValues(self):
+        TEST_MESSAGE(
+            "Testing closed-form spline basis functions against the original formulas...")
+
+        knotSets = [[0.0, 1.0, 3.0, 10.0],
+                    [0.0, 0.5, 2.0, 5.0, 7.5, 30.0]]
+        points = [-0.5, 0.0, 0.25, 0.5, 1.0, 2.0, 2.999, 3.0, 5.0, 7.5, 10.0, 12.0, 30.0, 40.0]
+
+        tolerance = 1.0e-12
+        for knots in knotSets:
+            for spline, reference in [(CubicSpline(knots), cubicSplineReference),
+                                      (QuadraticSpline(knots), quadraticSplineReference)]:
+                for x in points:
+                    values = spline.values(x)
+                    self.assertEqual(len(values), spline.size())
+                    for i in range(1, spline.size() + 1):
+                        expected = reference(knots, i, x)
+                        self.assertFalse(
+                            abs(values[i - 1] - expected) > tolerance * max(1.0, abs(expected)))
+                        self.assertFalse(
+                            abs(spline(i, x) - expected) > tolerance * max(1.0, abs(expected)))
+
+    def testSplineFitsUnchanged(self):
+        TEST_MESSAGE(
+            "Testing that spline-fitted curves match the original basis functions...")
+
+        savedSettings = SavedSettings()
+
+        asof = Date(15, Jul, 2019)
+        Settings.instance().evaluationDate = asof
+
+        helpers = makeBondHelpers(asof)
+        knots = [0.0, 2.0, 5.0, 10.0]
+
+        for method, size, reference in [
+                (CubicSplinesFitting(knots, Array(), LevenbergMarquardt()),
+                 len(knots) + 1, cubicSplineReference),
+                (QuadraticSplinesFitting(knots, Array(), LevenbergMarquardt()),
+                 len(knots), quadraticSplineReference)]:
+            curve = FittedBondDiscountCurve(
+                asof, helpers, Actual365Fixed(), method, 1.0e-10, 10000, Array(size, 0.0))
+            x = curve.fitResults().solution()
+
+            # cashflow times are served from the basis table built when
+            # fitting, other times are evaluated directly
+            times = [0.3, 1.7, 4.2, 8.9]
+            for h in helpers:
+                for c in h.bond().cashflows():
+                    times.append(curve.timeFromReference(c.date()))
+
+            for t in times:
+                expected = 1.0 + sum(
+                    x[i - 1] * reference(knots, i, t) for i in range(1, size + 1))
+                self.assertFalse(abs(curve.discount(t) - expected) > 1.0e-12)
+
+    def checkLeastSquaresFit(self, asof, helpers, method, guess):
+        optimized = FittedBondDiscountCurve(
+            asof, helpers, Actual365Fixed(), method, 1.0e-10, 10000, guess)
+        expected = optimized.fitResults().solution()
+
+        fitter = LeastSquaresBondFitter()
+        fitted = fitter.fit(asof, helpers, Actual365Fixed(), method, guess)
+        solution = fitter.solution()
+
+        self.assertEqual(len(solution), len(expected))
+        for i in range(len(expected)):
+            self.assertFalse(abs(solution[i] - expected[i]) > 1.0e-5)
+        for i in range(len(expected)):
+            self.assertFalse(abs(fitted.fitResults().solution()[i] - solution[i]) > 1.0e-15)
+
+        for h in helpers:
+            bond = h.bond()
+            bond.setPricingEngine(DiscountingBondEngine(YieldTermStructureHandle(optimized)))
+            expectedPrice = bond.cleanPrice()
+            bond.setPricingEngine(DiscountingBondEngine(YieldTermStructureHandle(fitted)))
+            self.assertFalse(abs(bond.cleanPrice() - expectedPrice) > 1.0e-4)
+
+    def testLeastSquaresBondFitter(self):
+        TEST_MESSAGE(
+            "Testing least-squares fits against the optimizer...")
+
+        savedSettings = SavedSettings()
+
+        asof = Date(15, Jul, 2019)
+        Settings.instance().evaluationDate = asof
+
+        helpers = makeBondHelpers(asof)
+        knots = [0.0, 2.0, 5.0, 10.0]
+        weights = Array([1.0, 2.0, 1.0, 3.0, 1.0, 2.0])
+
+        cubicSize = len(knots) + 1
+        quadraticSize = len(knots)
+        dieboldLiGuess = Array([0.03, -0.01, 0.0])
+
+        cases = [
+            (CubicSplinesFitting(knots, Array(), LevenbergMarquardt()),
+             Array(cubicSize, 0.0)),
+            (QuadraticSplinesFitting(knots, Array(), LevenbergMarquardt()),
+             Array(quadraticSize, 0.0)),
+            (DieboldLiFitting(0.5, Array(), LevenbergMarquardt()),
+             dieboldLiGuess),
+            # explicit weights instead of the duration-based ones
+            (CubicSplinesFitting(knots, weights, LevenbergMarquardt()),
+             Array(cubicSize, 0.0)),
+            (DieboldLiFitting(0.5, weights, LevenbergMarquardt()),
+             dieboldLiGuess),
+            # l2 regularisation towards the guess
+            (CubicSplinesFitting(knots, Array(), LevenbergMarquardt(),
+                                 Array(cubicSize, 0.1)),
+             Array(cubicSize, 0.001)),
+            (QuadraticSplinesFitting(knots, weights, LevenbergMarquardt(),
+                                     Array(quadraticSize, 0.1)),
+             Array(quadraticSize, 0.001)),
+            (DieboldLiFitting(0.5, Array(), LevenbergMarquardt(),
+                              Array(3, 0.01)),
+             dieboldLiGuess)]
+
+        for method, guess in cases:
+            self.checkLeastSquaresFit(asof, helpers, method, guess)
@@ -1,5 +1,6 @@
 import unittest
-from math import log, sin
+from math import erfc, log, sin, sqrt
+from time import perf_counter
 
 from QuantLib import *
 from numpy import exp
@@ -166,3 +167,74 @@ class FunctionsTest(unittest.TestCase):
                     y += 0.5
                 x += 0.5
             nu += 0.5
+
+    def testCompiledExpressions(self):
+        TEST_MESSAGE(
+            "Testing compiled expressions...")
+
+        payoff = Expression("max(exp(x) - 100.0, 0.0)", ["x"])
+        for x in [4.0, 4.5, 4.7, 5.0]:
+            self.assertFalse(
+                abs(payoff(x) - max(exp(x) - 100.0, 0.0)) > 1.0e-12)
+            self.assertFalse(
+                abs(payoff.derivative(x) - (exp(x) if x > log(100.0) else 0.0)) > 1.0e-12)
+
+        def localVol(t, s):
+            return 0.2 + 0.1 * (log(s / 100.0)) ** 2 * exp(-t) + 0.5 * erfc(-t / sqrt(2.0))
+
+        vol = Expression(
+            "0.2 + 0.1 * log(s / 100.0)^2 * exp(-t) + normcdf(t)", ["t", "s"])
+        self.assertFalse(vol.arity() != 2)
+        for t, s in [(0.0, 100.0), (0.5, 80.0), (2.0, 150.0)]:
+            self.assertFalse(abs(vol(t, s) - localVol(t, s)) > 1.0e-12)
+            self.assertFalse(abs(vol([t, s]) - localVol(t, s)) > 1.0e-12)
+            h = 1.0e-5
+            numerical = (localVol(t, s + h) - localVol(t, s - h)) / (2 * h)
+            self.assertFalse(abs(vol.derivative([t, s], 1) - numerical) > 1.0e-8)
+        values = vol.values([[0.0, 0.5], [100.0, 80.0]])
+        self.assertFalse(abs(values[1] - localVol(0.5, 80.0)) > 1.0e-12)
+
+        # constant subexpressions are folded
+        self.assertFalse(Expression("2.0 * 3.0 + exp(0.0) - x", ["x"]).size() != 3)
+
+        sigma = SafeLinearInterpolation([0.0, 1.0, 2.0], [0.2, 0.3, 0.25])
+        sigma.enableExtrapolation()
+        interpolated = Expression("sigma(t) * sqrt(t)", ["t"], ["sigma"], [sigma])
+        for t in [0.25, 1.5, 3.0]:
+            self.assertFalse(abs(interpolated(t) - sigma(t) * sqrt(t)) > 1.0e-12)
+
+        for formula in ["x +", "f(x)", "max(x)", "y", "(x"]:
+            self.assertRaises(RuntimeError, Expression, formula, ["x"])
+
+        # the objects taking Python callables accept expressions
+        me = SimpleQuote(17.0)
+        derived = DerivedUFQuote(QuoteHandle(me), Expression("10.0 * x", ["x"]))
+        self.assertFalse(abs(derived.value() - 170.0) > 1.0e-10)
+        me.setValue(3.0)
+        self.assertFalse(abs(derived.value() - 30.0) > 1.0e-10)
+
+        composite = CompositeBFQuote(
+            QuoteHandle(SimpleQuote(12.0)), QuoteHandle(SimpleQuote(13.0)),
+            Expression("x * y", ["x", "y"]))
+        self.assertFalse(abs(composite.value() - 156.0) > 1.0e-10)
+
+        today = Date(18, October, 2021)
+        dc = Actual365Fixed()
+        compiled = CustomLocalVolatility(vol, today, NullCalendar(), Following, dc)
+        python = CustomLocalVolatility(localVol, today, NullCalendar(), Following, dc)
+        for t, s in [(0.1, 90.0), (1.0, 120.0)]:
+            self.assertFalse(
+                abs(compiled.localVol(t, s) - python.localVol(t, s)) > 1.0e-12)
+
+        integral = SegmentIntegral(200000)
+        start = perf_counter()
+        expected = integral(lambda x: localVol(1.0, x), 50.0, 150.0)
+        pythonTime = perf_counter() - start
+        start = perf_counter()
+        calculated = integral(Expression(
+            "0.2 + 0.1 * log(x / 100.0)^2 * exp(-1.0) + normcdf(1.0)", ["x"]), 50.0, 150.0)
+        compiledTime = perf_counter() - start
+        self.assertFalse(abs(calculated - expected) > 1.0e-8 * abs(expected))
+        TEST_MESSAGE(
+            "    integral with Python callback: %.4fs, compiled: %.4fs"
+            % (pythonTime, compiledTime))
@@ -1,5 +1,6 @@
 import unittest
 from math import exp, sqrt, log10, log
+from time import perf_counter
 
 import numpy as np
 from QuantLib import *
@@ -2447,3 +2448,76 @@ class HestonModelTest(unittest.TestCase):
         tol = 0.002
         diff = abs(calculated - expected)
         self.assertFalse(diff > tol)
+
+    def testParallelCalibration(self):
+        TEST_MESSAGE(
+            "Testing parallel Heston model calibration using DAX volatility data...")
+
+        if not ParallelCalibration.concurrent():
+            self.skipTest("QuantLib built without thread-safe observers")
+
+        backup = SavedSettings()
+        settlementDate = Date(5, July, 2002)
+        Settings.instance().evaluationDate = settlementDate
+
+        def calibrationSetup():
+            marketData = getDAXCalibrationMarketData()
+            process = HestonProcess(
+                marketData.riskFreeTS, marketData.dividendYield,
+                marketData.s0, 0.1, 1.0, 0.1, 0.5, -0.5)
+            return HestonModel(process), marketData.options
+
+        om = LevenbergMarquardt(1e-8, 1e-8, 1e-8)
+        endCriteria = EndCriteria(400, 40, 1.0e-8, 1.0e-8, 1.0e-8)
+
+        model, options = calibrationSetup()
+        engine = AnalyticHestonEngine(model, 64)
+        for option in options:
+            as_black_helper(option).setPricingEngine(engine)
+        start = perf_counter()
+        model.calibrate(options, om, endCriteria)
+        serialTime = perf_counter() - start
+
+        parallelModel, parallelOptions = calibrationSetup()
+        # one engine per helper, so that each can go to its own thread
+        for option in parallelOptions:
+            as_black_helper(option).setPricingEngine(
+                AnalyticHestonEngine(parallelModel, 64))
+        calibration = ParallelCalibration(4)
+        self.assertFalse(calibration.threads() <= 1)
+        calibration.calibrate(parallelModel, parallelOptions, om, endCriteria)
+
+        TEST_MESSAGE(
+            "    serial: %.3fs, parallel: %.3fs on %d threads "
+            "(%d groups, %d evaluations, %.2fms per evaluation)" % (
+                serialTime, calibration.totalTime(), calibration.threads(),
+                calibration.groups(), len(calibration.evaluationTimes()),
+                1000.0 * sum(calibration.evaluationTimes()) /
+                len(calibration.evaluationTimes())))
+
+        self.assertEqual(calibration.groups(), len(parallelOptions))
+        self.assertEqual(
+            len(calibration.evaluationTimes()),
+            len(calibration.helperTimes()))
+        self.assertFalse(len(calibration.evaluationTimes()) == 0)
+        # every timed evaluation falls within the calibration
+        self.assertFalse(
+            sum(calibration.evaluationTimes()) > calibration.totalTime())
+        for total, helpers in zip(calibration.evaluationTimes(),
+                                  calibration.helperTimes()):
+            self.assertFalse(helpers > total)
+
+        tol = 1e-6
+        for calculated, expected in zip(parallelModel.params(), model.params()):
+            self.assertFalse(abs(calculated - expected) > tol)
+        self.assertEqual(
+            len(calibration.problemValues()), len(model.problemValues()))
+        for calculated, expected in zip(calibration.problemValues(),
+                                        model.problemValues()):
+            self.assertFalse(abs(calculated - expected) > tol)
+
+        # shared engines are evaluated in sequence on the same thread
+        for option in parallelOptions:
+            as_black_helper(option).setPricingEngine(engine)
+        calibration.calibrate(model, parallelOptions, om, endCriteria)
+        self.assertEqual(calibration.groups(), 1)
@@ -78,3 +78,89 @@ class InstrumentTest(unittest.TestCase):
 
         self.assertFalse(composite.isExpired())
         self.assertFalse(composite.NPV() == 0.0)
+
+    def testPortfolioPricer(self):
+        TEST_MESSAGE(
+            "Testing portfolio pricer against serial evaluation...")
+
+        backup = SavedSettings()
+        dc = Actual360()
+        today = knownGoodDefault
+        Settings.instance().evaluationDate = today
+
+        def makeInstruments(volTS, sharedEngine=True):
+            process = BlackScholesMertonProcess(
+                QuoteHandle(SimpleQuote(100.0)),
+                YieldTermStructureHandle(
+                    flatRate(today, SimpleQuote(0.02), dc)),
+                YieldTermStructureHandle(
+                    flatRate(today, SimpleQuote(0.05), dc)),
+                BlackVolTermStructureHandle(volTS))
+            engine = AnalyticEuropeanEngine(process)
+            instruments = InstrumentVector()
+            for i in range(200):
+                option = EuropeanOption(
+                    PlainVanillaPayoff(Option.Call, 50.0 + i * 0.5),
+                    EuropeanExercise(today + Period(1 + i % 24, Months)))
+                if sharedEngine:
+                    option.setPricingEngine(engine)
+                else:
+                    option.setPricingEngine(AnalyticEuropeanEngine(process))
+                instruments.append(option)
+            return instruments
+
+        # one engine per option, so that each can go to its own thread
+        instruments = makeInstruments(
+            flatVol(today, SimpleQuote(0.20), dc), sharedEngine=False)
+        failing = EuropeanOption(
+            PlainVanillaPayoff(Option.Call, 100.0),
+            EuropeanExercise(today + Period(1, Years)))
+        instruments.append(failing)
+
+        # an independent copy of the portfolio, priced in a Python loop
+        expected = [
+            option.NPV() for option in
+            makeInstruments(flatVol(today, SimpleQuote(0.20), dc))]
+
+        pricer = PortfolioPricer(4)
+        if PortfolioPricer.concurrent():
+            self.assertFalse(pricer.threads() <= 1)
+        else:
+            self.assertFalse(pricer.threads() != 1)
+        pricer.calculate(instruments)
+        npvs = pricer.NPVs()
+        errors = pricer.errors()
+
+        # the option without an engine makes a group of its own
+        self.assertFalse(pricer.groups() != len(instruments))
+        self.assertTrue(pricer.failures() == 1)
+        self.assertTrue(errors[len(instruments) - 1] != "")
+        for i in range(len(instruments) - 1):
+            self.assertTrue(errors[i] == "")
+            self.assertFalse(
+                abs(npvs[i] - expected[i]) > 1e-12,
+                "parallel NPV differs from serial NPV")
+
+        # options sharing an engine are priced on the same thread
+        instruments = makeInstruments(flatVol(today, SimpleQuote(0.20), dc))
+        pricer.calculate(instruments)
+        self.assertFalse(pricer.groups() != 1)
+        self.assertTrue(pricer.failures() == 0)
+        for i in range(len(instruments)):
+            self.assertFalse(
+                abs(pricer.NPVs()[i] - expected[i]) > 1e-12,
+                "NPV with a shared engine differs from serial NPV")
+
+        # a serial pricer keeps the GIL, so that engines and term
+        # structures may call back into Python
+        pythonVolTS = CustomBlackVolatility(
+            lambda t, k: 0.20, today, NullCalendar(), Following, dc)
+        instruments = makeInstruments(pythonVolTS)
+        pricer = PortfolioPricer(1)
+        pricer.calculate(instruments)
+
+        self.assertTrue(pricer.failures() == 0)
+        for i in range(len(instruments)):
+            self.assertFalse(
+                abs(pricer.NPVs()[i] - expected[i]) > 1e-12,
+                "serial NPV with Python volatility differs")
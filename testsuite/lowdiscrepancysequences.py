@@ -1,4 +1,5 @@
 import unittest
+from time import perf_counter
 
 from QuantLib import *
 
@@ -569,6 +570,51 @@ class LowDiscrepancyTest(unittest.TestCase):
                         for n in range(len(s1)):
                             self.assertFalse(s1[n] != s2[n])
 
+    def testBlockSequences(self):
+        TEST_MESSAGE(
+            "Testing block filling of sequence generators...")
+
+        seed = 42
+        dim = 16
+        n = 4096
+
+        generators = [
+            lambda: SobolRsg(dim, seed),
+            lambda: HaltonRsg(dim, seed),
+            lambda: MersenneTwisterUniformRsg(dim, seed)]
+
+        for factory in generators:
+            rsg = factory()
+            start = perf_counter()
+            expected = [rsg.nextSequence().value() for i in range(n)]
+            loopTime = perf_counter() - start
+
+            start = perf_counter()
+            calculated = factory().nextSequences(n)
+            blockTime = perf_counter() - start
+
+            TEST_MESSAGE(
+                "%d sequences: Python loop %.4fs, nextSequences %.4fs" %
+                (n, loopTime, blockTime))
+
+            self.assertFalse(calculated.shape != (n, dim))
+            for i in range(n):
+                for j in range(dim):
+                    self.assertFalse(calculated[i, j] != expected[i][j])
+
+        # striped fills reproduce the sequential stream
+        sequential = SobolRsg(dim, seed).nextSequences(n)
+        for threads in [1, 3, 8]:
+            striped = sobolSequences(dim, 0, n, seed, SobolRsg.Jaeckel, threads)
+            for i in range(n):
+                for j in range(dim):
+                    self.assertFalse(striped[i][j] != sequential[i, j])
+
+        chunk = sobolSequences(dim, 1000, 500, seed)
+        for i in range(500):
+            for j in range(dim):
+                self.assertFalse(chunk[i][j] != sequential[1000 + i, j])
+
     def testRandomizedLattices(self):
         self._testRandomizedLatticeRule(LatticeRule.A, "A")
         self._testRandomizedLatticeRule(LatticeRule.B, "B")
@@ -1,6 +1,8 @@
 import unittest
 from math import sqrt, isnan
 
+import numpy as np
+
 from QuantLib import *
 
 from utilities import *
@@ -820,3 +822,29 @@ class MatricesTest(unittest.TestCase):
     def testSparseMatrixMemory(self):
         TEST_MESSAGE(
             "Testing sparse matrix memory layout...")
+
+    def testBufferProtocol(self):
+        TEST_MESSAGE(
+            "Testing matrix buffer protocol...")
+        m = Matrix(3, 4)
+        for i in range(3):
+            for j in range(4):
+                m[i][j] = 10.0 * i + j
+
+        v = np.asarray(m)
+        self.assertTrue(v.shape == (3, 4))
+        for i in range(3):
+            for j in range(4):
+                self.assertFalse(v[i, j] != m[i][j])
+
+        v[2, 1] = -1.0
+        self.assertFalse(
+            m[2][1] != -1.0,
+            "matrix view does not share storage")
+
+        x = np.arange(12.0).reshape(3, 4)
+        t = transpose(x)
+        self.assertTrue(t.rows() == 4 and t.columns() == 3)
+        for i in range(3):
+            for j in range(4):
+                self.assertFalse(t[j][i] != x[i, j])
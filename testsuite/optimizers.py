@@ -1,6 +1,7 @@
 import unittest
 from math import sqrt, floor, cos
 
+import numpy as np
 from QuantLib import *
 
 from utilities import *
@@ -291,6 +292,52 @@ class Griewangk(object):
         return fx - p + 1.0
 
 
+class ExponentialDecayFit(object):
+    '''least-squares fit of a * exp(-b * t) + c with analytic derivatives'''
+
+    def __init__(self, times, observations):
+        self.times = np.asarray(times)
+        self.observations = np.asarray(observations)
+        self.calls = {'values': 0, 'jacobian': 0, 'gradient': 0}
+
+    def residuals(self, x):
+        a, b, c = np.asarray(x)
+        return a * np.exp(-b * self.times) + c - self.observations
+
+    def value(self, x):
+        r = self.residuals(x)
+        return float(r @ r)
+
+    def values(self, x):
+        self.calls['values'] += 1
+        return self.residuals(x)
+
+    def jacobian(self, x):
+        self.calls['jacobian'] += 1
+        a, b, c = np.asarray(x)
+        e = np.exp(-b * self.times)
+        return np.column_stack([e, -a * self.times * e, np.ones_like(e)])
+
+    def gradient(self, x):
+        self.calls['gradient'] += 1
+        return 2.0 * self.jacobian(x).T @ self.residuals(x)
+
+
+class ExponentialDecayValues(object):
+    '''the same fit, without derivatives'''
+
+    def __init__(self, fit):
+        self.fit = fit
+        self.calls = 0
+
+    def value(self, x):
+        return self.fit.value(x)
+
+    def values(self, x):
+        self.calls += 1
+        return self.fit.residuals(x).tolist()
+
+
 class OptimizersTest(unittest.TestCase):
 
     @unittest.skip("test")
@@ -446,3 +493,46 @@ class OptimizersTest(unittest.TestCase):
                 self.assertFalse(abs(problem.functionValue() - minima[i]) > 1e-8)
             else:
                 self.assertFalse(problem.functionValue() > 15)
+
+    def testAnalyticDerivatives(self):
+        TEST_MESSAGE(
+            "Testing cost functions with analytic derivatives...")
+
+        times = np.linspace(0.0, 5.0, 40)
+        expected = [2.0, 0.7, 0.5]
+        observations = expected[0] * np.exp(-expected[1] * times) + expected[2]
+        fit = ExponentialDecayFit(times, observations)
+        withoutDerivatives = ExponentialDecayValues(fit)
+
+        costFunction = CustomCostFunction(fit)
+        x = Array([1.5, 0.5, 0.2])
+        jacobian = Matrix(len(times), 3)
+        costFunction.jacobian(jacobian, x)
+        numerical = Matrix(len(times), 3)
+        CustomCostFunction(withoutDerivatives).jacobian(numerical, x)
+        for i in range(len(times)):
+            for j in range(3):
+                self.assertFalse(abs(jacobian[i][j] - numerical[i][j]) > 1.0e-5)
+        gradient = Array(3)
+        costFunction.gradient(gradient, x)
+        expectedGradient = 2.0 * fit.jacobian(x).T @ fit.residuals(x)
+        for j in range(3):
+            self.assertFalse(abs(gradient[j] - expectedGradient[j]) > 1.0e-12)
+
+        endCriteria = EndCriteria(1000, 100, 1e-12, 1e-12, 1e-12)
+        for function, calls in [(fit, lambda: fit.calls['values']),
+                                (withoutDerivatives, lambda: withoutDerivatives.calls)]:
+            problem = Problem(
+                CustomCostFunction(function), NoConstraint(), Array([1.5, 0.5, 0.2]))
+            LevenbergMarquardt(1e-8, 1e-8, 1e-8, True).minimize(problem, endCriteria)
+            for j in range(3):
+                self.assertFalse(abs(problem.currentValue()[j] - expected[j]) > 1.0e-6)
+        self.assertFalse(fit.calls['jacobian'] == 0)
+        # the finite differences take one call per parameter
+        self.assertFalse(fit.calls['values'] >= withoutDerivatives.calls)
+
+        fit.calls['gradient'] = 0
+        problem = Problem(costFunction, NoConstraint(), Array([1.5, 0.5, 0.2]))
+        BFGS().minimize(problem, endCriteria)
+        self.assertFalse(fit.calls['gradient'] == 0)
+        self.assertFalse(problem.functionValue() > 1.0e-10)
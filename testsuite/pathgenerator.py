@@ -1,4 +1,5 @@
 import unittest
+from time import perf_counter
 
 from QuantLib import *
 
@@ -123,6 +124,77 @@ class PathGeneratorTest(unittest.TestCase):
             3.503859264341]
         self._testMultiple(process, "square-root", result4, result4a)
 
+    def testBulkGeneration(self):
+        TEST_MESSAGE(
+            "Testing bulk path generation against single paths...")
+
+        backup = SavedSettings()
+
+        Settings.instance().evaluationDate = Date(26, April, 2005)
+
+        seed = 42
+        length = 10
+        timeSteps = 12
+        nPaths = 2001
+        process = GeometricBrownianMotionProcess(100.0, 0.03, 0.20)
+
+        def pathGenerator():
+            rsg = GaussianRandomSequenceGenerator(
+                UniformRandomSequenceGenerator(
+                    timeSteps, UniformRandomGenerator(seed)))
+            return GaussianPathGenerator(
+                process, length, timeSteps, rsg, false)
+
+        generator = pathGenerator()
+        start = perf_counter()
+        expected = []
+        for i in range(nPaths):
+            if i % 2 == 0:
+                path = generator.next().value()
+            else:
+                path = generator.antithetic().value()
+            expected.append([path[j] for j in range(len(path))])
+        loopTime = perf_counter() - start
+
+        start = perf_counter()
+        calculated = pathGenerator().generate(nPaths)
+        bulkTime = perf_counter() - start
+
+        TEST_MESSAGE(
+            "%d paths: Python loop %.4fs, generate %.4fs" %
+            (nPaths, loopTime, bulkTime))
+
+        self.assertFalse(calculated.shape != (nPaths, timeSteps + 1))
+        for i in range(nPaths):
+            for j in range(timeSteps + 1):
+                self.assertFalse(calculated[i, j] != expected[i][j])
+
+        correlation = Matrix(2, 2)
+        correlation[0][0] = 1.0
+        correlation[0][1] = 0.5
+        correlation[1][0] = 0.5
+        correlation[1][1] = 1.0
+        processes = StochasticProcess1DVector(2)
+        processes[0] = GeometricBrownianMotionProcess(100.0, 0.03, 0.20)
+        processes[1] = OrnsteinUhlenbeckProcess(0.1, 0.20)
+        process = StochasticProcessArray(processes, correlation)
+
+        def multiPathGenerator():
+            rsg = GaussianRandomSequenceGenerator(
+                UniformRandomSequenceGenerator(
+                    timeSteps * 2, UniformRandomGenerator(seed)))
+            return GaussianMultiPathGenerator(
+                process, TimeGrid(length, timeSteps), rsg, false)
+
+        generator = multiPathGenerator()
+        calculated = multiPathGenerator().generate(10, false)
+        self.assertFalse(calculated.shape != (10, timeSteps + 1, 2))
+        for i in range(10):
+            sample = generator.next().value()
+            for j in range(timeSteps + 1):
+                for k in range(2):
+                    self.assertFalse(calculated[i, j, k] != sample[k][j])
+
     def _testSingle(self,
                     process,
                     tag,
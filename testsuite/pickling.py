@@ -0,0 +1,249 @@
+import pickle
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+from QuantLib import *
+
+from utilities import *
+
+
+def makeBond(today, quotes):
+    calendar = TARGET()
+    settlementDays = 2
+    index = IborIndex(
+        "dummy", Period(3, Months), settlementDays,
+        Currency(), calendar, ModifiedFollowing,
+        false, Actual360())
+
+    helpers = RateHelperVector()
+    helpers.append(
+        DepositRateHelper(
+            QuoteHandle(quotes[0]), Period(3, Months),
+            settlementDays, calendar,
+            ModifiedFollowing, true, Actual360()))
+    for q, monthsToStart in zip(quotes[1:], [3, 6]):
+        helpers.append(
+            FraRateHelper(QuoteHandle(q), monthsToStart, index))
+
+    curve = PiecewiseLogLinearDiscount(
+        settlementDays, calendar, helpers, Actual360(), LogLinear())
+    curve.enableExtrapolation()
+
+    schedule = Schedule(
+        today, today + Period(5, Years), Period(Annual),
+        calendar, Unadjusted, Unadjusted,
+        DateGeneration.Backward, false)
+    bond = FixedRateBond(
+        settlementDays, 100.0, schedule,
+        DoubleVector(1, 0.05), Actual365Fixed())
+    bond.setPricingEngine(
+        DiscountingBondEngine(YieldTermStructureHandle(curve)))
+    return bond, curve
+
+
+def bondNPV(today, quotes):
+    Settings.instance().evaluationDate = today
+    bond, curve = makeBond(today, quotes)
+    return bond.NPV()
+
+
+def bondNPVOnCurve(today, bond, curve):
+    Settings.instance().evaluationDate = today
+    bond.setPricingEngine(
+        DiscountingBondEngine(YieldTermStructureHandle(curve)))
+    return bond.NPV()
+
+
+def roundTrip(obj):
+    return pickle.loads(pickle.dumps(obj))
+
+
+class PicklingTest(unittest.TestCase):
+
+    def testValueTypes(self):
+        TEST_MESSAGE(
+            "Testing pickling of value types...")
+
+        date = Date(15, March, 2023)
+        self.assertFalse(pickle.loads(pickle.dumps(date)) != date)
+        self.assertFalse(pickle.loads(pickle.dumps(Date())) != Date())
+
+        period = Period(18, Months)
+        self.assertFalse(pickle.loads(pickle.dumps(period)) != period)
+
+        array = Array([1.0, 2.0, 3.0])
+        copied = pickle.loads(pickle.dumps(array))
+        self.assertFalse(list(copied) != list(array))
+
+        dates = DateVector([date, date + 1])
+        copied = pickle.loads(pickle.dumps(dates))
+        self.assertFalse(list(copied) != list(dates))
+
+        values = DoubleVectorVector([[1.0, 2.0], [3.0]])
+        copied = pickle.loads(pickle.dumps(values))
+        self.assertFalse(
+            [list(v) for v in copied] != [list(v) for v in values])
+
+        quote = SimpleQuote(1.0)
+        quote.setValue(1.5)
+        self.assertFalse(pickle.loads(pickle.dumps(quote)).value() != 1.5)
+        self.assertFalse(pickle.loads(pickle.dumps(SimpleQuote())).isValid())
+
+    def testMarketConventions(self):
+        TEST_MESSAGE(
+            "Testing pickling of calendars, day counters and schedules...")
+
+        for calendar in [TARGET(), UnitedStates(UnitedStates.NYSE),
+                         Germany(Germany.Eurex), NullCalendar(), Calendar()]:
+            self.assertFalse(roundTrip(calendar) != calendar)
+
+        calendar = BespokeCalendar("pickled")
+        self.assertRaises(TypeError, pickle.dumps, calendar)
+
+        # added holidays are restored when unpickling
+        holiday = Date(15, March, 2023)
+        calendar = WeekendsOnly()
+        calendar.addHoliday(holiday)
+        try:
+            data = pickle.dumps(calendar)
+        finally:
+            calendar.removeHoliday(holiday)
+        self.assertFalse(WeekendsOnly().isHoliday(holiday))
+        try:
+            self.assertFalse(not pickle.loads(data).isHoliday(holiday))
+        finally:
+            WeekendsOnly().removeHoliday(holiday)
+
+        for dayCounter in [Actual360(), Actual360(True), Actual365Fixed(),
+                           ActualActual(ActualActual.ISDA),
+                           Thirty360(Thirty360.BondBasis),
+                           Business252(TARGET()), DayCounter()]:
+            self.assertFalse(roundTrip(dayCounter) != dayCounter)
+
+        for currency in [EURCurrency(), USDCurrency(), Currency()]:
+            self.assertFalse(roundTrip(currency) != currency)
+
+        start = Date(15, March, 2023)
+        for schedule in [
+                Schedule(start, start + Period(5, Years), Period(Semiannual),
+                         TARGET(), ModifiedFollowing, Unadjusted,
+                         DateGeneration.Backward, true,
+                         Date(), Date(15, January, 2028)),
+                Schedule(DateVector([start, start + Period(1, Years)])),
+                Schedule()]:
+            copied = roundTrip(schedule)
+            self.assertFalse(list(copied.dates()) != list(schedule.dates()))
+            self.assertFalse(copied.hasRule() != schedule.hasRule())
+            if schedule.hasRule():
+                self.assertFalse(copied.rule() != schedule.rule())
+                self.assertFalse(copied.tenor() != schedule.tenor())
+                self.assertFalse(copied.calendar() != schedule.calendar())
+                self.assertFalse(
+                    list(copied.isRegular()) != list(schedule.isRegular()))
+
+    def testCurvesAndInstruments(self):
+        TEST_MESSAGE(
+            "Testing pickling of curves and instruments...")
+
+        backup = SavedSettings()
+        today = TARGET().adjust(knownGoodDefault)
+        Settings.instance().evaluationDate = today
+
+        quotes = [SimpleQuote(r) for r in [0.0455, 0.0458, 0.0462]]
+        bond, curve = makeBond(today, quotes)
+
+        copied = roundTrip(curve)
+        self.assertTrue(isinstance(copied, DiscountCurve))
+        self.assertFalse(not copied.allowsExtrapolation())
+        for d in list(curve.dates()) + [today + Period(2, Years)]:
+            self.assertFalse(
+                abs(copied.discount(d) - curve.discount(d)) > 1.0e-15)
+        # the node curve is picklable in turn
+        self.assertFalse(
+            abs(roundTrip(copied).discount(1.5) - curve.discount(1.5)) > 1.0e-15)
+
+        for flat in [FlatForward(today, 0.03, Actual365Fixed()),
+                     FlatForward(2, TARGET(), 0.03, Actual360(), Compounded, Semiannual)]:
+            copied = roundTrip(flat)
+            self.assertFalse(copied.referenceDate() != flat.referenceDate())
+            self.assertFalse(abs(copied.discount(3.0) - flat.discount(3.0)) > 1.0e-14)
+
+        copiedBond = roundTrip(bond)
+        copiedBond.setPricingEngine(
+            DiscountingBondEngine(YieldTermStructureHandle(curve)))
+        self.assertFalse(abs(copiedBond.NPV() - bond.NPV()) > 1.0e-10)
+
+        forwarding = RelinkableYieldTermStructureHandle(curve)
+        index = Euribor(Period(6, Months), forwarding)
+        swap = MakeVanillaSwap(Period(5, Years), index, 0.05).makeVanillaSwap()
+        engine = DiscountingSwapEngine(YieldTermStructureHandle(curve))
+        swap.setPricingEngine(engine)
+        copiedSwap = roundTrip(swap)
+        copiedSwap.setPricingEngine(engine)
+        self.assertFalse(abs(copiedSwap.NPV() - swap.NPV()) > 1.0e-10)
+        self.assertFalse(copiedSwap.iborIndex().name() != index.name())
+
+        overnight = roundTrip(Eonia(forwarding))
+        self.assertFalse(overnight.name() != Eonia().name())
+
+    def testUnpicklableObjects(self):
+        TEST_MESSAGE(
+            "Testing that objects with hidden state cannot be pickled...")
+
+        backup = SavedSettings()
+        today = TARGET().adjust(knownGoodDefault)
+        Settings.instance().evaluationDate = today
+
+        quotes = [SimpleQuote(r) for r in [0.0455, 0.0458, 0.0462]]
+        bond, curve = makeBond(today, quotes)
+        model = HestonModel(HestonProcess(
+            YieldTermStructureHandle(curve), YieldTermStructureHandle(curve),
+            QuoteHandle(SimpleQuote(100.0)), 0.04, 1.0, 0.04, 0.5, -0.5))
+
+        helper = BondHelper(QuoteHandle(quotes[0]), bond)
+        deposits = RateHelperVector()
+        deposits.append(
+            DepositRateHelper(
+                QuoteHandle(quotes[0]), Period(3, Months), 2, TARGET(),
+                ModifiedFollowing, true, Actual360()))
+        jumps = PiecewiseLogLinearDiscount(
+            today, deposits, Actual360(),
+            [QuoteHandle(SimpleQuote(0.99))], [today + Period(1, Months)],
+            LogLinear())
+
+        for obj in [model, QuoteHandle(quotes[0]), helper.bond(), jumps,
+                    ZeroSpreadedTermStructure(
+                        YieldTermStructureHandle(curve),
+                        QuoteHandle(SimpleQuote(0.01))),
+                    JointCalendar(TARGET(), UnitedKingdom()),
+                    USDLibor(Period(3, Months))]:
+            self.assertRaises(TypeError, pickle.dumps, obj)
+
+    def testProcessPool(self):
+        TEST_MESSAGE(
+            "Testing pricing in worker processes...")
+
+        backup = SavedSettings()
+        today = TARGET().adjust(knownGoodDefault)
+        Settings.instance().evaluationDate = today
+
+        quotes = [SimpleQuote(r) for r in [0.0455, 0.0458, 0.0462]]
+        bond, curve = makeBond(today, quotes)
+        quotes[0].setValue(0.0465)
+        expected = bond.NPV()
+
+        # the market data can be sent to the workers, which build the curve
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            results = list(
+                pool.map(bondNPV, [today] * 4, [quotes] * 4))
+
+        for npv in results:
+            self.assertFalse(abs(npv - expected) > 1.0e-10)
+
+        # or the curve is bootstrapped once and its nodes are sent
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            results = list(
+                pool.map(bondNPVOnCurve, [today] * 4, [bond] * 4, [curve] * 4))
+
+        for npv in results:
+            self.assertFalse(abs(npv - expected) > 1.0e-10)
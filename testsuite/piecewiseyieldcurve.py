@@ -1,5 +1,8 @@
+import os
+import tempfile
 import unittest
 from copy import deepcopy
+from time import perf_counter
 
 from QuantLib import *
 
@@ -1199,3 +1202,241 @@ class PiecewiseYieldCurveTest(unittest.TestCase):
         self.assertFalse(close(r1.rate(), r3.rate()))
         b = close(r2.rate(), r4.rate())
         self.assertFalse(not close(r2.rate(), r4.rate()))
+
+    def testCurveSnapshot(self):
+        TEST_MESSAGE(
+            "Testing save and load of curve snapshots...")
+
+        vars = CommonVars()
+
+        curve = PiecewiseLogLinearDiscount(
+            vars.settlementDays, vars.calendar,
+            vars.instruments, Actual360(), LogLinear())
+        curve.enableExtrapolation()
+
+        fd, path = tempfile.mkstemp(suffix='.qlc')
+        os.close(fd)
+        try:
+            saveCurveSnapshot(curve, path)
+
+            live = PiecewiseLogLinearDiscount(
+                vars.settlementDays, vars.calendar,
+                vars.instruments, Actual360(), LogLinear())
+            live.enableExtrapolation()
+            restored = loadCurveSnapshot(path, live)
+            detached = loadCurveSnapshot(
+                path, live, attach=False, interpolator=LogLinear())
+
+            # the template must match the saved class and day counter
+            self.assertRaises(
+                ValueError, loadCurveSnapshot, path,
+                FlatForward(vars.settlement, 0.03, Actual360()))
+            self.assertRaises(
+                ValueError, loadCurveSnapshot, path,
+                PiecewiseLogLinearDiscount(
+                    vars.settlementDays, vars.calendar,
+                    vars.instruments, Actual365Fixed(), LogLinear()))
+        finally:
+            os.remove(path)
+
+        self.assertFalse(not restored.usesSnapshot())
+        self.assertFalse(restored.referenceDate() != curve.referenceDate())
+
+        tolerance = 1.0e-14
+        for d in [vars.settlement + Period(n, Months) for n in range(1, 360, 7)]:
+            self.assertFalse(
+                abs(restored.discount(d) - curve.discount(d)) > tolerance)
+            self.assertFalse(
+                abs(detached.discount(d) - curve.discount(d)) > tolerance)
+
+        vars.rates[0].setValue(vars.rates[0].value() + 0.001)
+
+        self.assertFalse(restored.usesSnapshot())
+        self.assertFalse(not detached.usesSnapshot())
+        d = vars.settlement + Period(3, Months)
+        self.assertFalse(
+            abs(restored.discount(d) - live.discount(d)) > tolerance)
+        self.assertFalse(
+            abs(restored.discount(d) - detached.discount(d)) < 1.0e-6)
+
+    def testIncrementalBootstrap(self):
+        TEST_MESSAGE(
+            "Testing incremental re-bootstrap against full bootstrap...")
+
+        vars = CommonVars()
+
+        euribor6m = Euribor6M()
+        swapTenors = range(1, 55)
+        quotes = [SimpleQuote(d.rate / 100) for d in depositData] + \
+                 [SimpleQuote((4.5 + 0.025 * n) / 100) for n in swapTenors]
+
+        # separate helpers for each curve, observing the same quotes
+        def helpers():
+            result = RateHelperVector()
+            for d, q in zip(depositData, quotes):
+                result.append(DepositRateHelper(
+                    QuoteHandle(q), Euribor(Period(d.n, d.units))))
+            for n, q in zip(swapTenors, quotes[len(depositData):]):
+                result.append(SwapRateHelper(
+                    QuoteHandle(q), Period(n, Years), vars.calendar,
+                    vars.fixedLegFrequency, vars.fixedLegConvention,
+                    vars.fixedLegDayCounter, euribor6m))
+            return result
+
+        full = PiecewiseLogLinearDiscount(
+            vars.settlementDays, vars.calendar, helpers(),
+            Actual360(), LogLinear())
+        incremental = IncrementalPiecewiseLogLinearDiscount(
+            vars.settlementDays, vars.calendar, helpers(),
+            Actual360(), LogLinear())
+
+        tolerance = 1.0e-9
+
+        def checkNodes():
+            self.assertFalse(
+                len(incremental.dates()) != len(full.dates()))
+            for d in full.dates():
+                self.assertFalse(
+                    abs(incremental.discount(d) - full.discount(d)) > tolerance)
+
+        checkNodes()
+
+        # ticks moving the long end only
+        ticks = 50
+        longEnd = quotes[-5:]
+
+        def tick(k):
+            for q in longEnd:
+                q.setValue(q.value() + (1.0e-4 if k % 2 == 0 else -1.0e-4))
+
+        lastDate = full.maxDate()
+        start = perf_counter()
+        for k in range(ticks):
+            tick(k)
+            full.discount(lastDate)
+        fullTime = perf_counter() - start
+
+        start = perf_counter()
+        for k in range(ticks):
+            tick(k)
+            incremental.discount(lastDate)
+        incrementalTime = perf_counter() - start
+
+        TEST_MESSAGE(
+            "%d ticks on a %d-pillar curve: full %.4fs, incremental %.4fs" %
+            (ticks, len(quotes), fullTime, incrementalTime))
+
+        checkNodes()
+        # only the long-end pillars were solved again
+        self.assertFalse(
+            incremental.lastRestartPillar() != len(quotes) - len(longEnd) + 1)
+
+        for q in longEnd:
+            q.setValue(q.value() + 5.0e-4)
+        checkNodes()
+
+        # changes at the front end require the whole curve
+        quotes[0].setValue(quotes[0].value() + 5.0e-4)
+        checkNodes()
+        self.assertFalse(incremental.lastRestartPillar() != 1)
+        quotes[len(depositData) + 10].setValue(
+            quotes[len(depositData) + 10].value() - 5.0e-4)
+        checkNodes()
+
+        # moving the curve dates
+        Settings.instance().evaluationDate = \
+            vars.calendar.advance(vars.today, 1, Days)
+        checkNodes()
+        longEnd[0].setValue(longEnd[0].value() + 5.0e-4)
+        checkNodes()
+
+        # a jump changing in the same tick as the long end
+        jump = SimpleQuote(0.999)
+        jumps = QuoteHandleVector([QuoteHandle(jump)])
+        jumpDates = DateVector([vars.calendar.advance(vars.today, 2, Years)])
+        full = PiecewiseLogLinearDiscount(
+            vars.settlementDays, vars.calendar, helpers(),
+            Actual360(), jumps, jumpDates, LogLinear())
+        incremental = IncrementalPiecewiseLogLinearDiscount(
+            vars.settlementDays, vars.calendar, helpers(),
+            Actual360(), jumps, jumpDates, LogLinear())
+        checkNodes()
+
+        tick(0)
+        checkNodes()
+        self.assertFalse(incremental.lastRestartPillar() == 1)
+
+        jump.setValue(0.998)
+        tick(1)
+        checkNodes()
+        self.assertFalse(incremental.lastRestartPillar() != 1)
+
+        IndexManager.instance().clearHistories()
+
+    def testNodeJacobian(self):
+        TEST_MESSAGE(
+            "Testing finite-difference node Jacobian against bumped bootstraps...")
+
+        vars = CommonVars()
+
+        curve = PiecewiseLogLinearDiscount(
+            vars.settlementDays, vars.calendar,
+            vars.instruments, Actual360(), LogLinear())
+
+        jacobian = curve.finiteDifferenceNodeJacobian(vars.instruments)
+        nodes = len(curve.data())
+        self.assertFalse(jacobian.rows() != nodes)
+        self.assertFalse(jacobian.columns() != len(vars.instruments))
+
+        h = 1.0e-6
+        tolerance = 1.0e-5
+        for k in range(len(vars.rates)):
+            base = vars.rates[k].value()
+            vars.rates[k].setValue(base + h)
+            up = list(curve.data())
+            vars.rates[k].setValue(base - h)
+            down = list(curve.data())
+            vars.rates[k].setValue(base)
+            for i in range(nodes):
+                expected = (up[i] - down[i]) / (2 * h)
+                self.assertFalse(abs(jacobian[i][k] - expected) > tolerance)
+
+        quoteJacobian = curve.finiteDifferenceQuoteJacobian(vars.instruments)
+        for k in range(len(vars.instruments)):
+            for j in range(len(vars.instruments)):
+                product = sum(quoteJacobian[k][i] * jacobian[i][j]
+                              for i in range(1, nodes))
+                expected = 1.0 if j == k else 0.0
+                self.assertFalse(abs(product - expected) > 1.0e-8)
+
+        # bucketed risk by chain rule from node sensitivities
+        handle = RelinkableYieldTermStructureHandle(curve)
+        swap = MakeVanillaSwap(Period(10, Years), Euribor6M(handle), 0.05)
+        swap.withDiscountingTermStructure(handle)
+        swap = swap.makeVanillaSwap()
+
+        dates = curve.dates()
+        data = list(curve.data())
+        nodeRisk = [0.0] * nodes
+        for i in range(1, nodes):
+            bumped = list(data)
+            bumped[i] = data[i] + h
+            handle.linkTo(curve.interpolatedNodeCurve(dates, bumped))
+            up = swap.NPV()
+            bumped[i] = data[i] - h
+            handle.linkTo(curve.interpolatedNodeCurve(dates, bumped))
+            down = swap.NPV()
+            nodeRisk[i] = (up - down) / (2 * h)
+        handle.linkTo(curve)
+
+        for k in range(len(vars.rates)):
+            chainRule = sum(nodeRisk[i] * jacobian[i][k] for i in range(nodes))
+            base = vars.rates[k].value()
+            vars.rates[k].setValue(base + h)
+            up = swap.NPV()
+            vars.rates[k].setValue(base - h)
+            down = swap.NPV()
+            vars.rates[k].setValue(base)
+            self.assertFalse(abs(chainRule - (up - down) / (2 * h)) > tolerance)
+
+        IndexManager.instance().clearHistories()
@@ -1,3 +1,4 @@
+import pickle
 import unittest
 
 from QuantLib import *
@@ -150,3 +151,90 @@ class QuoteTest(unittest.TestCase):
         quote.value()
         priceQuote.setValue(0.11)
         self.assertFalse(not f.isUp())
+
+    def testBulkUpdate(self):
+        TEST_MESSAGE(
+            "Testing bulk updates of quotes...")
+
+        backup = SavedSettings()
+        today = knownGoodDefault
+        Settings.instance().evaluationDate = today
+
+        calendar = TARGET()
+        tenors = [Period(n, Months) for n in range(1, 13)]
+
+        def buildCurve(quotes):
+            helpers = RateHelperVector()
+            for q, tenor in zip(quotes, tenors):
+                helpers.append(
+                    DepositRateHelper(
+                        QuoteHandle(q), tenor, 2, calendar,
+                        ModifiedFollowing, false, Actual360()))
+            return PiecewiseLogLinearDiscount(
+                0, calendar, helpers, Actual360(), LogLinear())
+
+        serialQuotes = [SimpleQuote(0.01) for t in tenors]
+        bulkQuotes = [SimpleQuote(0.01) for t in tenors]
+        serialCurve = buildCurve(serialQuotes)
+        bulkCurve = buildCurve(bulkQuotes)
+
+        # both curves forward every notification they receive
+        serialCurve.alwaysForwardNotifications()
+        bulkCurve.alwaysForwardNotifications()
+
+        serialCounter = NotificationCounter()
+        serialCounter.registerWith(serialCurve)
+        bulkCounter = NotificationCounter()
+        bulkCounter.registerWith(bulkCurve)
+
+        d = today + Period(1, Years)
+        serialCurve.discount(d)
+        bulkCurve.discount(d)
+
+        values = [0.02 + 0.001 * i for i in range(len(tenors))]
+        values[3] = 0.01
+        for q, v in zip(serialQuotes, values):
+            q.setValue(v)
+        changed = setQuoteValues(bulkQuotes, values, [bulkCurve])
+
+        # one wave per quote for the serial curve, a single one in bulk
+        self.assertFalse(changed != len(tenors) - 1)
+        self.assertFalse(serialCounter.notifications() != changed)
+        self.assertFalse(bulkCounter.observables() != 1)
+        self.assertFalse(bulkCounter.notifiedObservables() != 1)
+        self.assertFalse(bulkCounter.notifications() != 1)
+        self.assertFalse(
+            abs(bulkCurve.discount(d) - serialCurve.discount(d)) > 1.0e-15)
+        for q, v in zip(bulkQuotes, values):
+            self.assertFalse(q.value() != v)
+
+        # values set in bulk are seen when the quotes are pickled
+        for q, v in zip(bulkQuotes, values):
+            self.assertFalse(pickle.loads(pickle.dumps(q)).value() != v)
+
+        # without held curves, each changed helper notifies the curve
+        bulkCounter.reset()
+        self.assertFalse(
+            setQuoteValues(bulkQuotes, [v + 0.001 for v in values]) !=
+            len(tenors))
+        self.assertFalse(bulkCounter.notifications() != len(tenors))
+
+        bulkCounter.reset()
+        values = [v + 0.001 for v in values]
+        self.assertFalse(setQuoteValues(bulkQuotes, values, [bulkCurve]) != 0)
+        self.assertFalse(bulkCounter.notifications() != 0)
+
+        bulkCurve.freeze()
+        setQuoteValues(bulkQuotes, [v + 0.001 for v in values], [bulkCurve])
+        self.assertFalse(bulkCounter.notifications() != 0)
+        bulkCurve.unfreeze()
+        self.assertFalse(bulkCounter.notifications() != 1)
+
+        f = Flag()
+        f.registerWith(bulkQuotes[0])
+        with DeferredNotifications():
+            bulkQuotes[0].setValue(0.05)
+            self.assertFalse(f.isUp())
+            self.assertFalse(ObservableSettings.instance().updatesEnabled())
+        self.assertFalse(not f.isUp())
+        self.assertFalse(not ObservableSettings.instance().updatesEnabled())
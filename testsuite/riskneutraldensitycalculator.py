@@ -1,5 +1,6 @@
 import unittest
 from math import exp, sqrt, log, pow
+from time import perf_counter
 
 import numpy as np
 from QuantLib import *
@@ -81,6 +82,28 @@ class ProbWeightedPayoff(object):
         return self.calc_.pdf(x, self.t_) * self.payoff_(exp(x))
 
 
+class SkewedLocalVolatility(object):
+    def __init__(self, s0):
+        self.s0 = s0
+        self.calls = 0
+
+    def __call__(self, t, strike):
+        self.calls += 1
+        m = log(strike / self.s0)
+        return 0.2 - 0.1 * m + 0.1 * m * m * exp(-t)
+
+
+class SkewedLocalVolatilitySlices(object):
+    def __init__(self, s0):
+        self.s0 = s0
+        self.calls = 0
+
+    def __call__(self, t, strikes):
+        self.calls += 1
+        m = np.log(np.asarray(strikes) / self.s0)
+        return 0.2 - 0.1 * m + 0.1 * m * m * np.exp(-t)
+
+
 class RiskNeutralDensityCalculatorTest(unittest.TestCase):
 
     def testDensityAgainstOptionPrices(self):
@@ -532,3 +555,70 @@ class RiskNeutralDensityCalculatorTest(unittest.TestCase):
             calculatedLocalVol = exp(localVolCalc.invcdf(quantile, maturity))
             localVolTol = 0.1
             self.assertFalse(abs(expected - calculatedLocalVol) > localVolTol)
+
+    def testBatchedLocalVolatility(self):
+        TEST_MESSAGE(
+            "Testing local volatility called back once per time slice...")
+
+        backup = SavedSettings()
+
+        dayCounter = Actual365Fixed()
+        todaysDate = Date(28, Dec, 2012)
+        Settings.instance().evaluationDate = todaysDate
+
+        s0 = 100.0
+        spot = SimpleQuote(s0)
+        rTS = flatRate(todaysDate, 0.015, dayCounter)
+        qTS = flatRate(todaysDate, 0.025, dayCounter)
+
+        pointwise = SkewedLocalVolatility(s0)
+        sliced = SkewedLocalVolatilitySlices(s0)
+        strikes = np.exp(np.linspace(log(1.0), log(10000.0), 8001))
+
+        pointwiseVol = CustomLocalVolatility(
+            pointwise, todaysDate, NullCalendar(), Following, dayCounter)
+        slicedVol = CustomLocalVolatilitySlices(
+            sliced, strikes, todaysDate, NullCalendar(), Following, dayCounter)
+
+        tol = 1.0e-5
+        for t in [0.1, 0.5, 1.0]:
+            for strike in [50.0, 95.0, 100.0, 123.4, 200.0]:
+                self.assertFalse(
+                    abs(slicedVol.localVol(t, strike) -
+                        pointwiseVol.localVol(t, strike)) > tol)
+        self.assertFalse(sliced.calls != 3)
+        # grid strikes are not interpolated
+        self.assertFalse(
+            abs(slicedVol.localVol(0.5, strikes[4000]) -
+                pointwiseVol.localVol(0.5, strikes[4000])) > 1.0e-12)
+        # beyond the grid the volatility is flat
+        self.assertFalse(
+            abs(slicedVol.localVol(0.5, 20000.0, True) -
+                slicedVol.localVol(0.5, strikes[-1], True)) > 1.0e-12)
+        self.assertRaises(
+            RuntimeError, CustomLocalVolatilitySlices,
+            sliced, strikes[::-1].copy(), todaysDate)
+
+        timeGrid = TimeGrid(1.0, 51)
+        pointwise.calls = sliced.calls = 0
+
+        start = perf_counter()
+        expected = LocalVolRNDCalculator(
+            spot, rTS, qTS, pointwiseVol, timeGrid, 201)
+        expectedCdf = expected.cdf(log(s0), 1.0)
+        pointwiseTime = perf_counter() - start
+
+        start = perf_counter()
+        calculated = LocalVolRNDCalculator(
+            spot, rTS, qTS, slicedVol, timeGrid, 201)
+        calculatedCdf = calculated.cdf(log(s0), 1.0)
+        slicedTime = perf_counter() - start
+
+        for x in [log(s0) - 0.3, log(s0), log(s0) + 0.3]:
+            self.assertFalse(abs(calculated.cdf(x, 1.0) - expected.cdf(x, 1.0)) > 1.0e-4)
+        self.assertFalse(abs(calculatedCdf - expectedCdf) > 1.0e-4)
+        self.assertFalse(sliced.calls * 10 > pointwise.calls)
+
+        TEST_MESSAGE(
+            "    %d pointwise calls in %.4fs, %d slice calls in %.4fs"
+            % (pointwise.calls, pointwiseTime, sliced.calls, slicedTime))
@@ -1,4 +1,5 @@
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 from QuantLib import *
 
@@ -28,3 +29,48 @@ class SettingsTest(unittest.TestCase):
         Settings.instance().evaluationDate = d2
 
         self.assertFalse(not flag.isUp())
+
+    def testSessions(self):
+        TEST_MESSAGE(
+            "Testing per-thread evaluation-date sessions...")
+
+        if not sessionsEnabled():
+            self.assertRaises(RuntimeError, Session().__enter__)
+            return
+
+        rollback = SavedSettings()
+
+        today = knownGoodDefault
+        Settings.instance().evaluationDate = today
+        IndexManager.instance().clearHistories()
+        euribor = Euribor6M()
+        fixingDate = euribor.fixingCalendar().adjust(today - 30)
+        euribor.addFixing(fixingDate, 0.01)
+
+        def revalue(n):
+            d = TARGET().advance(today, n, Days)
+            with Session(d, copyFixings=(n % 2 == 0)):
+                curve = FlatForward(0, TARGET(), 0.03, Actual365Fixed())
+                referenceDate = curve.referenceDate()
+                evaluationDate = Settings.instance().evaluationDate
+                hasFixing = euribor.hasHistoricalFixing(fixingDate)
+                Euribor6M().addFixing(d, 0.02)
+            return evaluationDate, referenceDate, hasFixing
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(revalue, range(1, 41)))
+
+        for n, (evaluationDate, referenceDate, hasFixing) in \
+                zip(range(1, 41), results):
+            expected = TARGET().advance(today, n, Days)
+            self.assertFalse(evaluationDate != expected)
+            self.assertFalse(referenceDate != expected)
+            self.assertFalse(hasFixing != (n % 2 == 0))
+
+        # the default session is left untouched
+        self.assertFalse(Settings.instance().evaluationDate != today)
+        self.assertFalse(not euribor.hasHistoricalFixing(fixingDate))
+        self.assertFalse(
+            len(IndexManager.instance().getHistory(euribor.name())) != 1)
+
+        IndexManager.instance().clearHistories()
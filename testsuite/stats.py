@@ -1,3 +1,4 @@
+import pickle
 import unittest
 
 from QuantLib import *
@@ -17,6 +18,7 @@ class StatisticsTest(unittest.TestCase):
             "Testing statistics...")
         self.check(IncrementalStatistics, "IncrementalStatistics")
         self.check(Statistics, "Statistics")
+        self.check(StreamingStatistics, "StreamingStatistics")
 
     def testSequenceStatistics(self):
         TEST_MESSAGE(
@@ -72,6 +74,58 @@ class StatisticsTest(unittest.TestCase):
 
         self.assertFalse(abs(stat2.variance() - 1E-2) > tol)
 
+    def testStreamingStatistics(self):
+        TEST_MESSAGE(
+            "Testing streaming statistics...")
+
+        mt = MersenneTwisterUniformRng(42)
+        normal_gen = InvCumulativeMersenneTwisterGaussianRng(mt)
+
+        samples = [normal_gen.next().value() for i in range(100000)]
+
+        full = StreamingStatistics()
+        full.addSequence(samples)
+        reference = RiskStatistics()
+        reference.addSequence(samples)
+
+        # accumulators filled separately, as in different processes
+        parts = [StreamingStatistics() for i in range(4)]
+        for i, x in enumerate(samples):
+            parts[i % 4].add(x)
+        merged = pickle.loads(pickle.dumps(parts[0]))
+        for part in parts[1:]:
+            merged.merge(pickle.loads(pickle.dumps(part)))
+
+        self.assertFalse(merged.samples() != len(samples))
+        self.assertFalse(merged.min() != reference.min())
+        self.assertFalse(merged.max() != reference.max())
+
+        tolerance = 1.0e-9
+        for s in [full, merged]:
+            self.assertFalse(abs(s.mean() - reference.mean()) > tolerance)
+            self.assertFalse(
+                abs(s.variance() - reference.variance()) > tolerance)
+            self.assertFalse(
+                abs(s.skewness() - reference.skewness()) > tolerance)
+            self.assertFalse(
+                abs(s.kurtosis() - reference.kurtosis()) > tolerance)
+
+        # the digest is bounded, its estimates are tight in the tails
+        self.assertFalse(merged.centroids() > 2 * merged.compression())
+        tolerance = 2.0e-2
+        for p in [0.01, 0.05, 0.5, 0.95, 0.99]:
+            expected = reference.percentile(p)
+            for s in [full, merged]:
+                self.assertFalse(abs(s.percentile(p) - expected) > tolerance)
+        for p in [0.95, 0.99]:
+            for s in [full, merged]:
+                self.assertFalse(
+                    abs(s.valueAtRisk(p) - reference.valueAtRisk(p)) >
+                    tolerance)
+                self.assertFalse(
+                    abs(s.expectedShortfall(p) -
+                        reference.expectedShortfall(p)) > tolerance)
+
     def check(self,
               S,
               name):
@@ -1,4 +1,5 @@
 import unittest
+from time import perf_counter
 
 from QuantLib import *
 
@@ -314,3 +315,40 @@ class TermStructureTest(unittest.TestCase):
             expected = rates[i]
 
             self.assertFalse(abs(actual - expected) > tolerance)
+
+    def testBatchEvaluation(self):
+        TEST_MESSAGE(
+            "Testing batch evaluation against scalar loop...")
+
+        vars = CommonVars()
+        ts = vars.termStructure
+        today = Settings.instance().evaluationDate
+        dc = Actual360()
+
+        n = 10000
+        dates = DateVector([today + 2 + i for i in range(n)])
+        times = Array([ts.timeFromReference(d) for d in dates])
+        ends = DateVector([d + Period(3, Months) for d in dates])
+
+        start = perf_counter()
+        expected = [ts.discount(t) for t in times]
+        expectedZero = [ts.zeroRate(d, dc, Continuous).rate() for d in dates]
+        expectedFwd = [
+            ts.forwardRate(d1, d2, dc, Simple).rate()
+            for d1, d2 in zip(dates, ends)]
+        scalarTime = perf_counter() - start
+
+        start = perf_counter()
+        calculated = ts.discounts(times)
+        calculatedZero = ts.zeroRates(dates, dc, Continuous)
+        calculatedFwd = ts.forwardRates(dates, ends, dc, Simple)
+        batchTime = perf_counter() - start
+
+        TEST_MESSAGE(
+            "%d points: scalar loop %.4fs, batch %.4fs" %
+            (n, scalarTime, batchTime))
+
+        for i in range(n):
+            self.assertFalse(calculated[i] != expected[i])
+            self.assertFalse(calculatedZero[i] != expectedZero[i])
+            self.assertFalse(calculatedFwd[i] != expectedFwd[i])
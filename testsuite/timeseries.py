@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 
 from QuantLib import *
@@ -66,3 +68,81 @@ class TimeSeriesTest(unittest.TestCase):
         self.assertFalse(prices[0] != 20)
 
         self.assertFalse(ts.lastDate() != Date(29, March, 2005))
+
+    def testColumnarTimeSeries(self):
+        TEST_MESSAGE(
+            "Testing columnar time series...")
+
+        calendar = TARGET()
+        start = Date(2, January, 2002)
+        dates = [d for d in calendar.businessDayList(
+            start, start + Period(20, Years))]
+        values = [0.01 + 1.0e-6 * i for i in range(len(dates))]
+        serials = [float(d.serialNumber()) for d in dates]
+
+        # unsorted input is sorted once, at construction
+        columnar = ColumnarTimeSeries(serials[::-1], values[::-1])
+        reference = RealTimeSeries(dates, values)
+
+        self.assertFalse(len(columnar) != len(dates))
+        self.assertFalse(columnar.firstDate() != dates[0])
+        self.assertFalse(columnar.lastDate() != dates[-1])
+        self.assertFalse(list(columnar.dates()) != list(reference.dates()))
+        for d in dates[::97]:
+            self.assertFalse(columnar[d] != reference[d])
+        self.assertFalse(columnar[Date(5, January, 2002)] is not None)
+
+        lookup = columnar.values(Array(serials))
+        self.assertFalse(list(lookup) != values)
+
+        converted = ColumnarTimeSeries(columnar.timeSeries())
+        self.assertFalse(list(converted.values()) != values)
+
+        self.assertRaises(
+            RuntimeError, ColumnarTimeSeries, [1.0e5, 1.0e5], [1.0, 2.0])
+
+    def testBulkHistories(self):
+        TEST_MESSAGE(
+            "Testing bulk loading of index histories...")
+
+        calendar = TARGET()
+        start = Date(2, January, 2002)
+        dates = calendar.businessDayList(start, start + Period(5, Years))
+        serials = [float(d.serialNumber()) for d in dates]
+
+        histories = {}
+        for i in range(50):
+            values = [0.01 * i + 1.0e-6 * j for j in range(len(dates))]
+            histories["INDEX%d" % i] = ColumnarTimeSeries(serials, values)
+
+        manager = IndexManager.instance()
+        manager.setHistories(
+            list(histories.keys()),
+            ColumnarTimeSeriesVector(list(histories.values())))
+        for name, history in histories.items():
+            stored = manager.getHistory(name)
+            self.assertFalse(len(stored) != len(history))
+            self.assertFalse(stored[dates[-1]] != history[dates[-1]])
+        manager.clearHistories()
+
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            saveHistories(path, histories)
+
+            read = readHistories(path)
+            self.assertFalse(sorted(read.keys()) != sorted(histories.keys()))
+            for name, history in histories.items():
+                self.assertFalse(
+                    list(read[name].values()) != list(history.values()))
+
+            names = loadHistories(path)
+            self.assertFalse(sorted(names) != sorted(histories.keys()))
+            for name, history in histories.items():
+                self.assertFalse(not manager.hasHistory(name))
+                for d in dates[::101]:
+                    self.assertFalse(
+                        manager.getHistory(name)[d] != history[d])
+        finally:
+            manager.clearHistories()
+            os.remove(path)